@@ -1,53 +1,95 @@
 """LinkedIn authentication handler with cookie persistence."""
 
-import json
 import logging
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from src.services.browser_manager import BrowserManager
+import orjson
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webdriver import WebDriver
+    from src.services.browser_manager import BrowserManager
 
 logger = logging.getLogger(__name__)
 
 COOKIES_FILE = Path("data/cookies.json")
 LINKEDIN_FEED_URL = "https://www.linkedin.com/feed/"
 FEED_SELECTOR = ".scaffold-finite-scroll"
+SESSION_COOKIE = "li_at"
+
+
+def _to_cdp_cookie(cookie: dict) -> dict:
+    """Convert a Selenium cookie dict to a CDP Network.CookieParam.
+
+    Args:
+        cookie: Cookie dictionary as returned by driver.get_cookies().
+
+    Returns:
+        Cookie parameters for Network.setCookies.
+    """
+    param = {
+        key: cookie[key]
+        for key in ("name", "value", "domain", "path", "secure", "httpOnly")
+        if key in cookie
+    }
+    if "expiry" in cookie:
+        param["expires"] = cookie["expiry"]
+    if cookie.get("sameSite"):
+        param["sameSite"] = cookie["sameSite"].capitalize()
+    return param
 
 
 class AuthHandler:
     """Handles LinkedIn authentication and session persistence."""
 
-    def __init__(self, headless: bool = False) -> None:
+    def __init__(
+        self, headless: bool = False, browser_manager: "BrowserManager | None" = None
+    ) -> None:
         """Initialize authentication handler.
 
         Args:
             headless: Run browser in headless mode.
+            browser_manager: Browser manager to use, e.g. BrowserManager.shared() to
+                share one browser across phases. If None, creates a new one.
         """
-        self.browser_manager = BrowserManager(headless=headless)
+        # Deferred so importing this module does not load the selenium driver chain
+        from src.services.browser_manager import BrowserManager
+
+        self.browser_manager: BrowserManager = browser_manager or BrowserManager(
+            headless=headless
+        )
         self.driver: WebDriver | None = None
 
     def _load_cookies(self) -> list[dict] | None:
         """Load cookies from file.
 
         Returns:
-            List of cookie dictionaries or None if file doesn't exist.
+            List of cookie dictionaries, or None if the file doesn't exist or its
+            session cookie is missing or expired.
         """
         if not COOKIES_FILE.exists():
             logger.info("No cookies file found")
             return None
 
         try:
-            with COOKIES_FILE.open(encoding="utf-8") as f:
-                cookies = json.load(f)
-            logger.info(f"Loaded {len(cookies)} cookies from file")
-            return cookies
-        except (OSError, json.JSONDecodeError) as e:
+            cookies = orjson.loads(COOKIES_FILE.read_bytes())
+        except (OSError, orjson.JSONDecodeError) as e:
             logger.warning(f"Failed to load cookies: {e}")
             return None
 
+        # Skip the feed round-trip and validation wait when the session is known dead
+        session = next((c for c in cookies if c.get("name") == SESSION_COOKIE), None)
+        if session is None:
+            logger.info("Saved cookies have no session cookie")
+            return None
+        if "expiry" in session and session["expiry"] <= time.time():
+            logger.info("Saved session cookie has expired")
+            return None
+
+        logger.info(f"Loaded {len(cookies)} cookies from file")
+        return cookies
+
     def _save_cookies(self) -> None:
         """Save cookies to file."""
         if not self.driver:
@@ -56,20 +98,34 @@ class AuthHandler:
         cookies = self.driver.get_cookies()
         COOKIES_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-        with COOKIES_FILE.open("w", encoding="utf-8") as f:
-            json.dump(cookies, f, indent=2)
+        COOKIES_FILE.write_bytes(orjson.dumps(cookies, option=orjson.OPT_INDENT_2))
 
         logger.info(f"Saved {len(cookies)} cookies to {COOKIES_FILE}")
 
     def _inject_cookies(self, cookies: list[dict]) -> None:
         """Inject cookies into browser session.
 
+        Uses a single CDP Network.setCookies command where available, falling back
+        to one WebDriver add_cookie call per cookie.
+
         Args:
             cookies: List of cookie dictionaries.
         """
         if not self.driver:
             raise RuntimeError("Browser not started")
 
+        from selenium.common.exceptions import WebDriverException
+
+        try:
+            self.driver.execute_cdp_cmd(
+                "Network.setCookies",
+                {"cookies": [_to_cdp_cookie(cookie) for cookie in cookies]},
+            )
+            logger.info(f"Injected {len(cookies)} cookies via CDP")
+            return
+        except (AttributeError, WebDriverException) as e:
+            logger.debug(f"CDP cookie injection unavailable, falling back: {e}")
+
         # Navigate to LinkedIn first to set domain
         self.browser_manager.navigate_to("https://www.linkedin.com")
 
@@ -86,14 +142,29 @@ class AuthHandler:
     def _is_logged_in(self) -> bool:
         """Check if user is logged in to LinkedIn.
 
+        Checks the session cookie and feed element without waiting first; only waits
+        for the feed to render when the session cookie is present but the page is
+        still loading.
+
         Returns:
             True if logged in, False otherwise.
         """
         if not self.driver:
             return False
 
+        from selenium.webdriver.common.by import By
+
         try:
-            self.browser_manager.wait_for_element(FEED_SELECTOR, timeout=5)
+            # li_at is HttpOnly, so it is invisible to document.cookie; ask WebDriver
+            if not self.driver.get_cookie(SESSION_COOKIE):
+                logger.info("Login validation failed: session cookie not set")
+                return False
+
+            if self.driver.find_elements(By.CSS_SELECTOR, FEED_SELECTOR):
+                logger.info("Login validated: feed element found")
+                return True
+
+            self.browser_manager.wait_for_element_observed(FEED_SELECTOR, timeout=5)
             logger.info("Login validated: feed element found")
             return True
         except Exception:
@@ -117,6 +188,8 @@ class AuthHandler:
             # Validate session
             if self._is_logged_in():
                 logger.info("Successfully authenticated using saved cookies")
+                # Persist refreshed cookies so the next run starts from the latest session
+                self._save_cookies()
                 return self.driver
 
             logger.warning("Saved cookies invalid, requesting new login")
@@ -140,6 +213,22 @@ class AuthHandler:
 
         return self.driver
 
+    def authenticate_with_cookies(self, cookies: list[dict]) -> "WebDriver":
+        """Start a browser that reuses an already authenticated session.
+
+        Skips validation and manual login; used to open extra browsers that share
+        the session of one authenticated via authenticate().
+
+        Args:
+            cookies: Cookies taken from an authenticated driver.
+
+        Returns:
+            WebDriver instance carrying the session cookies.
+        """
+        self.driver = self.browser_manager.start_browser()
+        self._inject_cookies([dict(cookie) for cookie in cookies])
+        return self.driver
+
     def close(self) -> None:
         """Close browser session."""
         self.browser_manager.close_browser()
@@ -1,37 +1,129 @@
 """Comment generator using LLM to create personalized comment suggestions."""
 
-import json
+import asyncio
+import functools
+import hashlib
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from src.services.llm_client import LLMClient
+import orjson
 
 if TYPE_CHECKING:
-    pass
+    from src.services.llm_client import LLMClient
 
 logger = logging.getLogger(__name__)
 
 PERSONA_FILE = Path("src/lib/persona.txt")
+OUTPUT_DIR = Path("data/posts_processed")
+DEFAULT_MAX_CONCURRENCY = 32
+MAX_WRITE_WORKERS = 32
+
+_MD_HEADER_TEMPLATE = """# Post Analysis & Comment Suggestions
+
+## Post Details
+
+- **Author**: {author}
+- **URL**: {post_url}
+- **Posted**: {timestamp}
+
+## Original Content
+
+{content_escaped}
+
+## Analysis
+
+**Summary**: {summary}
+
+**Categories**: {categories_str}
+
+## Suggested Comments
+
+"""
+
+_MD_OPTION_TEMPLATE = """### Option {index}
+
+{comment}
+
+"""
+
+_MD_FOOTER_TEMPLATE = """---
+
+*Generated on: {generated_at}*
+"""
+
+
+def _comments_failed(comments: list[str]) -> bool:
+    """Check whether any comment is an error marker rather than a suggestion.
+
+    Args:
+        comments: Generated comments for a post.
+
+    Returns:
+        True if any comment starts with "Error".
+    """
+    return any(comment.startswith("Error") for comment in comments)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_persona_cached() -> str:
+    """Load persona from file once per process.
+
+    Returns:
+        Persona text.
+
+    Raises:
+        FileNotFoundError: If persona file doesn't exist.
+        ValueError: If persona file is empty.
+    """
+    if not PERSONA_FILE.exists():
+        raise FileNotFoundError(f"Persona file not found: {PERSONA_FILE}")
+
+    # mmap cannot map a zero-length file
+    if PERSONA_FILE.stat().st_size == 0:
+        raise ValueError(f"Persona file is empty: {PERSONA_FILE}")
+
+    with PERSONA_FILE.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        persona = mm[:].decode("utf-8").strip()
+
+    if not persona:
+        raise ValueError(f"Persona file is empty: {PERSONA_FILE}")
+
+    logger.info("Loaded persona from %s", PERSONA_FILE)
+    return persona
 
 
 class CommentGenerator:
     """Generates personalized comment suggestions for posts."""
 
-    def __init__(self, max_workers: int | None = None) -> None:
+    def __init__(
+        self, max_workers: int | None = None, stream: bool = False, cache_enabled: bool = True
+    ) -> None:
         """Initialize comment generator.
 
         Args:
-            max_workers: Maximum number of concurrent workers. If None, uses default.
+            max_workers: Maximum number of concurrent LLM calls. If None, uses
+                DEFAULT_MAX_CONCURRENCY.
+            stream: Stream each response into its markdown file as options complete.
+                Streamed calls skip the response cache; a failed stream falls back to
+                the cached, retrying call.
+            cache_enabled: Reuse LLM responses from earlier runs. Disable to force
+                fresh LLM calls.
         """
-        self.llm_client = LLMClient()
+        # Deferred so importing this module does not load the Gemini SDK
+        from src.services.llm_client import NUM_COMMENTS, LLMClient
+
+        self.llm_client: LLMClient = LLMClient(cache_enabled=cache_enabled)
+        self.num_comments = NUM_COMMENTS
         self.persona = self._load_persona()
         self.max_workers = max_workers
+        self.stream = stream
 
     def _load_persona(self) -> str:
-        """Load persona from file.
+        """Load persona from file, reusing the copy cached by earlier instances.
 
         Returns:
             Persona text.
@@ -40,17 +132,7 @@ class CommentGenerator:
             FileNotFoundError: If persona file doesn't exist.
             ValueError: If persona file is empty.
         """
-        if not PERSONA_FILE.exists():
-            raise FileNotFoundError(f"Persona file not found: {PERSONA_FILE}")
-
-        with PERSONA_FILE.open(encoding="utf-8") as f:
-            persona = f.read().strip()
-
-        if not persona:
-            raise ValueError(f"Persona file is empty: {PERSONA_FILE}")
-
-        logger.info(f"Loaded persona from {PERSONA_FILE}")
-        return persona
+        return _load_persona_cached()
 
     def load_analyzed_posts(self, input_file: Path) -> dict:
         """Load analyzed posts from JSON file.
@@ -63,83 +145,112 @@ class CommentGenerator:
 
         Raises:
             FileNotFoundError: If file doesn't exist.
-            json.JSONDecodeError: If file is not valid JSON.
+            orjson.JSONDecodeError: If file is not valid JSON (a json.JSONDecodeError subclass).
         """
         if not input_file.exists():
             raise FileNotFoundError(f"Input file not found: {input_file}")
 
-        with input_file.open(encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(input_file.read_bytes())
 
         posts = data.get("posts", [])
-        logger.info(f"Loaded {len(posts)} analyzed posts from {input_file}")
+        logger.info("Loaded %d analyzed posts from %s", len(posts), input_file)
         return data
 
-    def generate_comment_markdown(self, post: dict, comments: list[str]) -> str:
-        """Generate markdown content for a post with comments.
+    def _categories_str(self, post: dict) -> str:
+        """Join a post's categories once and cache the result on the post.
+
+        The same string is used in the LLM prompt and the markdown output.
 
         Args:
-            post: Post dictionary with all data.
-            comments: List of comment suggestions.
+            post: Post dictionary with analysis.
 
         Returns:
-            Markdown content string.
+            Comma-separated categories, or "None" if there are none.
         """
-        author = post.get("author", "Unknown")
-        post_url = post.get("post_url", "")
-        timestamp = post.get("timestamp", "")
-        content = post.get("content", "")
-        analysis = post.get("analysis", {})
-        summary = analysis.get("summary", "")
-        categories = analysis.get("categories", [])
-        generated_at = datetime.now().isoformat()
-
-        categories_str = ", ".join(categories) if categories else "None"
-
-        # Escape markdown special characters in content
-        content_escaped = content.replace("```", "\\`\\`\\`")
-
-        markdown = f"""# Post Analysis & Comment Suggestions
-
-## Post Details
-
-- **Author**: {author}
-- **URL**: {post_url}
-- **Posted**: {timestamp}
-
-## Original Content
-
-{content_escaped}
-
-## Analysis
+        if "_categories_str" not in post:
+            categories = post.get("analysis", {}).get("categories", [])
+            post["_categories_str"] = ", ".join(categories) or "None"
+        return post["_categories_str"]
 
-**Summary**: {summary}
+    def _markdown_header(self, post: dict) -> str:
+        """Render the markdown sections that precede the suggested comments.
 
-**Categories**: {categories_str}
+        Args:
+            post: Post dictionary with all data.
 
-## Suggested Comments
+        Returns:
+            Markdown header string.
+        """
+        content = post.get("content", "")
+        analysis = post.get("analysis", {})
 
-### Option 1
+        # Escape markdown code fences in content (skip the copy when there are none)
+        if "```" in content:
+            content = content.replace("```", "\\`\\`\\`")
+
+        return _MD_HEADER_TEMPLATE.format_map(
+            {
+                "author": post.get("author", "Unknown"),
+                "post_url": post.get("post_url", ""),
+                "timestamp": post.get("timestamp", ""),
+                "content_escaped": content,
+                "summary": analysis.get("summary", ""),
+                "categories_str": self._categories_str(post),
+            }
+        )
 
-{comments[0] if len(comments) > 0 else "Error: No comment generated"}
+    def generate_comment_markdown(
+        self, post: dict, comments: list[str], generated_at: str
+    ) -> str:
+        """Generate markdown content for a post with comments.
 
-### Option 2
+        Args:
+            post: Post dictionary with all data.
+            comments: List of comment suggestions.
+            generated_at: ISO timestamp shown in the footer, shared by the whole run.
 
-{comments[1] if len(comments) > 1 else "Error: No comment generated"}
+        Returns:
+            Markdown content string.
+        """
+        missing = "Error: No comment generated"
+        parts = [self._markdown_header(post)]
+        for i in range(self.num_comments):
+            comment = comments[i] if i < len(comments) else missing
+            parts.append(_MD_OPTION_TEMPLATE.format(index=i + 1, comment=comment))
+        parts.append(_MD_FOOTER_TEMPLATE.format(generated_at=generated_at))
+        return "".join(parts)
 
-### Option 3
+    def generate_comments_for_post(self, post: dict) -> list[str]:
+        """Generate comment suggestions for a single post.
 
-{comments[2] if len(comments) > 2 else "Error: No comment generated"}
+        Args:
+            post: Post dictionary with content and analysis.
 
----
+        Returns:
+            List of comment suggestions (3 comments).
+        """
+        content = post.get("content", "")
+        analysis = post.get("analysis", {})
+        summary = analysis.get("summary", "")
 
-*Generated on: {generated_at}*
-"""
+        if not content:
+            logger.warning("Post %s has no content, skipping", post.get("post_id"))
+            return ["Error: No content", "Error: No content", "Error: No content"]
 
-        return markdown
+        try:
+            comments = self.llm_client.generate_comments(
+                post_content=content,
+                summary=summary,
+                categories=self._categories_str(post),
+                persona=self.persona,
+            )
+            return comments
+        except Exception as e:
+            logger.error("Error generating comments for post %s: %s", post.get("post_id"), e)
+            return [f"Error: {str(e)}", f"Error: {str(e)}", f"Error: {str(e)}"]
 
-    def generate_comments_for_post(self, post: dict) -> list[str]:
-        """Generate comment suggestions for a single post.
+    async def agenerate_comments_for_post(self, post: dict) -> list[str]:
+        """Async variant of generate_comments_for_post.
 
         Args:
             post: Post dictionary with content and analysis.
@@ -150,156 +261,425 @@ class CommentGenerator:
         content = post.get("content", "")
         analysis = post.get("analysis", {})
         summary = analysis.get("summary", "")
-        categories = analysis.get("categories", [])
 
         if not content:
-            logger.warning(f"Post {post.get('post_id')} has no content, skipping")
+            logger.warning("Post %s has no content, skipping", post.get("post_id"))
             return ["Error: No content", "Error: No content", "Error: No content"]
 
         try:
-            comments = self.llm_client.generate_comments(
+            return await self.llm_client.agenerate_comments(
                 post_content=content,
                 summary=summary,
-                categories=categories,
+                categories=self._categories_str(post),
                 persona=self.persona,
             )
-            return comments
         except Exception as e:
-            logger.error(f"Error generating comments for post {post.get('post_id')}: {e}")
+            logger.error("Error generating comments for post %s: %s", post.get("post_id"), e)
             return [f"Error: {str(e)}", f"Error: {str(e)}", f"Error: {str(e)}"]
 
-    def _process_single_post(self, post: dict) -> dict:
+    def _process_single_post(
+        self, post: dict, output_dir: Path | None = None, generated_at: str = ""
+    ) -> dict:
         """Process a single post and generate comments.
 
         Args:
             post: Post dictionary.
+            output_dir: If set, write the post's markdown file as soon as it is ready.
+            generated_at: ISO timestamp for the markdown footer.
 
         Returns:
             Post dictionary with generated comments.
         """
         post_id = post.get("post_id", "unknown")
-        logger.info(f"Generating comments for post: {post_id}")
+        logger.info("Generating comments for post: %s", post_id)
 
         try:
             comments = self.generate_comments_for_post(post)
             post["generated_comments"] = comments
-            logger.info(f"  Generated {len(comments)} comments")
+            logger.info("  Generated %d comments", len(comments))
         except Exception as e:
-            logger.error(f"Error processing post {post_id}: {e}")
+            logger.error("Error processing post %s: %s", post_id, e)
             post["generated_comments"] = [
                 f"Error: {str(e)}",
                 f"Error: {str(e)}",
                 f"Error: {str(e)}",
             ]
 
+        if output_dir:
+            self._write_comment_file(post, output_dir, generated_at)
+
         return post
 
-    def process_posts(self, analyzed_posts_data: dict, concurrent: bool = True) -> list[dict]:
+    async def _process_single_post_async(
+        self,
+        post: dict,
+        sem: asyncio.Semaphore,
+        output_dir: Path | None = None,
+        generated_at: str = "",
+    ) -> dict:
+        """Process a single post, bounded by a shared semaphore.
+
+        Args:
+            post: Post dictionary.
+            sem: Semaphore limiting in-flight LLM calls.
+            output_dir: If set, write the post's markdown file as soon as it is ready.
+            generated_at: ISO timestamp for the markdown footer.
+
+        Returns:
+            Post dictionary with generated comments.
+        """
+        post_id = post.get("post_id", "unknown")
+
+        if self.stream and output_dir and post.get("content"):
+            # Stream straight into the markdown file so templating overlaps decode
+            async with sem:
+                logger.info("Generating comments for post: %s", post_id)
+                comments = await self._stream_comments_to_file(
+                    post, self._comment_file_path(post, output_dir), generated_at
+                )
+            post["generated_comments"] = comments
+            logger.info("  Generated %d comments", len(comments))
+            return post
+
+        async with sem:
+            logger.info("Generating comments for post: %s", post_id)
+            comments = await self.agenerate_comments_for_post(post)
+
+        post["generated_comments"] = comments
+        logger.info("  Generated %d comments", len(comments))
+
+        if output_dir:
+            await asyncio.to_thread(self._write_comment_file, post, output_dir, generated_at)
+
+        return post
+
+    async def _stream_comments_to_file(
+        self, post: dict, output_file: Path, generated_at: str
+    ) -> list[str]:
+        """Stream comments for a post and append each option to its file as it completes.
+
+        The header is written before the first token arrives. If the stream fails or
+        ends early at any point, the partial file is discarded and the post is
+        regenerated with the retrying, cached non-streaming call.
+
+        Args:
+            post: Post dictionary with content and analysis.
+            output_file: Markdown file to write.
+            generated_at: ISO timestamp for the markdown footer.
+
+        Returns:
+            List of comment suggestions (3 comments).
+        """
+        post_id = post.get("post_id", "unknown")
+        comments: list[str] = []
+        # Stream into a side file so an interrupted run never leaves a *.md that
+        # the next run would mistake for a finished post
+        part_file = output_file.with_name(output_file.name + ".part")
+
+        try:
+            with part_file.open("w", encoding="utf-8") as f:
+                await asyncio.to_thread(f.write, self._markdown_header(post))
+
+                async for comment in self.llm_client.astream_comments(
+                    post_content=post.get("content", ""),
+                    summary=post.get("analysis", {}).get("summary", ""),
+                    categories=self._categories_str(post),
+                    persona=self.persona,
+                ):
+                    comments.append(comment)
+                    option = _MD_OPTION_TEMPLATE.format(index=len(comments), comment=comment)
+                    await asyncio.to_thread(f.write, option)
+                    if len(comments) == self.num_comments:
+                        break
+
+                if len(comments) < self.num_comments:
+                    raise ValueError(f"Stream ended after {len(comments)} comments")
+
+                footer = _MD_FOOTER_TEMPLATE.format(generated_at=generated_at)
+                await asyncio.to_thread(f.write, footer)
+        except Exception as e:
+            logger.warning(
+                "Streaming failed for post %s, retrying without streaming: %s", post_id, e
+            )
+            part_file.unlink(missing_ok=True)
+            comments = await self.agenerate_comments_for_post(post)
+            post["generated_comments"] = comments
+            await asyncio.to_thread(
+                self._write_comment_file, post, output_file.parent, generated_at
+            )
+            return comments
+
+        part_file.replace(output_file)
+        return comments
+
+    def _dedup_key(self, post: dict) -> bytes:
+        """Build a key identifying posts that would produce the same LLM prompt.
+
+        Args:
+            post: Post dictionary with content and analysis.
+
+        Returns:
+            16-byte digest of the post's content, summary and categories.
+        """
+        analysis = post.get("analysis", {})
+        raw = "\x1f".join(
+            [
+                post.get("content", ""),
+                analysis.get("summary", ""),
+                self._categories_str(post),
+            ]
+        )
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+    async def _process_posts_async(
+        self, posts: list[dict], output_dir: Path | None = None, generated_at: str = ""
+    ) -> list[dict]:
+        """Generate comments for all posts on a single event loop.
+
+        Posts with identical content, summary and categories (reposts, threads)
+        share one LLM call; the result is copied to every duplicate.
+
+        Args:
+            posts: List of post dictionaries.
+            output_dir: If set, write each post's markdown file as soon as it is ready.
+            generated_at: ISO timestamp for the markdown footers.
+
+        Returns:
+            List of post dictionaries with generated comments, in input order.
+        """
+        groups: dict[bytes, list[dict]] = {}
+        for post in posts:
+            groups.setdefault(self._dedup_key(post), []).append(post)
+
+        if len(groups) < len(posts):
+            logger.info("Skipping %d duplicate posts", len(posts) - len(groups))
+
+        sem = asyncio.Semaphore(self.max_workers or DEFAULT_MAX_CONCURRENCY)
+        tasks = [
+            self._process_single_post_async(group[0], sem, output_dir, generated_at)
+            for group in groups.values()
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        for group, result in zip(groups.values(), results, strict=True):
+            leader = group[0]
+            if isinstance(result, BaseException):
+                post_id = leader.get("post_id", "unknown")
+                logger.error("Error processing post %s: %s", post_id, result)
+                leader["generated_comments"] = [
+                    f"Error: {str(result)}",
+                    f"Error: {str(result)}",
+                    f"Error: {str(result)}",
+                ]
+                if output_dir:
+                    self._write_comment_file(leader, output_dir, generated_at)
+
+            for duplicate in group[1:]:
+                duplicate["generated_comments"] = list(leader["generated_comments"])
+                if output_dir:
+                    self._write_comment_file(duplicate, output_dir, generated_at)
+
+        # Post dicts are updated in place, so the input list is already in order
+        return posts
+
+    def process_posts(
+        self,
+        analyzed_posts_data: dict,
+        concurrent: bool = True,
+        output_dir: Path | None = None,
+    ) -> list[dict]:
         """Process all analyzed posts and generate comments.
 
         Args:
             analyzed_posts_data: Dictionary with analyzed posts.
-            concurrent: Whether to process posts concurrently.
+            concurrent: Whether to process posts concurrently. Concurrency is bounded by
+                max_workers (or DEFAULT_MAX_CONCURRENCY) in-flight LLM calls.
+            output_dir: If set, each post's markdown file is written as soon as its
+                comments arrive instead of waiting for the whole run, and posts that
+                already have a file there are skipped.
 
         Returns:
-            List of post dictionaries with generated comments.
+            List of post dictionaries with generated comments (skipped posts excluded).
         """
         posts = analyzed_posts_data.get("posts", [])
         processed_posts: list[dict] = []
 
-        logger.info(f"Generating comments for {len(posts)} posts (concurrent={concurrent})...")
+        if output_dir:
+            posts = self._pending_posts(posts, output_dir)
+
+        logger.info("Generating comments for %d posts (concurrent=%s)...", len(posts), concurrent)
+
+        # One clock read for the whole run; every file shares the same footer timestamp
+        generated_at = datetime.now().isoformat()
 
         if concurrent and len(posts) > 1:
             # Process posts concurrently
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_post = {
-                    executor.submit(self._process_single_post, post): post
-                    for post in posts
-                }
-
-                for i, future in enumerate(as_completed(future_to_post), 1):
-                    try:
-                        processed_post = future.result()
-                        processed_posts.append(processed_post)
-                        logger.info(f"Completed {i}/{len(posts)} posts")
-                    except Exception as e:
-                        original_post = future_to_post[future]
-                        post_id = original_post.get("post_id", "unknown")
-                        logger.error(f"Error processing post {post_id}: {e}")
-                        original_post["generated_comments"] = [
-                            f"Error: {str(e)}",
-                            f"Error: {str(e)}",
-                            f"Error: {str(e)}",
-                        ]
-                        processed_posts.append(original_post)
+            processed_posts = asyncio.run(
+                self._process_posts_async(posts, output_dir, generated_at)
+            )
         else:
             # Process posts sequentially
             for i, post in enumerate(posts, 1):
                 post_id = post.get("post_id", "unknown")
-                logger.info(f"Generating comments for post {i}/{len(posts)}: {post_id}")
-                processed_post = self._process_single_post(post)
+                logger.info("Generating comments for post %d/%d: %s", i, len(posts), post_id)
+                processed_post = self._process_single_post(post, output_dir, generated_at)
                 processed_posts.append(processed_post)
 
-        # Sort by original order
-        post_id_to_index = {post.get("post_id"): i for i, post in enumerate(posts)}
-        processed_posts.sort(
-            key=lambda p: post_id_to_index.get(p.get("post_id"), float("inf"))
-        )
-
+        # Both paths yield results in input order, so no re-sort is needed
         return processed_posts
 
-    def save_comment_files(self, processed_posts: list[dict]) -> list[Path]:
-        """Save comment markdown files for each post.
+    def _pending_posts(self, posts: list[dict], output_dir: Path) -> list[dict]:
+        """Drop posts whose comment markdown was already written to output_dir.
+
+        Reruns only pay for posts whose markdown was not written last time.
 
         Args:
-            processed_posts: List of processed post dictionaries.
+            posts: List of post dictionaries.
+            output_dir: Directory holding comment files (created if missing).
 
         Returns:
-            List of saved file paths.
+            Posts without an existing comment file, in input order.
         """
-        output_dir = Path("data/posts_processed")
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        saved_files = []
+        done = {
+            path.stem.removeprefix("post_comments_")
+            for path in output_dir.glob("post_comments_*.md")
+        }
+        pending = [p for p in posts if str(p.get("post_id", "unknown")) not in done]
+        if len(pending) < len(posts):
+            logger.info("Skipping %d posts with existing comments", len(posts) - len(pending))
+        return pending
 
-        for post in processed_posts:
-            post_id = post.get("post_id", "unknown")
-            comments = post.get("generated_comments", [])
+    def _comment_file_path(self, post: dict, output_dir: Path) -> Path:
+        """Return the markdown file path for a post.
 
-            markdown = self.generate_comment_markdown(post, comments)
+        Args:
+            post: Post dictionary.
+            output_dir: Directory holding comment files.
 
-            output_file = output_dir / f"post_comments_{post_id}.md"
-            with output_file.open("w", encoding="utf-8") as f:
-                f.write(markdown)
+        Returns:
+            Markdown file path.
+        """
+        return output_dir / f"post_comments_{post.get('post_id', 'unknown')}.md"
 
-            saved_files.append(output_file)
-            logger.info(f"Saved comment file: {output_file}")
+    def _write_comment_file(
+        self, post: dict, output_dir: Path, generated_at: str
+    ) -> Path | None:
+        """Write the comment markdown file for a single post.
 
-        return saved_files
+        The file is written to a ``.part`` side file and only renamed to ``.md`` when
+        every comment succeeded, so reruns retry failed or interrupted posts instead
+        of skipping them.
 
-    def run(self, input_file: Path) -> list[Path]:
-        """Run full comment generation pipeline.
+        Args:
+            post: Processed post dictionary.
+            output_dir: Directory to write into.
+            generated_at: ISO timestamp for the markdown footer.
+
+        Returns:
+            Path to the saved file, or None if the comments failed and the output was
+            left as a ``.part`` file.
+        """
+        comments = post.get("generated_comments", [])
+        markdown = self.generate_comment_markdown(post, comments, generated_at)
+
+        output_file = self._comment_file_path(post, output_dir)
+        part_file = output_file.with_name(output_file.name + ".part")
+        # Encode up front so each file is a single unbuffered write() call
+        part_file.write_bytes(markdown.encode("utf-8"))
+
+        if _comments_failed(comments):
+            logger.warning("Comments failed, left for retry: %s", part_file)
+            return None
+
+        part_file.replace(output_file)
+        logger.info("Saved comment file: %s", output_file)
+        return output_file
+
+    def save_comment_files(self, processed_posts: list[dict]) -> list[Path]:
+        """Save comment markdown files for each post.
 
         Args:
-            input_file: Path to input JSON file with analyzed posts.
+            processed_posts: List of processed post dictionaries.
 
         Returns:
-            List of saved markdown file paths.
+            List of saved file paths.
         """
-        # Load analyzed posts
-        analyzed_posts_data = self.load_analyzed_posts(input_file)
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        if not processed_posts:
+            return []
 
-        # Generate comments
-        processed_posts = self.process_posts(analyzed_posts_data, concurrent=True)
+        generated_at = datetime.now().isoformat()
 
-        # Save markdown files
-        saved_files = self.save_comment_files(processed_posts)
+        # Overlap per-file open/write syscalls across a small thread pool
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_WRITE_WORKERS, len(processed_posts))
+        ) as executor:
+            paths = executor.map(
+                lambda post: self._write_comment_file(post, OUTPUT_DIR, generated_at),
+                processed_posts,
+            )
+            return [path for path in paths if path is not None]
+
+    def process_posts_batch(
+        self, analyzed_posts_data: dict, output_dir: Path | None = None
+    ) -> list[dict]:
+        """Generate comments for all analyzed posts through the Gemini Batch API.
+
+        Args:
+            analyzed_posts_data: Dictionary with analyzed posts.
+            output_dir: If set, posts that already have a comment file there are skipped.
+
+        Returns:
+            List of post dictionaries with generated comments (skipped posts excluded).
+        """
+        posts = analyzed_posts_data.get("posts", [])
+        if output_dir:
+            posts = self._pending_posts(posts, output_dir)
+
+        # Keyed by position: post IDs can be missing or repeated
+        requests: dict[str, dict] = {}
+
+        for index, post in enumerate(posts):
+            content = post.get("content", "")
+            if not content:
+                logger.warning("Post %s has no content, skipping", post.get("post_id"))
+                post["generated_comments"] = [
+                    "Error: No content",
+                    "Error: No content",
+                    "Error: No content",
+                ]
+                continue
+
+            analysis = post.get("analysis", {})
+            requests[str(index)] = {
+                "post_content": content,
+                "summary": analysis.get("summary", ""),
+                "categories": self._categories_str(post),
+            }
+
+        logger.info("Submitting %d posts to the batch API...", len(requests))
+        results = (
+            self.llm_client.generate_comments_batch(requests, self.persona) if requests else {}
+        )
+
+        for index, post in enumerate(posts):
+            key = str(index)
+            if key in results:
+                post["generated_comments"] = results[key]
+
+        return posts
+
+    def _print_summary(self, processed_posts: list[dict], saved_files: list[Path]) -> None:
+        """Print a summary of a comment generation run.
 
-        # Print summary
+        Args:
+            processed_posts: List of processed post dictionaries.
+            saved_files: List of saved markdown file paths.
+        """
         successful = sum(
-            1
-            for p in processed_posts
-            if not any("Error" in c for c in p.get("generated_comments", []))
+            1 for p in processed_posts if not _comments_failed(p.get("generated_comments", []))
         )
         failed = len(processed_posts) - successful
 
@@ -313,6 +693,48 @@ class CommentGenerator:
         print(f"Files generated: {len(saved_files)}")
         print("=" * 60)
 
+    def run(self, input_file: Path) -> list[Path]:
+        """Run full comment generation pipeline.
+
+        Args:
+            input_file: Path to input JSON file with analyzed posts.
+
+        Returns:
+            List of saved markdown file paths.
+        """
+        # Load analyzed posts
+        analyzed_posts_data = self.load_analyzed_posts(input_file)
+
+        # Generate comments, writing each markdown file as soon as it is ready
+        processed_posts = self.process_posts(
+            analyzed_posts_data, concurrent=True, output_dir=OUTPUT_DIR
+        )
+        saved_files = [
+            self._comment_file_path(post, OUTPUT_DIR)
+            for post in processed_posts
+            if not _comments_failed(post.get("generated_comments", []))
+        ]
+
+        self._print_summary(processed_posts, saved_files)
+        return saved_files
+
+    def run_batch(self, input_file: Path) -> list[Path]:
+        """Run the comment generation pipeline through the Gemini Batch API.
+
+        Batch jobs are billed at a discount and are not subject to per-minute
+        rate limits, but may take minutes to hours to complete.
+
+        Args:
+            input_file: Path to input JSON file with analyzed posts.
+
+        Returns:
+            List of saved markdown file paths.
+        """
+        analyzed_posts_data = self.load_analyzed_posts(input_file)
+        processed_posts = self.process_posts_batch(analyzed_posts_data, output_dir=OUTPUT_DIR)
+        saved_files = self.save_comment_files(processed_posts)
+
+        self._print_summary(processed_posts, saved_files)
         return saved_files
 
 
@@ -332,8 +754,13 @@ if __name__ == "__main__":
         required=True,
         help="Input JSON file with analyzed posts",
     )
+    parser.add_argument("--batch", action="store_true", help="Use the Gemini Batch API")
+    parser.add_argument("--no-cache", action="store_true", help="Force fresh LLM calls")
     args = parser.parse_args()
 
-    generator = CommentGenerator()
-    generator.run(args.input_file)
+    generator = CommentGenerator(cache_enabled=not args.no_cache)
+    if args.batch:
+        generator.run_batch(args.input_file)
+    else:
+        generator.run(args.input_file)
 
@@ -1,19 +1,37 @@
 """LinkedIn feed collector for scraping posts."""
 
-import json
 import logging
+import queue
 import re
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+import orjson
+
+try:
+    # Optional linear-time (DFA) engine; install the "re2" extra to enable it
+    import re2 as _re_backend
+except ImportError:
+    _re_backend = re
+
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.wait import WebDriverWait
 from src.features.auth_handler import AuthHandler
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webelement import WebElement
+    from src.services.browser_manager import BrowserManager
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +48,9 @@ AUTHOR_URL_SELECTORS = [
     ".update-components-actor__link",
     ".feed-shared-actor__link",
 ]
+# Grouped forms match whichever fallback comes first in the DOM with a single lookup
+AUTHOR_NAME_COMBINED = ", ".join(AUTHOR_NAME_SELECTORS)
+AUTHOR_URL_COMBINED = ", ".join(AUTHOR_URL_SELECTORS)
 AUTHOR_DESCRIPTION_SELECTOR = ".update-components-actor__description"
 POST_CONTENT_SELECTOR = ".update-components-text"
 POST_LINK_SELECTOR = ".feed-shared-update-v2__description a"
@@ -41,19 +62,228 @@ SHARES_COUNT_SELECTOR = ".social-details-social-counts__social-actions-text"
 MEDIA_IMAGE_SELECTOR = ".update-components-image img"
 MEDIA_VIDEO_SELECTOR = ".feed-shared-video"
 MEDIA_DOCUMENT_SELECTOR = ".feed-shared-document"
+# Any rendered post body: text, or the media container of a text-less post
+POST_BODY_SELECTOR = ", ".join(
+    [
+        POST_CONTENT_SELECTOR,
+        ".update-components-image",
+        MEDIA_VIDEO_SELECTOR,
+        MEDIA_DOCUMENT_SELECTOR,
+    ]
+)
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
+# Precompiled patterns used for every post. Flags are written inline so the same
+# patterns compile under both re and re2.
+ACTIVITY_ID_RE = _re_backend.compile(r"activity:(\d+)")
+COUNT_RE = _re_backend.compile(r"([\d.]+)")
+# Multipliers for abbreviated counts like "1.2K" or "3M"
+COUNT_SUFFIX_MULTIPLIERS = {"K": 1_000, "k": 1_000, "M": 1_000_000, "m": 1_000_000}
+# Author metadata: "Verified • 1st", trailing "Verified", or a connection degree like "• 2nd"
+AUTHOR_JUNK_RE = _re_backend.compile(
+    r"(?i)\s*(?:Verified\s*•\s*\d+[stndrdth]+|Verified\s*$|•\s*\d+[stndrdth]+)\s*"
+)
+
+# Selectors handed to EXTRACT_POST_JS so every field is read in one browser round-trip
+EXTRACT_SELECTORS = {
+    "post_link": POST_LINK_SELECTOR,
+    "author_name": AUTHOR_NAME_SELECTORS,
+    "author_url": AUTHOR_URL_SELECTORS,
+    "author_description": AUTHOR_DESCRIPTION_SELECTOR,
+    "content": POST_CONTENT_SELECTOR,
+    "timestamp": TIMESTAMP_SELECTOR,
+    "reactions": REACTIONS_COUNT_SELECTOR,
+    "comments": COMMENTS_COUNT_SELECTOR,
+    "shares": SHARES_COUNT_SELECTOR,
+    "images": MEDIA_IMAGE_SELECTOR,
+    "videos": MEDIA_VIDEO_SELECTOR,
+    "documents": MEDIA_DOCUMENT_SELECTOR,
+}
+# Same without media selectors; EXTRACT_POST_JS then skips the media queries
+EXTRACT_SELECTORS_NO_MEDIA = {
+    key: value
+    for key, value in EXTRACT_SELECTORS.items()
+    if key not in ("images", "videos", "documents")
+}
+# Reads the raw strings for one post element using EXTRACT_SELECTORS; all parsing
+# and cleanup stays in Python
+_EXTRACT_POST_FN = """
+function extractMedia(el, sel) {
+return {
+    images: !sel.images ? [] : Array.from(el.querySelectorAll(sel.images)).map(
+        (i) => ({src: i.src || "", alt: i.getAttribute("alt") || ""})
+    ),
+    videos: !sel.videos ? [] : Array.from(el.querySelectorAll(sel.videos)).map(
+        (v) => ({src: v.src || v.getAttribute("src") || "", poster: v.getAttribute("poster") || ""})
+    ),
+    documents: !sel.documents ? [] : Array.from(el.querySelectorAll(sel.documents)).map(
+        (d) => ({title: d.getAttribute("title") || d.innerText, link: d.getAttribute("href") || ""})
+    ),
+};
+}
+function extractPost(el, sel) {
+const text = (s) => {
+    const n = el.querySelector(s);
+    return n ? n.innerText.trim() : "";
+};
+const href = (s) => {
+    const n = el.querySelector(s);
+    return n ? n.href || n.getAttribute("href") || "" : "";
+};
+const first = (list, read) => {
+    for (const s of list) {
+        const value = read(s);
+        if (value) return value;
+    }
+    return "";
+};
+const time = el.querySelector("time");
+return {
+    data_urn: el.getAttribute("data-urn") || "",
+    element_id: el.id || "",
+    post_link: href(sel.post_link),
+    author_raw: first(sel.author_name, text),
+    author_url: first(sel.author_url, href),
+    author_description: text(sel.author_description),
+    content: text(sel.content),
+    timestamp_text: text(sel.timestamp),
+    time_datetime: time ? time.getAttribute("datetime") || "" : "",
+    time_text: time ? time.innerText.trim() : "",
+    likes_text: text(sel.reactions),
+    comments_text: text(sel.comments),
+    shares_text: text(sel.shares),
+    ...extractMedia(el, sel),
+};
+}
+"""
+# arguments: post element, POST_LINK_SELECTOR; returns [data-urn, permalink, element id]
+POST_ID_SOURCES_JS = """
+const el = arguments[0];
+const link = el.querySelector(arguments[1]);
+return [el.getAttribute("data-urn") || "", link ? link.href : "", el.id || ""];
+"""
+# arguments: post element, EXTRACT_SELECTORS
+EXTRACT_MEDIA_JS = _EXTRACT_POST_FN + "return extractMedia(arguments[0], arguments[1]);"
+# arguments: post element, EXTRACT_SELECTORS
+EXTRACT_POST_JS = _EXTRACT_POST_FN + "return extractPost(arguments[0], arguments[1]);"
+# arguments: POST_CONTAINER_SELECTOR, EXTRACT_SELECTORS, data-urns already extracted;
+# returns {total: number of containers, posts: raw dicts for the not-yet-seen ones}
+EXTRACT_ALL_POSTS_JS = (
+    _EXTRACT_POST_FN
+    + """
+const sel = arguments[1];
+const known = new Set(arguments[2]);
+const containers = Array.from(document.querySelectorAll(arguments[0]));
+return {
+    total: containers.length,
+    posts: containers
+        .filter((el) => !known.has(el.getAttribute("data-urn")))
+        .map((el) => extractPost(el, sel)),
+};
+"""
+)
+
+# Candidate selectors reported by debug_post_structure, in priority order per field
+DEBUG_SELECTORS = {
+    "author": [
+        ".update-components-actor__name",
+        ".feed-shared-actor__name",
+        "[data-control-name='actor']",
+        "span[aria-label*='author']",
+    ],
+    "content": [
+        ".feed-shared-text__text-view",
+        ".feed-shared-text-view",
+        ".update-components-text",
+        "[data-control-name='text']",
+    ],
+    "timestamp": [
+        "time",
+        ".feed-shared-actor__sub-description",
+        ".update-components-actor__sub-description",
+        "[data-control-name='timestamp']",
+    ],
+    "reactions": [
+        ".social-details-social-counts__reactions-count",
+        "[data-control-name='reactions_count']",
+    ],
+    "comments": [
+        ".social-details-social-counts__comments",
+        "[data-control-name='comments_count']",
+    ],
+}
+# Reads everything debug_post_structure reports for one post in a single round-trip.
+# arguments: post element, DEBUG_SELECTORS; each nested key records the first selector
+# that matches.
+DEBUG_POST_JS = """
+var el = arguments[0];
+var map = arguments[1];
+var attributes = {};
+["id", "class", "data-urn", "data-activity-id", "data-actor-id"].forEach(function (name) {
+    var value = el.getAttribute(name);
+    if (value) attributes[name] = value;
+});
+var dataAttrs = {};
+for (var i = 0; i < el.attributes.length; i++) {
+    var attr = el.attributes[i];
+    if (attr.name.startsWith('data-')) dataAttrs[attr.name] = attr.value;
+}
+var nested = {};
+for (var key in map) {
+    for (var j = 0; j < map[key].length; j++) {
+        var q = el.querySelector(map[key][j]);
+        if (q) {
+            nested[key] = {
+                selector: map[key][j],
+                text: q.innerText,
+                html: q.outerHTML.slice(0, 200),
+            };
+            break;
+        }
+    }
+}
+return {
+    attributes: attributes,
+    data_attributes: dataAttrs,
+    all_text: el.innerText.slice(0, 1000),
+    links: Array.from(el.querySelectorAll('a'))
+        .filter(function (a) { return a.href; })
+        .slice(0, 10)
+        .map(function (a) { return {href: a.href, text: a.innerText}; }),
+    images: Array.from(el.querySelectorAll('img'))
+        .filter(function (img) { return img.src; })
+        .slice(0, 10)
+        .map(function (img) { return {src: img.src, alt: img.getAttribute('alt')}; }),
+    nested_elements: nested,
+    html_snippet: el.outerHTML.slice(0, 2000),
+    json_snippets: Array.from(el.querySelectorAll('script'))
+        .map(function (s) { return s.innerHTML; })
+        .filter(function (c) { return c && (c.includes('{') || c.includes('[')); })
+        .map(function (c) { return c.slice(0, 500); }),
+};
+"""
 
 
 class FeedCollector:
     """Collects posts from LinkedIn feed."""
 
-    def __init__(self, headless: bool = False) -> None:
+    def __init__(
+        self,
+        headless: bool = False,
+        include_media: bool = True,
+        browser_manager: "BrowserManager | None" = None,
+    ) -> None:
         """Initialize feed collector.
 
         Args:
             headless: Run browser in headless mode.
+            include_media: Extract images, videos and documents. When False, posts
+                are returned with empty media lists and the media lookups are skipped.
+            browser_manager: Browser manager to use. If None, creates a new one.
         """
-        self.auth_handler = AuthHandler(headless=headless)
+        self.auth_handler = AuthHandler(headless=headless, browser_manager=browser_manager)
         self.driver: WebDriver | None = None
+        self.include_media = include_media
+        self._extract_selectors = EXTRACT_SELECTORS if include_media else EXTRACT_SELECTORS_NO_MEDIA
 
     def _extract_post_id(self, post_element: "WebElement") -> str | None:
         """Extract post ID from post element.
@@ -65,37 +295,40 @@ class FeedCollector:
             Post ID or None if not found.
         """
         try:
-            # Try to get data-urn attribute
-            data_urn = post_element.get_attribute("data-urn")
-            if data_urn:
-                # Extract numeric ID from URN like "urn:li:activity:7128374650293760000"
-                match = re.search(r"activity:(\d+)", data_urn)
-                if match:
-                    return match.group(1)
-
-            # Try to extract from permalink
-            try:
-                link_elem = post_element.find_element(By.CSS_SELECTOR, POST_LINK_SELECTOR)
-                href = link_elem.get_attribute("href")
-                if href:
-                    match = re.search(r"activity:(\d+)", href)
-                    if match:
-                        return match.group(1)
-            except Exception:
-                pass
-
-            # Fallback: use element ID or hash
-            element_id = post_element.get_attribute("id")
-            if element_id:
-                return element_id
-
-            return None
+            # data-urn, permalink and element id in one round-trip
+            data_urn, post_link, element_id = self.driver.execute_script(
+                POST_ID_SOURCES_JS, post_element, POST_LINK_SELECTOR
+            )
+        except StaleElementReferenceException:
+            raise
         except Exception as e:
             logger.warning(f"Failed to extract post ID: {e}")
             return None
 
+        return self._parse_post_id(data_urn, post_link, element_id)
+
+    def _parse_post_id(self, data_urn: str, post_link: str, element_id: str) -> str | None:
+        """Derive a post ID from the values that can identify a post.
+
+        Args:
+            data_urn: The post's data-urn attribute, e.g. "urn:li:activity:7128374650293760000".
+            post_link: The post's permalink.
+            element_id: The post container's element ID, used as a last resort.
+
+        Returns:
+            Post ID or None if none of the values identify the post.
+        """
+        for source in (data_urn, post_link):
+            match = ACTIVITY_ID_RE.search(source or "")
+            if match:
+                return match.group(1)
+        return element_id or None
+
     def _extract_text_safe(self, element: "WebElement", selector: str) -> str:
-        """Safely extract text from element with retry logic.
+        """Safely extract text from element.
+
+        Stale elements are not retried here; the whole post is re-resolved by
+        _extract_post_data instead.
 
         Args:
             element: Parent element.
@@ -103,20 +336,17 @@ class FeedCollector:
 
         Returns:
             Extracted text or empty string.
+
+        Raises:
+            StaleElementReferenceException: If the post element was detached.
         """
-        for attempt in range(3):
-            try:
-                sub_elem = element.find_element(By.CSS_SELECTOR, selector)
-                return sub_elem.text.strip()
-            except StaleElementReferenceException:
-                if attempt < 2:
-                    continue
-                logger.warning(f"Stale element for {selector} after 3 attempts")
-                return ""
-            except Exception as e:
-                logger.debug(f"Element not found {selector}: {e}")
-                return ""
-        return ""
+        try:
+            return element.find_element(By.CSS_SELECTOR, selector).text.strip()
+        except StaleElementReferenceException:
+            raise
+        except Exception as e:
+            logger.debug(f"Element not found {selector}: {e}")
+            return ""
 
     def _extract_text_with_fallbacks(
         self, element: "WebElement", selectors: list[str]
@@ -148,19 +378,32 @@ class FeedCollector:
         """
         try:
             count_elem = element.find_element(By.CSS_SELECTOR, selector)
-            text = count_elem.text.strip()
-
-            # Extract numbers from text like "42 reactions" or "1.2K"
-            match = re.search(r"([\d.]+)", text.replace(",", ""))
-            if match:
-                value = float(match.group(1))
-                # Handle K suffix (thousands)
-                if "K" in text.upper():
-                    return int(value * 1000)
-                return int(value)
+            return self._parse_count(count_elem.text.strip())
         except Exception:
-            pass
-        return 0
+            return 0
+
+    def _parse_count(self, text: str) -> int:
+        """Parse a displayed engagement count.
+
+        Args:
+            text: Count text like "42 reactions", "1,234", "1.2K" or "3M".
+
+        Returns:
+            Count as integer, 0 if no number is present.
+        """
+        text = text.replace(",", "")
+        match = COUNT_RE.search(text)
+        if not match:
+            return 0
+
+        try:
+            value = float(match.group(1))
+        except ValueError:
+            return 0
+
+        # Handle K/M suffix directly after the number, without upper-casing a copy
+        suffix = text[match.end() : match.end() + 1]
+        return int(value * COUNT_SUFFIX_MULTIPLIERS.get(suffix, 1))
 
     def _extract_url(self, element: "WebElement", selector: str) -> str:
         """Extract URL from element.
@@ -212,13 +455,8 @@ class FeedCollector:
         lines = author_text.split("\n")
         name = lines[0].strip()
 
-        # Remove common metadata patterns
-        # Remove "Verified • Xst/nd/rd/th" patterns
-        name = re.sub(r"\s*Verified\s*•\s*\d+[stndrdth]+\s*", "", name, flags=re.IGNORECASE)
-        # Remove standalone "Verified" at the end
-        name = re.sub(r"\s*Verified\s*$", "", name, flags=re.IGNORECASE)
-        # Remove connection degree patterns like "• 1st", "• 2nd", etc.
-        name = re.sub(r"\s*•\s*\d+[stndrdth]+\s*", "", name, flags=re.IGNORECASE)
+        # Remove common metadata patterns in a single pass
+        name = AUTHOR_JUNK_RE.sub("", name)
         # Remove extra whitespace
         name = " ".join(name.split())
 
@@ -233,6 +471,16 @@ class FeedCollector:
         Returns:
             Dictionary with media information.
         """
+        if self.driver:
+            # One script for all media instead of two get_attribute calls per item
+            try:
+                raw = self.driver.execute_script(EXTRACT_MEDIA_JS, post_element, EXTRACT_SELECTORS)
+                return self._parse_raw_media(raw)
+            except StaleElementReferenceException:
+                raise
+            except WebDriverException as e:
+                logger.debug(f"Script media extraction failed, using WebDriver lookups: {e}")
+
         media_info = {
             "has_media": False,
             "images": [],
@@ -295,14 +543,195 @@ class FeedCollector:
 
         return media_info
 
-    def _extract_post_data(self, post_element: "WebElement") -> dict | None:
+    def _parse_raw_post(self, raw: dict) -> dict | None:
+        """Build a post dictionary from the raw strings returned by EXTRACT_POST_JS.
+
+        Args:
+            raw: Raw field values read in the browser.
+
+        Returns:
+            Post data dictionary or None if the post has no usable ID.
+        """
+        post_id = self._parse_post_id(
+            raw.get("data_urn", ""), raw.get("post_link", ""), raw.get("element_id", "")
+        )
+        if not post_id:
+            logger.warning("Could not extract post ID, skipping post")
+            return None
+
+        post_url = (
+            raw.get("post_link")
+            or f"https://www.linkedin.com/feed/update/urn:li:activity:{post_id}/"
+        )
+
+        if raw.get("timestamp_text"):
+            timestamp = raw.get("time_datetime") or raw["timestamp_text"]
+        else:
+            timestamp = raw.get("time_datetime") or raw.get("time_text", "")
+
+        media_info = self._parse_raw_media(raw)
+
+        return {
+            "post_id": post_id,
+            "author": self._clean_author_name(raw.get("author_raw", "")),
+            "author_url": raw.get("author_url", ""),
+            "author_description": raw.get("author_description", ""),
+            "content": raw.get("content", ""),
+            "post_url": post_url,
+            "timestamp": timestamp,
+            "likes": self._parse_count(raw.get("likes_text", "")),
+            "comments": self._parse_count(raw.get("comments_text", "")),
+            "shares": self._parse_count(raw.get("shares_text", "")),
+            **media_info,
+        }
+
+    def _parse_raw_media(self, raw: dict) -> dict:
+        """Filter the raw media lists read in the browser.
+
+        Args:
+            raw: Raw values with "images", "videos" and "documents" lists.
+
+        Returns:
+            Dictionary with media information.
+        """
+        images = [
+            img
+            for img in raw.get("images", [])
+            if img["src"] and "profile-displayphoto" not in img["src"]
+        ]
+        videos = [v for v in raw.get("videos", []) if v["src"] or v["poster"]]
+        documents = [d for d in raw.get("documents", []) if d["title"] or d["link"]]
+
+        return {
+            "has_media": bool(images or videos or documents),
+            "images": images,
+            "videos": videos,
+            "documents": documents,
+        }
+
+    def _extract_post_data(
+        self, post_element: "WebElement", data_urn: str | None = None
+    ) -> dict | None:
         """Extract data from a single post element.
 
+        Reads every field with one execute_script call, falling back to per-field
+        WebDriver lookups if the script cannot run. If the element goes stale and
+        its URN is known, the post is looked up again once and re-extracted.
+
+        Args:
+            post_element: Post container element.
+            data_urn: The post's data-urn, used to re-find it if it goes stale.
+
+        Returns:
+            Post data dictionary or None if extraction fails.
+        """
+        for attempt in range(2):
+            try:
+                return self._extract_post_data_once(post_element)
+            except StaleElementReferenceException:
+                if attempt or not data_urn or not self.driver:
+                    logger.warning("Stale element during post extraction")
+                    return None
+                try:
+                    post_element = self.driver.find_element(
+                        By.CSS_SELECTOR, f'[data-urn="{data_urn}"]'
+                    )
+                except WebDriverException:
+                    logger.warning(f"Post {data_urn} disappeared during extraction")
+                    return None
+        return None
+
+    def _extract_post_data_once(self, post_element: "WebElement") -> dict | None:
+        """Extract data from a single post element without stale-element recovery.
+
+        Args:
+            post_element: Post container element.
+
+        Returns:
+            Post data dictionary or None if extraction fails.
+
+        Raises:
+            StaleElementReferenceException: If the post element was detached.
+        """
+        if not self.driver:
+            return self._extract_post_data_selenium(post_element)
+
+        try:
+            raw = self.driver.execute_script(
+                EXTRACT_POST_JS, post_element, self._extract_selectors
+            )
+        except StaleElementReferenceException:
+            raise
+        except WebDriverException as e:
+            logger.debug(f"Script extraction failed, using WebDriver lookups: {e}")
+            return self._extract_post_data_selenium(post_element)
+
+        try:
+            return self._parse_raw_post(raw)
+        except Exception as e:
+            logger.error(f"Error extracting post data: {e}")
+            return None
+
+    def _extract_all_posts_data(
+        self, seen_urns: set[str] | None = None
+    ) -> tuple[list[dict], int]:
+        """Extract every new post currently in the feed with one execute_script call.
+
+        Retries the script once, then falls back to per-element extraction.
+
+        Args:
+            seen_urns: data-urn values already extracted. Matching posts are skipped
+                in the browser, and the URNs of newly extracted posts are added.
+
+        Returns:
+            Tuple of (post data dictionaries in feed order, number of post containers
+            on the page).
+        """
+        if not self.driver:
+            return [], 0
+
+        for attempt in range(2):
+            try:
+                result = self.driver.execute_script(
+                    EXTRACT_ALL_POSTS_JS,
+                    POST_CONTAINER_SELECTOR,
+                    self._extract_selectors,
+                    list(seen_urns or ()),
+                )
+                break
+            except WebDriverException as e:
+                logger.debug(f"Bulk extraction failed (attempt {attempt + 1}/2): {e}")
+        else:
+            post_elements = self.driver.find_elements(By.CSS_SELECTOR, POST_CONTAINER_SELECTOR)
+            posts = [self._extract_post_data(elem) for elem in post_elements]
+            return [post for post in posts if post], len(post_elements)
+
+        raw_posts = result["posts"]
+        if seen_urns is not None:
+            seen_urns.update(raw["data_urn"] for raw in raw_posts if raw["data_urn"])
+
+        posts = []
+        for raw in raw_posts:
+            try:
+                post_data = self._parse_raw_post(raw)
+            except Exception as e:
+                logger.error(f"Error extracting post data: {e}")
+                continue
+            if post_data:
+                posts.append(post_data)
+        return posts, result["total"]
+
+    def _extract_post_data_selenium(self, post_element: "WebElement") -> dict | None:
+        """Extract data from a single post element with one WebDriver call per field.
+
         Args:
             post_element: Post container element.
 
         Returns:
             Post data dictionary or None if extraction fails.
+
+        Raises:
+            StaleElementReferenceException: If the post element was detached.
         """
         try:
             post_id = self._extract_post_id(post_element)
@@ -311,10 +740,15 @@ class FeedCollector:
                 return None
 
             # Extract author information
-            author_raw = self._extract_text_with_fallbacks(post_element, AUTHOR_NAME_SELECTORS)
+            # One grouped lookup; walk the fallbacks only if the first match is empty
+            author_raw = self._extract_text_safe(
+                post_element, AUTHOR_NAME_COMBINED
+            ) or self._extract_text_with_fallbacks(post_element, AUTHOR_NAME_SELECTORS)
             # Clean up author name - remove extra metadata like "Verified • 1st"
             author = self._clean_author_name(author_raw)
-            author_url = self._extract_url_with_fallbacks(post_element, AUTHOR_URL_SELECTORS)
+            author_url = self._extract_url(
+                post_element, AUTHOR_URL_COMBINED
+            ) or self._extract_url_with_fallbacks(post_element, AUTHOR_URL_SELECTORS)
             author_description = self._extract_text_safe(
                 post_element, AUTHOR_DESCRIPTION_SELECTOR
             )
@@ -352,7 +786,10 @@ class FeedCollector:
             shares = self._extract_count(post_element, SHARES_COUNT_SELECTOR)
 
             # Extract media information
-            media_info = self._extract_media(post_element)
+            if self.include_media:
+                media_info = self._extract_media(post_element)
+            else:
+                media_info = {"has_media": False, "images": [], "videos": [], "documents": []}
 
             return {
                 "post_id": post_id,
@@ -371,8 +808,7 @@ class FeedCollector:
                 "documents": media_info["documents"],
             }
         except StaleElementReferenceException:
-            logger.warning("Stale element during post extraction")
-            return None
+            raise
         except Exception as e:
             logger.error(f"Error extracting post data: {e}")
             return None
@@ -398,20 +834,36 @@ class FeedCollector:
         if not self.driver:
             return False
 
-        import time
+        try:
+            # Polls every 0.5s but returns as soon as the count grows
+            WebDriverWait(self.driver, timeout).until(
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, POST_CONTAINER_SELECTOR))
+                > current_count
+            )
+        except TimeoutException:
+            return False
 
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            try:
-                posts = self.driver.find_elements(By.CSS_SELECTOR, POST_CONTAINER_SELECTOR)
-                if len(posts) > current_count:
-                    logger.debug(f"New posts loaded: {len(posts)} total")
-                    return True
-            except Exception:
-                pass
-            time.sleep(0.5)
+        logger.debug("New posts loaded")
+        return True
+
+    def _wait_for_post_content(self, timeout: int = 10) -> None:
+        """Wait until a post body has rendered, instead of sleeping a fixed time.
+
+        Returns as soon as post text or a media/document container appears, so
+        image- and video-only posts do not wait out the timeout.
+
+        Args:
+            timeout: Maximum wait time in seconds.
+        """
+        if not self.driver:
+            return
 
-        return False
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, POST_BODY_SELECTOR))
+            )
+        except TimeoutException:
+            logger.debug("Post body did not appear before timeout")
 
     def download_post_from_url(self, post_url: str) -> dict | None:
         """Download a single post from a LinkedIn URL.
@@ -435,14 +887,14 @@ class FeedCollector:
 
         # Wait for post to load
         try:
-            self.auth_handler.browser_manager.wait_for_element(POST_CONTAINER_SELECTOR, timeout=10)
+            self.auth_handler.browser_manager.wait_for_element_observed(
+                POST_CONTAINER_SELECTOR, timeout=10
+            )
         except TimeoutException:
             logger.error("Post did not load. Check if URL is valid and you're logged in.")
             return None
 
-        import time
-
-        time.sleep(2)  # Wait for content to fully load
+        self._wait_for_post_content()
 
         # Find post element
         try:
@@ -451,7 +903,10 @@ class FeedCollector:
                 logger.error("No post found on page")
                 return None
 
-            post_data = self._extract_post_data(post_elements[0])
+            # Post URLs carry the activity URN, which lets a stale element be re-found
+            match = ACTIVITY_ID_RE.search(post_url)
+            data_urn = f"urn:li:activity:{match.group(1)}" if match else None
+            post_data = self._extract_post_data(post_elements[0], data_urn)
             if post_data:
                 logger.info(f"Successfully downloaded post: {post_data.get('post_id')}")
             return post_data
@@ -459,14 +914,79 @@ class FeedCollector:
             logger.error(f"Error extracting post data: {e}")
             return None
 
-    def collect_posts(self, num_posts: int = 10) -> list[dict]:
-        """Collect posts from LinkedIn feed.
+    def download_posts_from_urls(
+        self, post_urls: list[str], max_concurrency: int = DEFAULT_DOWNLOAD_CONCURRENCY
+    ) -> list[dict]:
+        """Download several posts in parallel, one browser per worker.
+
+        A WebDriver is not thread-safe, so each worker gets its own browser. Extra
+        browsers reuse this collector's session cookies instead of logging in again.
 
         Args:
-            num_posts: Number of posts to collect.
+            post_urls: LinkedIn post URLs.
+            max_concurrency: Maximum number of browsers open at once.
 
         Returns:
-            List of post dictionaries.
+            Post data dictionaries in input order; URLs that failed are omitted.
+        """
+        if not post_urls:
+            return []
+
+        # Only authenticate if driver is not already set (reused from another handler)
+        if not self.driver:
+            self.driver = self.auth_handler.authenticate()
+
+        if not self.driver:
+            raise RuntimeError("Failed to authenticate")
+
+        num_workers = max(1, min(max_concurrency, len(post_urls)))
+        cookies = self.driver.get_cookies()
+        headless = self.auth_handler.browser_manager.headless
+
+        # Idle collectors; a worker borrows one per URL and returns it afterwards
+        collectors: queue.Queue[FeedCollector] = queue.Queue()
+        collectors.put(self)
+        extra_collectors: list[FeedCollector] = []
+
+        def download(post_url: str) -> dict | None:
+            try:
+                collector = collectors.get_nowait()
+            except queue.Empty:
+                collector = FeedCollector(headless=headless, include_media=self.include_media)
+                extra_collectors.append(collector)
+                try:
+                    collector.driver = collector.auth_handler.authenticate_with_cookies(cookies)
+                except Exception as e:
+                    logger.error(f"Could not start browser for {post_url}: {e}")
+                    return None
+            try:
+                return collector.download_post_from_url(post_url)
+            except Exception as e:
+                logger.error(f"Error downloading {post_url}: {e}")
+                return None
+            finally:
+                collectors.put(collector)
+
+        logger.info(f"Downloading {len(post_urls)} posts with {num_workers} browsers...")
+        try:
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                results = list(executor.map(download, post_urls))
+        finally:
+            for collector in extra_collectors:
+                collector.close()
+
+        return [post for post in results if post]
+
+    def iter_posts(self, num_posts: int = 10) -> Iterator[dict]:
+        """Collect posts from LinkedIn feed, yielding each one as soon as it is found.
+
+        Lets callers save or process posts while the browser is still scrolling.
+
+        Args:
+            num_posts: Number of posts to collect.
+
+        Yields:
+            Post dictionaries in feed order, without duplicates.
         """
         # Only authenticate if driver is not already set (reused from another handler)
         if not self.driver:
@@ -480,57 +1000,60 @@ class FeedCollector:
 
         # Wait for feed to load
         try:
-            self.auth_handler.browser_manager.wait_for_element(POST_CONTAINER_SELECTOR, timeout=10)
+            self.auth_handler.browser_manager.wait_for_element_observed(
+                POST_CONTAINER_SELECTOR, timeout=10
+            )
         except TimeoutException:
             logger.error("Feed did not load. Check if you're logged in.")
             raise
 
-        collected_posts: list[dict] = []
-        seen_post_ids: set[str] = set()
+        num_collected = 0
+        # Activity IDs are stored as ints (smaller and cheaper to hash than digit
+        # strings); non-numeric fallback IDs stay strings
+        seen_post_ids: set[int | str] = set()
+        # Posts already read in the browser; later scrolls only extract the new ones
+        seen_urns: set[str] = set()
         scroll_attempts_without_new = 0
         max_scroll_attempts = 3
         max_timeout = 300  # 5 minutes
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
         logger.info(f"Starting to collect {num_posts} posts...")
 
-        while len(collected_posts) < num_posts:
+        while num_collected < num_posts:
             # Check timeout
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.monotonic() - start_time
             if elapsed > max_timeout:
                 logger.warning(f"Timeout reached after {elapsed:.0f} seconds")
                 break
 
-            # Find all post elements
+            # Extract every loaded post in one browser round-trip
             try:
-                post_elements = self.driver.find_elements(By.CSS_SELECTOR, POST_CONTAINER_SELECTOR)
+                posts, container_count = self._extract_all_posts_data(seen_urns)
             except Exception as e:
                 logger.error(f"Error finding posts: {e}")
                 break
 
-            # Extract data from posts
-            for post_elem in post_elements:
-                if len(collected_posts) >= num_posts:
+            for post_data in posts:
+                if num_collected >= num_posts:
                     break
 
-                post_data = self._extract_post_data(post_elem)
-                if not post_data:
-                    continue
-
                 post_id = post_data["post_id"]
-                if post_id in seen_post_ids:
+                seen_key = int(post_id) if post_id.isdigit() else post_id
+                if seen_key in seen_post_ids:
                     continue
 
-                seen_post_ids.add(post_id)
-                collected_posts.append(post_data)
-                logger.info(f"Collected post {len(collected_posts)}/{num_posts}: {post_data['author']}")
+                seen_post_ids.add(seen_key)
+                num_collected += 1
+                logger.info(f"Collected post {num_collected}/{num_posts}: {post_data['author']}")
+                yield post_data
 
             # Check if we have enough posts
-            if len(collected_posts) >= num_posts:
+            if num_collected >= num_posts:
                 break
 
             # Scroll to load more posts
-            previous_count = len(post_elements)
+            previous_count = container_count
             self._scroll_feed()
 
             # Wait for new posts
@@ -542,8 +1065,42 @@ class FeedCollector:
                     logger.warning("No new posts after scrolling, stopping collection")
                     break
 
-        logger.info(f"Collection complete: {len(collected_posts)} posts collected")
-        return collected_posts
+        logger.info(f"Collection complete: {num_collected} posts collected")
+
+    def collect_posts(self, num_posts: int = 10, stream_to: Path | None = None) -> list[dict]:
+        """Collect posts from LinkedIn feed.
+
+        Args:
+            num_posts: Number of posts to collect.
+            stream_to: If set, append each post to this JSONL file as soon as it is
+                collected instead of keeping it in memory. Read it back with
+                load_posts_jsonl.
+
+        Returns:
+            List of post dictionaries (empty when streaming to a file).
+        """
+        if not stream_to:
+            return list(self.iter_posts(num_posts))
+
+        stream_to.parent.mkdir(parents=True, exist_ok=True)
+        with stream_to.open("ab") as f:
+            for post_data in self.iter_posts(num_posts):
+                f.write(orjson.dumps(post_data) + b"\n")
+        return []
+
+    def load_posts_jsonl(self, input_file: Path) -> Iterator[dict]:
+        """Lazily read posts written by collect_posts(stream_to=...).
+
+        Args:
+            input_file: JSONL file with one post per line.
+
+        Yields:
+            Post dictionaries in collection order.
+        """
+        with input_file.open("rb") as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
 
     def save_posts(self, posts: list[dict], output_file: Path | None = None) -> Path:
         """Save posts to JSON file.
@@ -555,20 +1112,21 @@ class FeedCollector:
         Returns:
             Path to saved file.
         """
+        collected_at = datetime.now()
         if output_file is None:
-            timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+            timestamp = collected_at.strftime("%Y-%m-%d-%H-%M-%S")
             output_file = Path(f"data/post_{timestamp}.json")
 
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
         data = {
-            "collected_at": datetime.now().isoformat(),
+            "collected_at": collected_at.isoformat(),
             "num_posts": len(posts),
             "posts": posts,
         }
 
-        with output_file.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # orjson writes UTF-8 bytes directly and indents in C
+        output_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
         logger.info(f"Saved {len(posts)} posts to {output_file}")
         return output_file
@@ -591,14 +1149,14 @@ class FeedCollector:
 
         # Wait for feed to load
         try:
-            self.auth_handler.browser_manager.wait_for_element(POST_CONTAINER_SELECTOR, timeout=10)
+            self.auth_handler.browser_manager.wait_for_element_observed(
+                POST_CONTAINER_SELECTOR, timeout=10
+            )
         except TimeoutException:
             logger.error("Feed did not load. Check if you're logged in.")
             raise
 
-        import time
-
-        time.sleep(3)  # Wait for content to fully load
+        self._wait_for_post_content()
 
         # Find post elements
         post_elements = self.driver.find_elements(By.CSS_SELECTOR, POST_CONTAINER_SELECTOR)
@@ -609,145 +1167,20 @@ class FeedCollector:
         for idx, post_elem in enumerate(post_elements[:num_posts]):
             logger.info(f"Debugging post {idx + 1}/{min(num_posts, len(post_elements))}")
 
-            # Get full HTML
-            html_content = post_elem.get_attribute("outerHTML")
-
-            # Get all attributes
-            attributes = {}
-            try:
-                # Get common attributes
-                for attr in ["id", "class", "data-urn", "data-activity-id", "data-actor-id"]:
-                    val = post_elem.get_attribute(attr)
-                    if val:
-                        attributes[attr] = val
-            except Exception as e:
-                logger.warning(f"Error getting attributes: {e}")
-
-            # Try to extract JSON from script tags
-            json_data = []
-            try:
-                script_tags = post_elem.find_elements(By.TAG_NAME, "script")
-                for script in script_tags:
-                    script_content = script.get_attribute("innerHTML")
-                    if script_content and ("{" in script_content or "[" in script_content):
-                        json_data.append(script_content[:500])  # First 500 chars
-            except Exception:
-                pass
-
-            # Try to find all text content
-            all_text = ""
-            try:
-                all_text = post_elem.text
-            except Exception:
-                pass
-
-            # Try to find all links
-            links = []
             try:
-                link_elements = post_elem.find_elements(By.TAG_NAME, "a")
-                for link in link_elements:
-                    href = link.get_attribute("href")
-                    text = link.text
-                    if href:
-                        links.append({"href": href, "text": text})
-            except Exception:
-                pass
-
-            # Try to find all images
-            images = []
-            try:
-                img_elements = post_elem.find_elements(By.TAG_NAME, "img")
-                for img in img_elements:
-                    src = img.get_attribute("src")
-                    alt = img.get_attribute("alt")
-                    if src:
-                        images.append({"src": src, "alt": alt})
-            except Exception:
-                pass
-
-            # Try to find all data attributes
-            data_attrs = {}
-            try:
-                # Get all attributes using JavaScript
-                attrs_js = """
-                var items = {};
-                for (var i = 0; i < arguments[0].attributes.length; i++) {
-                    var attr = arguments[0].attributes[i];
-                    if (attr.name.startsWith('data-')) {
-                        items[attr.name] = attr.value;
-                    }
-                }
-                return items;
-                """
-                data_attrs = self.driver.execute_script(attrs_js, post_elem)
+                post_debug = self.driver.execute_script(DEBUG_POST_JS, post_elem, DEBUG_SELECTORS)
             except Exception as e:
-                logger.warning(f"Error getting data attributes: {e}")
-
-            # Try to find nested elements with common classes
-            nested_elements = {}
-            common_selectors = {
-                "author": [
-                    ".update-components-actor__name",
-                    ".feed-shared-actor__name",
-                    "[data-control-name='actor']",
-                    "span[aria-label*='author']",
-                ],
-                "content": [
-                    ".feed-shared-text__text-view",
-                    ".feed-shared-text-view",
-                    ".update-components-text",
-                    "[data-control-name='text']",
-                ],
-                "timestamp": [
-                    "time",
-                    ".feed-shared-actor__sub-description",
-                    ".update-components-actor__sub-description",
-                    "[data-control-name='timestamp']",
-                ],
-                "reactions": [
-                    ".social-details-social-counts__reactions-count",
-                    "[data-control-name='reactions_count']",
-                ],
-                "comments": [
-                    ".social-details-social-counts__comments",
-                    "[data-control-name='comments_count']",
-                ],
-            }
+                logger.warning(f"Error inspecting post {idx + 1}: {e}")
+                continue
 
-            for key, selectors in common_selectors.items():
-                for selector in selectors:
-                    try:
-                        elem = post_elem.find_element(By.CSS_SELECTOR, selector)
-                        nested_elements[key] = {
-                            "selector": selector,
-                            "text": elem.text,
-                            "html": elem.get_attribute("outerHTML")[:200],
-                        }
-                        break
-                    except Exception:
-                        continue
-
-            debug_data.append(
-                {
-                    "post_index": idx + 1,
-                    "attributes": attributes,
-                    "data_attributes": data_attrs,
-                    "all_text": all_text[:1000],  # First 1000 chars
-                    "links": links[:10],  # First 10 links
-                    "images": images[:10],  # First 10 images
-                    "nested_elements": nested_elements,
-                    "html_snippet": html_content[:2000],  # First 2000 chars
-                    "json_snippets": json_data,
-                }
-            )
+            debug_data.append({"post_index": idx + 1, **post_debug})
 
         # Save debug data
         timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
         debug_file = Path(f"data/debug-post-structure-{timestamp}.json")
         debug_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with debug_file.open("w", encoding="utf-8") as f:
-            json.dump(debug_data, f, indent=2, ensure_ascii=False)
+        debug_file.write_bytes(orjson.dumps(debug_data, option=orjson.OPT_INDENT_2))
 
         logger.info(f"Debug data saved to {debug_file}")
 
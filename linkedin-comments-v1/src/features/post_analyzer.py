@@ -1,31 +1,60 @@
 """Post analyzer using LLM to extract summaries and categories."""
 
-import json
+import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from src.services.llm_client import LLMClient
+import orjson
+from src.services.content_dedup import ContentDedupStore
+from src.services.llm_cache import LLMCache
+from src.services.rate_limiter import AdaptiveConcurrency
+from src.services.semantic_cache import SemanticCache
 
 if TYPE_CHECKING:
-    pass
+    from src.services.llm_client import LLMClient
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CONCURRENCY = 10
+# Below this many uncached posts a batch job's queueing delay outweighs its discount
+BATCH_MIN_POSTS = 5
+
+# Serializes and writes results off the caller's thread; one worker keeps writes ordered
+_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analysis-writer")
+
 
 class PostAnalyzer:
     """Analyzes posts using LLM to extract summaries and categories."""
 
-    def __init__(self, max_workers: int | None = None) -> None:
+    def __init__(
+        self, max_workers: int | None = None, dedup: bool = False, cache_enabled: bool = True
+    ) -> None:
         """Initialize post analyzer.
 
         Args:
-            max_workers: Maximum number of concurrent workers. If None, uses default.
+            max_workers: Maximum number of concurrent LLM calls. If None, starts at
+                DEFAULT_MAX_CONCURRENCY and retunes from observed latency and the
+                client's requests-per-minute limit.
+            dedup: Elide text blocks already sent to the LLM in other posts
+                (boilerplate, quoted excerpts) from prompts. Cheaper, but the
+                analysis then sees those blocks only as short markers.
+            cache_enabled: Reuse and store analyses and raw LLM responses from
+                earlier runs. Disable to force fresh LLM calls.
         """
-        self.llm_client = LLMClient()
+        # Deferred so importing this module does not load the Gemini SDK
+        from src.services.llm_client import LLMClient
+
+        self.llm_client: LLMClient = LLMClient(cache_enabled=cache_enabled)
         self.max_workers = max_workers
+        self.cache_enabled = cache_enabled
+        self.cache = LLMCache()
+        # Near-duplicate lookup only when the optional embedding extra is installed
+        self.semantic_cache = SemanticCache() if SemanticCache.is_available() else None
+        self.dedup = ContentDedupStore() if dedup else None
 
     def load_posts(self, input_file: Path) -> dict:
         """Load posts from JSON file.
@@ -38,17 +67,111 @@ class PostAnalyzer:
 
         Raises:
             FileNotFoundError: If file doesn't exist.
-            json.JSONDecodeError: If file is not valid JSON.
+            orjson.JSONDecodeError: If file is not valid JSON.
         """
         if not input_file.exists():
             raise FileNotFoundError(f"Input file not found: {input_file}")
 
-        with input_file.open(encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(input_file.read_bytes())
 
-        logger.info(f"Loaded {len(data.get('posts', []))} posts from {input_file}")
+        logger.info("Loaded %d posts from %s", len(data.get("posts", [])), input_file)
         return data
 
+    def iter_posts(self, input_file: Path) -> Iterator[dict]:
+        """Stream posts from a JSON or JSONL file without loading it whole.
+
+        Args:
+            input_file: Path to a JSON file with a "posts" array, or a JSONL file
+                with one post per line (as written by ``collect_posts(stream_to=...)``).
+
+        Yields:
+            Post dictionaries in file order.
+
+        Raises:
+            FileNotFoundError: If file doesn't exist.
+        """
+        if not input_file.exists():
+            raise FileNotFoundError(f"Input file not found: {input_file}")
+
+        count = 0
+        with input_file.open("rb") as f:
+            if input_file.suffix == ".jsonl":
+                posts: Iterable[dict] = (orjson.loads(line) for line in f if line.strip())
+            else:
+                import ijson
+
+                posts = ijson.items(f, "posts.item", use_float=True)
+            for post in posts:
+                count += 1
+                yield post
+
+        logger.info("Read %d posts from %s", count, input_file)
+
+    def _prompt_content(self, post_id: str, content: str) -> str:
+        """Return the content to send to the LLM for a post.
+
+        Args:
+            post_id: Post ID.
+            content: Post content.
+
+        Returns:
+            The content, with blocks seen in other posts elided when dedup is on.
+        """
+        if self.dedup is None:
+            return content
+        return self.dedup.reduce(content, post_id)
+
+    def _lookup_cached(self, post_id: str, content: str) -> tuple[dict | None, str, Any]:
+        """Look up a post's analysis in the exact and semantic caches.
+
+        Args:
+            post_id: Post ID, for logging.
+            content: Content the analysis is (or would be) made from, as returned
+                by _prompt_content, so elided prompts never share a key with the
+                full post.
+
+        Returns:
+            Tuple of (cached analysis or None, cache key, embedding or None) so a
+            miss can be stored without hashing or embedding the content again.
+        """
+        cache_key = LLMCache.key(content)
+        if not self.cache_enabled:
+            return None, cache_key, None
+
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached analysis for post: %s", post_id)
+            return cached, cache_key, None
+
+        vector = None
+        if self.semantic_cache is not None:
+            vector = self.semantic_cache.embed(content)
+            similar = self.semantic_cache.lookup(vector)
+            if similar is not None:
+                logger.info("Using analysis of a similar post for: %s", post_id)
+                self.cache.set(cache_key, similar)
+                return similar, cache_key, vector
+
+        return None, cache_key, vector
+
+    def _store_analysis(self, analysis: dict, cache_key: str, vector: Any) -> None:
+        """Cache a fresh analysis and log it.
+
+        Args:
+            analysis: Analysis returned by the LLM client.
+            cache_key: Key from _lookup_cached.
+            vector: Embedding from _lookup_cached, or None.
+        """
+        # Errors are returned as analyses too; only cache real results
+        if self.cache_enabled and not analysis["summary"].startswith("Error"):
+            self.cache.set(cache_key, analysis)
+            if vector is not None and self.semantic_cache is not None:
+                self.semantic_cache.add(vector, cache_key, analysis)
+        # Per-post logging: defer formatting so nothing is built when INFO is off
+        logger.info("  Summary: %.60s...", analysis["summary"])
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("  Categories: %s", ", ".join(analysis["categories"]))
+
     def _analyze_single_post(self, post: dict) -> dict:
         """Analyze a single post.
 
@@ -56,134 +179,289 @@ class PostAnalyzer:
             post: Post dictionary.
 
         Returns:
-            Analyzed post dictionary.
+            Analyzed post dictionary. Never raises; failures are recorded as an
+            "Error: ..." summary.
         """
         post_id = post.get("post_id", "unknown")
         content = post.get("content", "")
 
         if not content:
-            logger.warning(f"Post {post_id} has no content, skipping analysis")
+            logger.warning("Post %s has no content, skipping analysis", post_id)
             post["analysis"] = {"summary": "No content", "categories": []}
             return post
 
-        logger.info(f"Analyzing post: {post_id}")
+        try:
+            prompt_content = self._prompt_content(str(post_id), content)
+            cached, cache_key, vector = self._lookup_cached(post_id, prompt_content)
+        except Exception as e:
+            logger.error("Error analyzing post %s: %s", post_id, e)
+            post["analysis"] = {"summary": f"Error: {str(e)}", "categories": []}
+            return post
+
+        if cached is not None:
+            post["analysis"] = cached
+        else:
+            self._analyze_uncached(post, prompt_content, cache_key, vector)
+        return post
+
+    def _analyze_uncached(
+        self, post: dict, prompt_content: str, cache_key: str, vector: Any
+    ) -> None:
+        """Analyze a post that missed the caches and store the result.
+
+        Args:
+            post: Post dictionary; its "analysis" key is set.
+            prompt_content: Content to analyze, from _prompt_content.
+            cache_key: Key from _lookup_cached.
+            vector: Embedding from _lookup_cached, or None.
+        """
+        post_id = post.get("post_id", "unknown")
+        try:
+            logger.info("Analyzing post: %s", post_id)
+            analysis = self.llm_client.analyze_post(prompt_content)
+            post["analysis"] = analysis
+            self._store_analysis(analysis, cache_key, vector)
+        except Exception as e:
+            logger.error("Error analyzing post %s: %s", post_id, e)
+            post["analysis"] = {"summary": f"Error: {str(e)}", "categories": []}
+
+    async def _analyze_single_post_async(
+        self, post: dict, concurrency: AdaptiveConcurrency
+    ) -> dict:
+        """Analyze a single post, bounded by a shared concurrency limit.
+
+        Args:
+            post: Post dictionary.
+            concurrency: Limit on concurrent LLM calls.
+
+        Returns:
+            Analyzed post dictionary. Never raises; failures are recorded as an
+            "Error: ..." summary.
+        """
+        post_id = post.get("post_id", "unknown")
+        content = post.get("content", "")
+
+        if not content:
+            logger.warning("Post %s has no content, skipping analysis", post_id)
+            post["analysis"] = {"summary": "No content", "categories": []}
+            return post
 
         try:
-            analysis = self.llm_client.analyze_post(content)
+            # Hashing, embedding and SQLite lookups block, so keep them off the event loop
+            prompt_content = await asyncio.to_thread(self._prompt_content, str(post_id), content)
+            cached, cache_key, vector = await asyncio.to_thread(
+                self._lookup_cached, post_id, prompt_content
+            )
+            if cached is not None:
+                post["analysis"] = cached
+                return post
+
+            async with concurrency.slot():
+                logger.info("Analyzing post: %s", post_id)
+                analysis = await self.llm_client.analyze_post_async(
+                    prompt_content, on_latency=concurrency.record
+                )
+
             post["analysis"] = analysis
-            logger.info(f"  Summary: {analysis['summary'][:60]}...")
-            logger.info(f"  Categories: {', '.join(analysis['categories'])}")
+            self._store_analysis(analysis, cache_key, vector)
         except Exception as e:
-            logger.error(f"Error analyzing post {post_id}: {e}")
+            logger.error("Error analyzing post %s: %s", post_id, e)
             post["analysis"] = {"summary": f"Error: {str(e)}", "categories": []}
 
         return post
 
-    def analyze_posts(self, posts_data: dict, concurrent: bool = True) -> list[dict]:
+    async def _analyze_posts_async(self, post_iter: Iterable[dict]) -> list[dict]:
+        """Analyze posts concurrently on one event loop.
+
+        Each post is scheduled as soon as it is read, so LLM calls for early posts
+        overlap with parsing the rest of a streamed input.
+
+        Args:
+            post_iter: Post dictionaries.
+
+        Returns:
+            Analyzed post dictionaries in input order.
+        """
+        if self.max_workers:
+            concurrency = AdaptiveConcurrency(self.max_workers)
+        else:
+            concurrency = AdaptiveConcurrency(DEFAULT_MAX_CONCURRENCY, rpm=self.llm_client.rpm)
+        tasks: list[asyncio.Task] = []
+        for post in post_iter:
+            tasks.append(asyncio.create_task(self._analyze_single_post_async(post, concurrency)))
+            # Let scheduled posts start their requests before reading the next one
+            await asyncio.sleep(0)
+
+        # Tasks record their own failures, so results line up with the input as-is
+        return list(await asyncio.gather(*tasks))
+
+    def analyze_posts(
+        self, posts_data: dict | Iterable[dict], concurrent: bool = True
+    ) -> list[dict]:
         """Analyze all posts using LLM.
 
         Args:
-            posts_data: Dictionary with posts data.
+            posts_data: Dictionary with posts data, or an iterable of posts such as
+                iter_posts() so analysis starts while the input is still being read.
             concurrent: Whether to process posts concurrently.
 
         Returns:
-            List of analyzed post dictionaries.
+            List of analyzed post dictionaries, in input order.
         """
-        posts = posts_data.get("posts", [])
-        analyzed_posts: list[dict] = []
-
-        logger.info(f"Analyzing {len(posts)} posts (concurrent={concurrent})...")
-
-        if concurrent and len(posts) > 1:
-            # Process posts concurrently
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_post = {
-                    executor.submit(self._analyze_single_post, post): post
-                    for post in posts
-                }
-
-                for i, future in enumerate(as_completed(future_to_post), 1):
-                    try:
-                        analyzed_post = future.result()
-                        analyzed_posts.append(analyzed_post)
-                        logger.info(f"Completed {i}/{len(posts)} posts")
-                    except Exception as e:
-                        original_post = future_to_post[future]
-                        post_id = original_post.get("post_id", "unknown")
-                        logger.error(f"Error processing post {post_id}: {e}")
-                        original_post["analysis"] = {
-                            "summary": f"Error: {str(e)}",
-                            "categories": [],
-                        }
-                        analyzed_posts.append(original_post)
-        else:
-            # Process posts sequentially
-            for i, post in enumerate(posts, 1):
-                post_id = post.get("post_id", "unknown")
-                logger.info(f"Analyzing post {i}/{len(posts)}: {post_id}")
-                analyzed_post = self._analyze_single_post(post)
-                analyzed_posts.append(analyzed_post)
-
-        # Sort by original order
-        post_id_to_index = {post.get("post_id"): i for i, post in enumerate(posts)}
-        analyzed_posts.sort(
-            key=lambda p: post_id_to_index.get(p.get("post_id"), float("inf"))
-        )
+        posts = posts_data.get("posts", []) if isinstance(posts_data, dict) else posts_data
+
+        logger.info("Analyzing posts (concurrent=%s)...", concurrent)
+
+        try:
+            if concurrent:
+                analyzed_posts = asyncio.run(self._analyze_posts_async(posts))
+            else:
+                # Process posts sequentially
+                analyzed_posts = []
+                for i, post in enumerate(posts, 1):
+                    post_id = post.get("post_id", "unknown")
+                    logger.info("Analyzing post %d: %s", i, post_id)
+                    analyzed_posts.append(self._analyze_single_post(post))
+        finally:
+            self.cache.flush()
+            if self.semantic_cache is not None:
+                self.semantic_cache.flush()
 
         return analyzed_posts
 
+    def analyze_posts_batch(self, posts_data: dict) -> list[dict]:
+        """Analyze all posts through the Gemini Batch API.
+
+        Cached posts are resolved first; if fewer than BATCH_MIN_POSTS remain, they
+        are analyzed concurrently instead.
+
+        Args:
+            posts_data: Dictionary with posts data.
+
+        Returns:
+            List of analyzed post dictionaries, in input order.
+        """
+        posts = posts_data.get("posts", [])
+        # Keyed by position: post IDs can be missing or repeated
+        pending: dict[str, tuple[dict, str, str, Any]] = {}
+
+        for index, post in enumerate(posts):
+            post_id = post.get("post_id", "unknown")
+            content = post.get("content", "")
+            if not content:
+                logger.warning("Post %s has no content, skipping analysis", post_id)
+                post["analysis"] = {"summary": "No content", "categories": []}
+                continue
+
+            prompt_content = self._prompt_content(str(post_id), content)
+            cached, cache_key, vector = self._lookup_cached(post_id, prompt_content)
+            if cached is not None:
+                post["analysis"] = cached
+            else:
+                pending[str(index)] = (post, prompt_content, cache_key, vector)
+
+        try:
+            if len(pending) < BATCH_MIN_POSTS:
+                logger.info("Only %d posts need analysis, skipping the batch API", len(pending))
+                # Reuse the prompts, cache keys and embeddings from the lookup above
+                with ThreadPoolExecutor(max_workers=BATCH_MIN_POSTS) as executor:
+                    list(executor.map(lambda args: self._analyze_uncached(*args), pending.values()))
+                return posts
+
+            logger.info("Submitting %d posts to the batch API...", len(pending))
+            results = self.llm_client.analyze_posts_batch(
+                {key: prompt_content for key, (_, prompt_content, _, _) in pending.items()}
+            )
+            for key, (post, _, cache_key, vector) in pending.items():
+                post["analysis"] = results[key]
+                self._store_analysis(results[key], cache_key, vector)
+        finally:
+            self.cache.flush()
+            if self.semantic_cache is not None:
+                self.semantic_cache.flush()
+
+        return posts
+
+    @staticmethod
+    def _default_output_file(analyzed_at: datetime) -> Path:
+        """Build a timestamped output path for analyzed posts.
+
+        Args:
+            analyzed_at: Time of the analysis run.
+
+        Returns:
+            Path under data/analyzed/.
+        """
+        timestamp = analyzed_at.strftime("%Y-%m-%d-%H-%M-%S")
+        return Path(f"data/analyzed/post_analyzed_{timestamp}.json")
+
     def save_analyzed_posts(
         self,
         analyzed_posts: list[dict],
         source_file: Path,
         output_file: Path | None = None,
-    ) -> Path:
-        """Save analyzed posts to JSON file.
+        analyzed_at: datetime | None = None,
+    ) -> Future[Path]:
+        """Save analyzed posts to JSON file in a background thread.
 
         Args:
-            analyzed_posts: List of analyzed post dictionaries.
+            analyzed_posts: List of analyzed post dictionaries. Must not be modified
+                until the returned future completes.
             source_file: Source file path for reference.
             output_file: Output file path. If None, generates timestamped filename.
+            analyzed_at: Run timestamp used for both the filename and the
+                "analyzed_at" field. If None, uses the current time.
 
         Returns:
-            Path to saved file.
+            Future resolving to the path of the saved file once it is written.
         """
-        if output_file is None:
-            timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
-            output_file = Path(f"data/analyzed/post_analyzed_{timestamp}.json")
-
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-
+        analyzed_at = analyzed_at or datetime.now()
+        output_file = output_file or self._default_output_file(analyzed_at)
         data = {
-            "analyzed_at": datetime.now().isoformat(),
+            "analyzed_at": analyzed_at.isoformat(),
             "source_file": str(source_file),
             "posts": analyzed_posts,
         }
 
-        with output_file.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-        logger.info(f"Saved {len(analyzed_posts)} analyzed posts to {output_file}")
-        return output_file
-
-    def run(self, input_file: Path, output_file: Path | None = None) -> Path:
+        def write() -> Path:
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            # One buffer, one write, then an atomic rename so readers (and the comment
+            # phase) never see a partially written file
+            part_file = output_file.with_name(output_file.name + ".part")
+            part_file.write_bytes(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+            part_file.replace(output_file)
+            logger.info("Saved %d analyzed posts to %s", len(analyzed_posts), output_file)
+            return output_file
+
+        return _WRITE_EXECUTOR.submit(write)
+
+    def run(
+        self, input_file: Path, output_file: Path | None = None, batch: bool = False
+    ) -> Future[Path]:
         """Run full analysis pipeline.
 
         Args:
             input_file: Path to input JSON file.
             output_file: Output file path. If None, generates timestamped filename.
+            batch: Submit posts through the Gemini Batch API (cheaper, not interactive).
 
         Returns:
-            Path to saved file.
+            Future resolving to the saved file path once the write finishes, so
+            callers can start the next phase while results are serialized.
         """
-        # Load posts
-        posts_data = self.load_posts(input_file)
-
-        # Analyze posts
-        analyzed_posts = self.analyze_posts(posts_data, concurrent=True)
+        # Analyze posts; the live path streams them straight from the file
+        if batch:
+            posts_data = {"posts": list(self.iter_posts(input_file))}
+            analyzed_posts = self.analyze_posts_batch(posts_data)
+        else:
+            analyzed_posts = self.analyze_posts(self.iter_posts(input_file), concurrent=True)
 
-        # Save results
-        output_path = self.save_analyzed_posts(analyzed_posts, input_file, output_file)
+        # Save results; one clock read keeps the filename and "analyzed_at" in step
+        analyzed_at = datetime.now()
+        output_path = output_file or self._default_output_file(analyzed_at)
+        saved = self.save_analyzed_posts(analyzed_posts, input_file, output_path, analyzed_at)
 
         # Print summary
         successful = sum(1 for p in analyzed_posts if "Error" not in p.get("analysis", {}).get("summary", ""))
@@ -198,7 +476,7 @@ class PostAnalyzer:
         print(f"Output file: {output_path}")
         print("=" * 60)
 
-        return output_path
+        return saved
 
 
 if __name__ == "__main__":
@@ -216,8 +494,11 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser(description="Analyze LinkedIn posts using LLM")
     parser.add_argument("--input-file", type=Path, required=True, help="Input JSON file with posts")
+    parser.add_argument("--batch", action="store_true", help="Use the Gemini Batch API")
+    parser.add_argument("--dedup", action="store_true", help="Elide blocks seen in other posts")
+    parser.add_argument("--no-cache", action="store_true", help="Force fresh LLM calls")
     args = parser.parse_args()
 
-    analyzer = PostAnalyzer()
-    analyzer.run(args.input_file)
+    analyzer = PostAnalyzer(dedup=args.dedup, cache_enabled=not args.no_cache)
+    analyzer.run(args.input_file, batch=args.batch).result()
 
@@ -7,11 +7,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from src.features.auth_handler import AuthHandler
-from src.features.comment_generator import CommentGenerator
-from src.features.feed_collector import FeedCollector
-from src.features.post_analyzer import PostAnalyzer
-
 if TYPE_CHECKING:
     pass
 
@@ -43,6 +38,8 @@ def cmd_auth(args: argparse.Namespace) -> None:
     Args:
         args: Command line arguments.
     """
+    from src.features.auth_handler import AuthHandler
+
     print("=" * 60)
     print("LinkedIn Authentication")
     print("=" * 60)
@@ -66,11 +63,13 @@ def cmd_collect(args: argparse.Namespace) -> None:
     Args:
         args: Command line arguments.
     """
+    from src.features.feed_collector import FeedCollector
+
     print("=" * 60)
     print(f"Collecting {args.num_posts} LinkedIn Posts")
     print("=" * 60)
 
-    collector = FeedCollector(headless=args.headless)
+    collector = FeedCollector(headless=args.headless, include_media=not args.no_media)
     try:
         posts = collector.collect_posts(num_posts=args.num_posts)
         output_file = collector.save_posts(posts)
@@ -90,17 +89,25 @@ def cmd_download(args: argparse.Namespace) -> None:
     Args:
         args: Command line arguments.
     """
+    from src.features.feed_collector import FeedCollector
+
     print("=" * 60)
-    print(f"Downloading Post from URL: {args.url}")
+    print(f"Downloading {len(args.url)} Post(s) from URL")
     print("=" * 60)
 
-    collector = FeedCollector(headless=args.headless)
+    collector = FeedCollector(headless=args.headless, include_media=not args.no_media)
     try:
-        post_data = collector.download_post_from_url(args.url)
-        if post_data:
-            posts = [post_data]
+        if len(args.url) == 1:
+            post_data = collector.download_post_from_url(args.url[0])
+            posts = [post_data] if post_data else []
+        else:
+            posts = collector.download_posts_from_urls(
+                args.url, max_concurrency=args.max_concurrency
+            )
+
+        if posts:
             output_file = collector.save_posts(posts)
-            print(f"\n✓ Successfully downloaded post")
+            print(f"\n✓ Successfully downloaded {len(posts)}/{len(args.url)} post(s)")
             print(f"Saved to: {output_file}")
         else:
             print("\n✗ Failed to download post")
@@ -119,14 +126,18 @@ def cmd_analyze(args: argparse.Namespace) -> None:
     Args:
         args: Command line arguments.
     """
+    from src.features.post_analyzer import PostAnalyzer
+
     input_file = Path(args.input_file)
     print("=" * 60)
     print(f"Analyzing Posts from {input_file}")
     print("=" * 60)
 
-    analyzer = PostAnalyzer(max_workers=args.max_workers)
+    analyzer = PostAnalyzer(
+        max_workers=args.max_workers, dedup=args.dedup, cache_enabled=not args.no_cache
+    )
     try:
-        output_file = analyzer.run(input_file)
+        output_file = analyzer.run(input_file, batch=args.batch).result()
         print("\n✓ Analysis complete")
         print(f"Output file: {output_file}")
     except Exception as e:
@@ -141,14 +152,21 @@ def cmd_generate(args: argparse.Namespace) -> None:
     Args:
         args: Command line arguments.
     """
+    from src.features.comment_generator import CommentGenerator
+
     input_file = Path(args.input_file)
     print("=" * 60)
     print(f"Generating Comments from {input_file}")
     print("=" * 60)
 
-    generator = CommentGenerator(max_workers=args.max_workers)
+    generator = CommentGenerator(
+        max_workers=args.max_workers, stream=args.stream, cache_enabled=not args.no_cache
+    )
     try:
-        saved_files = generator.run(input_file)
+        if args.batch:
+            saved_files = generator.run_batch(input_file)
+        else:
+            saved_files = generator.run(input_file)
         print("\n✓ Comment generation complete")
         print(f"Generated {len(saved_files)} markdown files")
     except Exception as e:
@@ -163,6 +181,8 @@ def cmd_debug(args: argparse.Namespace) -> None:
     Args:
         args: Command line arguments.
     """
+    from src.features.feed_collector import FeedCollector
+
     print("=" * 60)
     print("Debugging LinkedIn Post Structure")
     print("=" * 60)
@@ -188,6 +208,12 @@ def cmd_full(args: argparse.Namespace) -> None:
     Args:
         args: Command line arguments.
     """
+    from src.features.auth_handler import AuthHandler
+    from src.features.comment_generator import CommentGenerator
+    from src.features.feed_collector import FeedCollector
+    from src.features.post_analyzer import PostAnalyzer
+    from src.services.browser_manager import BrowserManager
+
     print("=" * 60)
     print("LinkedIn Comment Automation - Full Pipeline")
     print("=" * 60)
@@ -196,7 +222,9 @@ def cmd_full(args: argparse.Namespace) -> None:
 
     # Phase I: Authentication
     print("[Phase I] Authentication...")
-    handler = AuthHandler(headless=args.headless)
+    # One browser serves authentication and collection
+    browser_manager = BrowserManager.shared(headless=args.headless)
+    handler = AuthHandler(browser_manager=browser_manager)
     try:
         handler.authenticate()
         print("✓ Authentication successful")
@@ -208,10 +236,8 @@ def cmd_full(args: argparse.Namespace) -> None:
 
     # Phase II: Collect posts
     print("\n[Phase II] Collecting posts...")
-    # Create collector with headless flag, then reuse the authenticated handler
-    collector = FeedCollector(headless=args.headless)
-    collector.auth_handler = handler  # Reuse authenticated session
-    collector.driver = handler.driver
+    collector = FeedCollector(include_media=not args.no_media, browser_manager=browser_manager)
+    collector.driver = handler.driver  # Reuse authenticated session
 
     try:
         posts = collector.collect_posts(num_posts=args.num_posts)
@@ -228,11 +254,11 @@ def cmd_full(args: argparse.Namespace) -> None:
 
     # Phase III: Analyze posts
     print("\n[Phase III] Analyzing posts...")
-    analyzer = PostAnalyzer(max_workers=args.max_workers)
+    analyzer = PostAnalyzer(
+        max_workers=args.max_workers, dedup=args.dedup, cache_enabled=not args.no_cache
+    )
     try:
-        analyzed_file = analyzer.run(posts_file)
-        print("✓ Analysis complete")
-        print(f"  Saved to: {analyzed_file}")
+        analyzed_future = analyzer.run(posts_file)
     except Exception as e:
         logger.error(f"Analysis failed: {e}")
         print(f"✗ Analysis failed: {e}")
@@ -240,7 +266,17 @@ def cmd_full(args: argparse.Namespace) -> None:
 
     # Phase IV: Generate comments
     print("\n[Phase IV] Generating comments...")
-    generator = CommentGenerator(max_workers=args.max_workers)
+    # Set up the generator while the analysis results are still being written
+    generator = CommentGenerator(max_workers=args.max_workers, cache_enabled=not args.no_cache)
+    try:
+        analyzed_file = analyzed_future.result()
+        print("✓ Analysis complete")
+        print(f"  Saved to: {analyzed_file}")
+    except Exception as e:
+        logger.error(f"Saving analysis failed: {e}")
+        print(f"✗ Saving analysis failed: {e}")
+        sys.exit(1)
+
     try:
         saved_files = generator.run(analyzed_file)
         print("✓ Comment generation complete")
@@ -280,9 +316,15 @@ Examples:
   # Analyze collected posts (with concurrency)
   python -m src.main analyze --input-file data/post_2025-11-07-14-30-00.json --max-workers 5
 
+  # Analyze posts through the Gemini Batch API
+  python -m src.main analyze --input-file data/post_2025-11-07-14-30-00.json --batch
+
   # Generate comments (with concurrency)
   python -m src.main generate --input-file data/analyzed/post_analyzed_2025-11-07-15-00-00.json --max-workers 5
 
+  # Generate comments through the Gemini Batch API
+  python -m src.main generate --input-file data/analyzed/post_analyzed_2025-11-07-15-00-00.json --batch
+
   # Run full pipeline
   python -m src.main full --num-posts 20
   python -m src.main full --num-posts 20 --max-workers 5
@@ -297,6 +339,11 @@ Examples:
         action="store_true",
         help="Run browser in headless mode",
     )
+    parser.add_argument(
+        "--no-media",
+        action="store_true",
+        help="Skip image/video/document extraction when collecting or downloading posts",
+    )
 
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
 
@@ -316,13 +363,20 @@ Examples:
 
     # Download command
     download_parser = subparsers.add_parser(
-        "download", help="Download a single post from a LinkedIn URL"
+        "download", help="Download posts from LinkedIn URLs"
     )
     download_parser.add_argument(
         "--url",
         type=str,
+        nargs="+",
         required=True,
-        help="LinkedIn post URL",
+        help="LinkedIn post URL(s)",
+    )
+    download_parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=4,
+        help="Maximum browsers used in parallel when downloading several URLs (default: 4)",
     )
     download_parser.set_defaults(func=cmd_download)
 
@@ -332,7 +386,7 @@ Examples:
         "--input-file",
         type=str,
         required=True,
-        help="Input JSON file with posts",
+        help="Input JSON or JSONL file with posts",
     )
     analyze_parser.add_argument(
         "--max-workers",
@@ -340,6 +394,21 @@ Examples:
         default=None,
         help="Maximum number of concurrent workers (default: auto)",
     )
+    analyze_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit posts as Gemini Batch API jobs, split by size (cheaper, not interactive)",
+    )
+    analyze_parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Elide text blocks already sent in other posts from analysis prompts",
+    )
+    analyze_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached LLM results from earlier runs and do not store new ones",
+    )
     analyze_parser.set_defaults(func=cmd_analyze)
 
     # Generate command
@@ -356,6 +425,21 @@ Examples:
         default=None,
         help="Maximum number of concurrent workers (default: auto)",
     )
+    generate_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Submit posts as Gemini Batch API jobs, split by size (cheaper, not interactive)",
+    )
+    generate_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream each response into its markdown file as comments complete",
+    )
+    generate_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached LLM results from earlier runs and do not store new ones",
+    )
     generate_parser.set_defaults(func=cmd_generate)
 
     # Full command
@@ -372,6 +456,16 @@ Examples:
         default=None,
         help="Maximum number of concurrent workers for analysis and generation (default: auto)",
     )
+    full_parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Elide text blocks already sent in other posts from analysis prompts",
+    )
+    full_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached LLM results from earlier runs and do not store new ones",
+    )
     full_parser.set_defaults(func=cmd_full)
 
     # Debug command
@@ -1,11 +1,17 @@
 """Browser management service using Selenium."""
 
+import functools
 import logging
+import shutil
+import time
 from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar
 
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
@@ -16,10 +22,84 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+BROWSER_CACHE_DIR = Path("data/browser_cache")
+
+# Resolves as soon as a matching element is inserted, instead of on WebDriverWait's
+# 500ms polling ticks
+WAIT_FOR_SELECTOR_JS = """
+const [selector, timeoutMs, done] = arguments;
+const existing = document.querySelector(selector);
+if (existing) { done(existing); return; }
+const observer = new MutationObserver(() => {
+    const el = document.querySelector(selector);
+    if (el) { observer.disconnect(); clearTimeout(timer); done(el); }
+});
+const timer = setTimeout(() => { observer.disconnect(); done(null); }, timeoutMs);
+observer.observe(document.documentElement, {childList: true, subtree: true});
+"""
+
+
+@functools.lru_cache(maxsize=2)
+def _build_options(headless: bool) -> Options:
+    """Build Chrome options once per headless setting.
+
+    Args:
+        headless: Run browser in headless mode.
+
+    Returns:
+        Chrome options. Shared between starts, so callers must not modify them.
+    """
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option("useAutomationExtension", False)
+    # Keep the HTTP cache between runs so LinkedIn's JS bundles and images are reused
+    chrome_options.add_argument(f"--disk-cache-dir={BROWSER_CACHE_DIR.resolve()}")
+    # Return from get() at DOMContentLoaded; LinkedIn keeps streaming XHRs long after
+    # "load", and every caller waits for the element it needs explicitly
+    chrome_options.page_load_strategy = "eager"
+    return chrome_options
+
+
+@functools.lru_cache(maxsize=1)
+def _driver_path() -> str | None:
+    """Locate chromedriver on PATH once per process.
+
+    Returns:
+        Path to chromedriver, or None to let Selenium Manager resolve a driver.
+    """
+    return shutil.which("chromedriver")
+
 
 class BrowserManager:
     """Manages Selenium WebDriver instances."""
 
+    _shared: ClassVar[dict[bool, "BrowserManager"]] = {}
+
+    @classmethod
+    def shared(cls, headless: bool = False) -> "BrowserManager":
+        """Return the process-wide browser manager for a headless setting.
+
+        Phases that run back to back should use this so they share one Chrome
+        process. Code that needs several browsers at once (parallel downloads)
+        constructs its own instances instead.
+
+        Args:
+            headless: Run browser in headless mode.
+
+        Returns:
+            Shared BrowserManager instance.
+        """
+        if headless not in cls._shared:
+            cls._shared[headless] = cls(headless=headless)
+        return cls._shared[headless]
+
     def __init__(self, headless: bool = False) -> None:
         """Initialize browser manager.
 
@@ -28,23 +108,45 @@ class BrowserManager:
         """
         self.headless = headless
         self.driver: WebDriver | None = None
+        self._script_timeout = 0.0
+
+    def _is_alive(self) -> bool:
+        """Check whether the current driver still has a responsive browser.
+
+        Returns:
+            True if a driver is running and answers commands.
+        """
+        if not self.driver:
+            return False
+        try:
+            self.driver.current_url  # noqa: B018 - cheap round-trip to the browser
+            return True
+        except WebDriverException:
+            return False
 
     def start_browser(self) -> WebDriver:
-        """Start a new browser instance.
+        """Start a browser instance, reusing the running one if it is still alive.
 
         Returns:
             WebDriver instance.
         """
-        chrome_options = Options()
-        if self.headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-
-        self.driver = webdriver.Chrome(options=chrome_options)
+        if self._is_alive():
+            logger.info("Reusing running browser")
+            return self.driver
+
+        # An explicit driver path skips Selenium Manager's driver lookup on every start
+        self.driver = webdriver.Chrome(
+            options=_build_options(self.headless),
+            service=Service(executable_path=_driver_path()),
+        )
+
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+        except Exception as e:
+            logger.debug(f"Could not configure network cache via CDP: {e}")
+
+        self._script_timeout = 0.0
         logger.info("Browser started successfully")
         return self.driver
 
@@ -82,7 +184,69 @@ class BrowserManager:
             raise RuntimeError("Browser not started. Call start_browser() first.")
         wait = WebDriverWait(self.driver, timeout)
         element = wait.until(EC.presence_of_element_located((by, selector)))
-        logger.debug(f"Element found: {selector}")
+        logger.debug("Element found: %s", selector)
+        return element
+
+    def reset_session(self) -> None:
+        """Log out by clearing cookies and storage, keeping the browser running."""
+        if not self.driver:
+            return
+        self.driver.delete_all_cookies()
+        try:
+            self.driver.execute_cdp_cmd(
+                "Storage.clearDataForOrigin",
+                {
+                    "origin": "https://www.linkedin.com",
+                    "storageTypes": "local_storage,session_storage",
+                },
+            )
+        except Exception as e:
+            logger.debug(f"Could not clear site storage via CDP: {e}")
+        self.driver.get("about:blank")
+        logger.info("Browser session reset")
+
+    def wait_for_element_observed(self, selector: str, timeout: float = 10) -> "WebElement":
+        """Wait for an element using an in-page MutationObserver.
+
+        Lower-latency alternative to wait_for_element for CSS selectors: the wait
+        ends on the DOM mutation that inserts the element rather than the next poll.
+        If the page navigates away mid-wait, falls back to polling for the rest of
+        the timeout.
+
+        Args:
+            selector: CSS selector.
+            timeout: Maximum wait time in seconds.
+
+        Returns:
+            WebElement when found.
+
+        Raises:
+            TimeoutException: If element not found within timeout.
+        """
+        if not self.driver:
+            raise RuntimeError("Browser not started. Call start_browser() first.")
+
+        deadline = time.monotonic() + timeout
+        # The async script must be allowed to outlive the observer's own timeout
+        if self._script_timeout < timeout + 1:
+            self._script_timeout = timeout + 1
+            self.driver.set_script_timeout(self._script_timeout)
+
+        try:
+            element = self.driver.execute_async_script(
+                WAIT_FOR_SELECTOR_JS, selector, int(timeout * 1000)
+            )
+        except TimeoutException:
+            raise
+        except WebDriverException as e:
+            # A navigation while the observer is pending discards the script's
+            # document and fails it with a JavaScript error; poll the new page instead
+            logger.debug("Observer wait for %s interrupted (%s); polling", selector, e.msg)
+            remaining = max(0.0, deadline - time.monotonic())
+            return self.wait_for_element(selector, timeout=remaining)
+        if element is None:
+            raise TimeoutException(f"Element not found within {timeout}s: {selector}")
+        logger.debug("Element found: %s", selector)
         return element
 
     def close_browser(self) -> None:
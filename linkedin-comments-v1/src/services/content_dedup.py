@@ -0,0 +1,154 @@
+"""Content-defined chunking and dedup of text blocks repeated across posts."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+CONTENT_BLOCKS_DB = Path("data/cache/content_blocks.sqlite")
+# Block boundaries fall where the rolling line hash has its low bits clear, so the
+# same run of lines splits the same way in every post regardless of what precedes it
+MIN_BLOCK_LINES = 4
+MAX_BLOCK_LINES = 16
+BOUNDARY_MASK = 0b11
+# Shorter blocks (sign-offs, single hashtags) are too generic to be worth eliding
+MIN_BLOCK_CHARS = 80
+# Leading text of an elided block kept in its marker so the LLM still sees the gist
+SNIPPET_CHARS = 120
+
+
+def _line_gear(line: str) -> int:
+    """Map a line to a pseudo-random 32-bit value for the rolling hash.
+
+    Args:
+        line: Text line (surrounding whitespace is ignored).
+
+    Returns:
+        32-bit gear value.
+    """
+    digest = hashlib.blake2b(line.strip().encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(digest, "big")
+
+
+def chunk_lines(text: str) -> list[str]:
+    """Split text into blocks of lines at content-defined boundaries (Gear hash).
+
+    Args:
+        text: Text to split.
+
+    Returns:
+        Blocks whose concatenation is the original text.
+    """
+    blocks: list[str] = []
+    current: list[str] = []
+    rolling = 0
+
+    for line in text.splitlines(keepends=True):
+        current.append(line)
+        rolling = ((rolling << 1) + _line_gear(line)) & 0xFFFFFFFF
+        at_boundary = len(current) >= MIN_BLOCK_LINES and rolling & BOUNDARY_MASK == 0
+        if at_boundary or len(current) >= MAX_BLOCK_LINES:
+            blocks.append("".join(current))
+            current = []
+            rolling = 0
+
+    if current:
+        blocks.append("".join(current))
+    return blocks
+
+
+class ContentDedupStore:
+    """SQLite record of text blocks already sent to the LLM.
+
+    Safe to share across threads; all access goes through one locked connection.
+    """
+
+    def __init__(self, db_file: Path = CONTENT_BLOCKS_DB) -> None:
+        """Initialize dedup store, creating the database if needed.
+
+        Args:
+            db_file: SQLite database file.
+        """
+        db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS blocks "
+            "(hash TEXT PRIMARY KEY, post_id TEXT, text TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def reduce(self, text: str, post_id: str) -> str:
+        """Replace blocks seen in other posts with short snippet markers.
+
+        Novel blocks are recorded so later posts can elide them. Blocks recorded by
+        the same post_id (e.g. a re-analysis) never count as seen. Text is returned
+        unchanged when no block was seen elsewhere, or when every eligible block
+        was (there would be nothing left to analyze).
+
+        Args:
+            text: Post content.
+            post_id: ID of the post, recorded against its novel blocks.
+
+        Returns:
+            Content with repeated blocks replaced by
+            ``[repeated from post <id>: <snippet>...]`` markers.
+        """
+        blocks = chunk_lines(text)
+        hashes = [hashlib.sha256(block.encode("utf-8")).hexdigest() for block in blocks]
+        eligible = [len(block.strip()) >= MIN_BLOCK_CHARS for block in blocks]
+        candidates = [h for h, ok in zip(hashes, eligible, strict=True) if ok]
+        if not candidates:
+            return text
+
+        with self._lock:
+            placeholders = ",".join("?" * len(candidates))
+            seen = {
+                row[0]: (row[1], row[2])
+                for row in self._conn.execute(
+                    f"SELECT hash, post_id, text FROM blocks "
+                    f"WHERE hash IN ({placeholders}) AND post_id != ?",
+                    [*candidates, post_id],
+                )
+            }
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO blocks (hash, post_id, text) VALUES (?, ?, ?)",
+                [
+                    (h, post_id, block)
+                    for h, block, ok in zip(hashes, blocks, eligible, strict=True)
+                    if ok and h not in seen
+                ],
+            )
+            self._conn.commit()
+
+        if not seen or all(h in seen for h in candidates):
+            return text
+
+        parts = [
+            self._marker(*seen[h]) if h in seen else block
+            for h, block in zip(hashes, blocks, strict=True)
+        ]
+        logger.debug("Elided %d repeated block(s) from post %s", len(seen), post_id)
+        return "".join(parts)
+
+    @staticmethod
+    def _marker(source_post_id: str, block: str) -> str:
+        """Build the annotation that stands in for an elided block.
+
+        Args:
+            source_post_id: Post the block was first recorded for.
+            block: Stored text of the block.
+
+        Returns:
+            One-line marker with the start of the block.
+        """
+        snippet = " ".join(block.split())[:SNIPPET_CHARS]
+        return f"[repeated from post {source_post_id}: {snippet}...]\n"
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
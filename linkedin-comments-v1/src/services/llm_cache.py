@@ -0,0 +1,221 @@
+"""On-disk cache for LLM responses keyed by content hash."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_CACHE_FILE = Path("data/cache/analysis.json")
+RESPONSE_CACHE_FILE = Path("data/cache/responses.sqlite")
+RESPONSE_CACHE_MEMORY_SIZE = 1024
+
+
+class LLMCache:
+    """Exact-match cache persisted as a single JSON file.
+
+    Entries are held in memory and written back only on flush(), so a run pays
+    one file write no matter how many entries it adds. Safe to share across threads.
+    """
+
+    def __init__(self, cache_file: Path = ANALYSIS_CACHE_FILE) -> None:
+        """Initialize cache, loading existing entries from disk.
+
+        Args:
+            cache_file: JSON file backing the cache.
+        """
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries: dict[str, Any] = self._load()
+
+    def _load(self) -> dict[str, Any]:
+        """Load cache entries from disk.
+
+        Returns:
+            Cached entries, or an empty dict if the file is missing or unreadable.
+        """
+        if not self.cache_file.exists():
+            return {}
+
+        try:
+            entries = orjson.loads(self.cache_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable cache file {self.cache_file}: {e}")
+            return {}
+
+        logger.info(f"Loaded {len(entries)} cached entries from {self.cache_file}")
+        return entries
+
+    @staticmethod
+    def key(text: str) -> str:
+        """Build the cache key for a piece of text.
+
+        Args:
+            text: Text the cached response was generated from.
+
+        Returns:
+            Hex SHA-256 digest of the text.
+        """
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        """Look up a cached value.
+
+        Args:
+            key: Cache key from LLMCache.key.
+
+        Returns:
+            Cached value, or None on a miss.
+        """
+        return self._entries.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value in memory; call flush() to persist it.
+
+        Args:
+            key: Cache key from LLMCache.key.
+            value: JSON-serializable value.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write the cache to disk if anything changed since the last flush."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = orjson.dumps(self._entries)
+            self._dirty = False
+
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_file.write_bytes(data)
+        logger.info(f"Saved {len(self._entries)} cached entries to {self.cache_file}")
+
+
+class ResponseCache:
+    """Raw LLM response cache: in-memory LRU in front of a SQLite table.
+
+    Keyed by model, prompt and generation config, so any identical call is served
+    locally. The database is opened on first use. Safe to share across threads.
+    """
+
+    def __init__(
+        self,
+        db_file: Path = RESPONSE_CACHE_FILE,
+        memory_size: int = RESPONSE_CACHE_MEMORY_SIZE,
+    ) -> None:
+        """Initialize response cache.
+
+        Args:
+            db_file: SQLite database file.
+            memory_size: Maximum number of responses kept in memory.
+        """
+        self.db_file = db_file
+        self.memory_size = memory_size
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Open the database on first use. Caller must hold the lock.
+
+        Returns:
+            SQLite connection.
+        """
+        if self._conn is None:
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL, ts REAL NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def key(model_name: str, prompt: str, generation_config: dict | None = None) -> str:
+        """Build the cache key for an LLM call.
+
+        Args:
+            model_name: Model the prompt is sent to.
+            prompt: Prompt text.
+            generation_config: Generation config overrides for the call.
+
+        Returns:
+            Hex SHA-256 digest of the call's inputs.
+        """
+        config = orjson.dumps(generation_config or {}, option=orjson.OPT_SORT_KEYS)
+        digest = hashlib.sha256(model_name.encode("utf-8"))
+        digest.update(b"\0" + config + b"\0")
+        digest.update(prompt.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _remember(self, key: str, response: str) -> None:
+        """Insert into the in-memory LRU. Caller must hold the lock.
+
+        Args:
+            key: Cache key.
+            response: Response text.
+        """
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> str | None:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from ResponseCache.key.
+
+        Returns:
+            Cached response text, or None on a miss.
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+            row = (
+                self._connection()
+                .execute("SELECT response FROM responses WHERE key = ?", (key,))
+                .fetchone()
+            )
+            if row is None:
+                return None
+            self._remember(key, row[0])
+            return row[0]
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response in memory and on disk.
+
+        Args:
+            key: Cache key from ResponseCache.key.
+            response: Response text.
+        """
+        with self._lock:
+            self._remember(key, response)
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, ts) VALUES (?, ?, ?)",
+                (key, response, time.time()),
+            )
+            conn.commit()
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._lock:
+            self._memory.clear()
+            conn = self._connection()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+        logger.info(f"Cleared response cache {self.db_file}")
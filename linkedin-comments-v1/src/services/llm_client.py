@@ -1,29 +1,430 @@
 """LLM client service for Google Gemini integration."""
 
-import json
+import asyncio
+import atexit
+import functools
 import logging
 import os
+import random
 import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-import google.generativeai as genai
-from dotenv import load_dotenv
+import orjson
+from src.services.llm_cache import RESPONSE_CACHE_FILE, ResponseCache
+from src.services.rate_limiter import RateLimiter
 
 if TYPE_CHECKING:
-    pass
+    import google.generativeai as genai
+    import httpx
 
 logger = logging.getLogger(__name__)
 
-load_dotenv()
-
 DEFAULT_ANALYSIS_MODEL = "gemini-2.5-flash"
 DEFAULT_COMMENT_MODEL = "gemini-2.5-flash"
 MAX_RETRIES = 3
 INITIAL_BACKOFF = 1
+# Upper bound on a single retry wait, including server-suggested delays
+MAX_BACKOFF = 60
+# Random extra wait, as a fraction of the backoff, so concurrent callers that
+# failed together do not all retry at the same instant
+BACKOFF_JITTER = 0.25
+NUM_COMMENTS = 3
+_COMMENT_ERROR = "Error: Comment generation failed"
+# Input context window of the default models; oversize posts are truncated
+# client-side rather than rejected by the API after a full upload
+MAX_INPUT_TOKENS = 1_048_576
+INPUT_TOKEN_HEADROOM = 512
+# Client-side limits, overridable with GEMINI_RPM / GEMINI_TPM for other quota tiers
+DEFAULT_RPM = 1000
+DEFAULT_TPM = 1_000_000
+
+# Structured output: Gemini constrains responses to these schemas, so they are
+# always valid JSON of the expected shape and prompts need no format instructions
+ANALYSIS_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "summary": {"type": "STRING"},
+        "categories": {"type": "ARRAY", "items": {"type": "STRING"}},
+    },
+    "required": ["summary", "categories"],
+}
+# All comment variants come back from a single call as one JSON array
+COMMENT_SCHEMA = {"type": "ARRAY", "items": {"type": "STRING"}}
+ANALYSIS_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": ANALYSIS_SCHEMA,
+}
+COMMENT_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": COMMENT_SCHEMA,
+}
+# Analysis and comments from one call, saving the round-trip between the two
+COMBINED_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        **ANALYSIS_SCHEMA["properties"],
+        "comments": COMMENT_SCHEMA,
+    },
+    "required": ["summary", "categories", "comments"],
+}
+COMBINED_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": COMBINED_SCHEMA,
+}
 
 ANALYSIS_PROMPT_FILE = Path("src/lib/analysis_prompt.txt")
 COMMENT_PROMPT_FILE = Path("src/lib/comment_prompt.txt")
+COMBINED_PROMPT_FILE = Path("src/lib/combined_prompt.txt")
+
+# Built-in templates used when a prompt file is missing
+DEFAULT_ANALYSIS_PROMPT = """Analyze this LinkedIn post. Provide a one-sentence summary and 2-4 relevant categories (e.g., AI, Career Advice, Product Launch, Technology, Business).
+
+Post content:
+{post_content}"""
+
+DEFAULT_COMMENT_PROMPT = """Given a LinkedIn post, its summary, its categories, and my persona, generate 3 distinct comment suggestions. Make them authentic, valuable, and aligned with my voice. Avoid generic praise and strive for meaningful engagement.
+
+My persona:
+{persona}
+
+Return exactly 3 distinct comment suggestions.
+
+Post content:
+{post_content}
+
+Summary: {summary}
+Categories: {categories}"""
+
+DEFAULT_COMBINED_PROMPT = """Analyze a LinkedIn post and, given my persona, suggest comments on it. Provide a one-sentence summary, 2-4 relevant categories (e.g., AI, Career Advice, Product Launch, Technology, Business), and 3 distinct comment suggestions. Make the comments authentic, valuable, and aligned with my voice. Avoid generic praise and strive for meaningful engagement.
+
+My persona:
+{persona}
+
+Post content:
+{post_content}"""
+
+# Gemini Batch API (REST only; not exposed by google-generativeai)
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+GEMINI_DOWNLOAD_BASE = "https://generativelanguage.googleapis.com/download/v1beta"
+BATCH_DIR = Path("data/batches")
+BATCH_POLL_INITIAL = 10
+BATCH_POLL_MAX = 300
+BATCH_TIMEOUT = 24 * 60 * 60
+# Prompts are split into this many batch jobs by estimated size so short
+# requests are not held back by the longest ones in the same job
+BATCH_BINS = 3
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE = 50
+# Fan-out for synchronous callers; the SDK releases the GIL while waiting on the network
+DEFAULT_THREAD_WORKERS = 8
+
+
+@functools.lru_cache(maxsize=8)
+def _read_prompt_template(prompt_file: Path) -> str:
+    """Read a prompt template once per process.
+
+    Args:
+        prompt_file: Path to prompt template file.
+
+    Returns:
+        Prompt template string.
+
+    Raises:
+        FileNotFoundError: If prompt file doesn't exist.
+    """
+    if not prompt_file.exists():
+        raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
+
+    with prompt_file.open(encoding="utf-8") as f:
+        return f.read().strip()
+
+
+def _estimate_tokens(text: str) -> int:
+    """Cheaply estimate the token count of a prompt (~4 characters per token).
+
+    Args:
+        text: Prompt text.
+
+    Returns:
+        Estimated token count.
+    """
+    return len(text) // 4
+
+
+@functools.lru_cache(maxsize=1)
+def _retriable_errors() -> tuple[type[Exception], ...]:
+    """Return the transient failures worth retrying.
+
+    Anything else (bad key, invalid request, client bugs) is raised on the first
+    attempt. ValueError covers empty responses. google.api_core is imported here
+    rather than at module level because it pulls in grpc.
+
+    Returns:
+        Exception classes to retry.
+    """
+    from google.api_core import exceptions as google_exceptions
+
+    return (
+        google_exceptions.ResourceExhausted,
+        google_exceptions.TooManyRequests,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.DeadlineExceeded,
+        google_exceptions.InternalServerError,
+        ValueError,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _quota_errors() -> tuple[type[Exception], ...]:
+    """Return the rate-limit errors (ResourceExhausted over gRPC, TooManyRequests over REST).
+
+    Returns:
+        Exception classes signalling an exceeded quota.
+    """
+    from google.api_core import exceptions as google_exceptions
+
+    return (google_exceptions.ResourceExhausted, google_exceptions.TooManyRequests)
+
+
+def _retry_delay(error: Exception, backoff: float) -> float:
+    """Return how long to wait before retrying a failed LLM call.
+
+    Quota errors carry the server's suggested delay in a google.rpc.RetryInfo
+    detail or a Retry-After header; that is used when present, otherwise the
+    exponential backoff. Both get random jitter and are capped at MAX_BACKOFF.
+
+    Args:
+        error: Exception raised by the failed call.
+        backoff: Current exponential backoff in seconds.
+
+    Returns:
+        Delay in seconds.
+    """
+    delay = backoff
+    if isinstance(error, _quota_errors()):
+        for detail in getattr(error, "details", None) or []:
+            # gRPC transport yields RetryInfo messages, REST yields JSON dicts
+            retry_delay = getattr(detail, "retry_delay", None)
+            if retry_delay is not None:
+                delay = retry_delay.seconds + retry_delay.nanos / 1e9
+                break
+            if isinstance(detail, dict) and "retryDelay" in detail:
+                delay = float(str(detail["retryDelay"]).rstrip("s"))
+                break
+        else:
+            response = getattr(error, "response", None)
+            retry_after = getattr(response, "headers", {}).get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = float(retry_after)
+
+    return min(delay + random.uniform(0, delay * BACKOFF_JITTER), MAX_BACKOFF)
+
+
+def _fit_post_content(post_content: str, fixed_tokens: int) -> str:
+    """Truncate post content so the whole prompt fits within MAX_INPUT_TOKENS.
+
+    Args:
+        post_content: Post content text.
+        fixed_tokens: Estimated tokens of the rest of the prompt.
+
+    Returns:
+        Post content, truncated if the prompt would exceed the input limit.
+    """
+    budget = MAX_INPUT_TOKENS - INPUT_TOKEN_HEADROOM - fixed_tokens
+    if _estimate_tokens(post_content) <= budget:
+        return post_content
+
+    logger.warning(
+        "Post content (~%d tokens) exceeds the input limit, truncating to ~%d tokens",
+        _estimate_tokens(post_content),
+        budget,
+    )
+    return post_content[: max(budget, 0) * 4]
+
+
+@functools.lru_cache(maxsize=1)
+def _is_complete_analysis(response_text: str) -> bool:
+    """Check that an analysis response parses with every field present.
+
+    Args:
+        response_text: Raw LLM response text.
+
+    Returns:
+        True if the response is a JSON object with a summary and categories.
+    """
+    try:
+        analysis = orjson.loads(response_text)
+    except orjson.JSONDecodeError:
+        return False
+    return (
+        isinstance(analysis, dict)
+        and isinstance(analysis.get("summary"), str)
+        and isinstance(analysis.get("categories"), list)
+    )
+
+
+def _is_complete_comments(comments: Any) -> bool:
+    """Check that decoded comments need no padding.
+
+    Args:
+        comments: Comments decoded from a response.
+
+    Returns:
+        True if there are at least NUM_COMMENTS of them.
+    """
+    return isinstance(comments, list) and len(comments) >= NUM_COMMENTS
+
+
+def _is_complete_comment_response(response_text: str) -> bool:
+    """Check that a comment response parses into a full set of comments.
+
+    Args:
+        response_text: Raw LLM response text.
+
+    Returns:
+        True if the response is a JSON array of at least NUM_COMMENTS items.
+    """
+    try:
+        return _is_complete_comments(orjson.loads(response_text))
+    except orjson.JSONDecodeError:
+        return False
+
+
+def _is_complete_combined(response_text: str) -> bool:
+    """Check that a combined response parses with analysis and a full set of comments.
+
+    Args:
+        response_text: Raw LLM response text.
+
+    Returns:
+        True if the response has a summary, categories and NUM_COMMENTS comments.
+    """
+    try:
+        result = orjson.loads(response_text)
+    except orjson.JSONDecodeError:
+        return False
+    return (
+        isinstance(result, dict)
+        and isinstance(result.get("summary"), str)
+        and isinstance(result.get("categories"), list)
+        and _is_complete_comments(result.get("comments"))
+    )
+
+
+def _load_env() -> None:
+    """Load variables from .env into the environment once per process.
+
+    Deferred from import time, together with the Gemini SDK, so importing this
+    module (for its constants or in tests) stays cheap.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+@functools.lru_cache(maxsize=1)
+def _configure_genai(api_key: str) -> None:
+    """Configure the Gemini SDK once per process (and again only if the key changes).
+
+    Args:
+        api_key: Google API key.
+    """
+    import google.generativeai as genai
+
+    genai.configure(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=8)
+def _generative_model(model_name: str) -> "genai.GenerativeModel":
+    """Return the process-wide GenerativeModel for a model name.
+
+    Every LLMClient, and both tasks within one when they use the same model,
+    share the instance.
+
+    Args:
+        model_name: Gemini model name.
+
+    Returns:
+        Shared GenerativeModel.
+    """
+    import google.generativeai as genai
+
+    return genai.GenerativeModel(model_name)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_http_client() -> "httpx.Client":
+    """Return the process-wide HTTP client for Gemini REST calls.
+
+    One HTTP/2 connection pool is shared by every LLMClient so concurrent batch
+    submissions and polls multiplex over warm connections instead of each paying
+    TCP and TLS setup.
+
+    Returns:
+        Shared httpx client, closed automatically at interpreter exit.
+    """
+    import httpx
+
+    client = httpx.Client(
+        base_url=GEMINI_API_BASE,
+        http2=True,
+        timeout=httpx.Timeout(60.0, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+        ),
+    )
+    atexit.register(client.close)
+    return client
+
+
+class _JSONStringArrayParser:
+    """Incrementally extracts complete string items from a streamed JSON array."""
+
+    def __init__(self) -> None:
+        """Initialize parser state."""
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._collect = False
+        self._buffer: list[str] = []
+
+    def feed(self, text: str) -> list[str]:
+        """Consume the next chunk of response text.
+
+        Args:
+            text: Next chunk of the streamed JSON array.
+
+        Returns:
+            Top-level string items completed by this chunk.
+        """
+        items: list[str] = []
+        for ch in text:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._collect:
+                        items.append(orjson.loads('"' + "".join(self._buffer) + '"'))
+                        self._buffer = []
+                    continue
+                if self._collect:
+                    self._buffer.append(ch)
+            elif ch == '"':
+                self._in_string = True
+                self._collect = self._depth == 1
+            elif ch in "[{":
+                self._depth += 1
+            elif ch in "]}":
+                self._depth -= 1
+        return items
 
 
 class LLMClient:
@@ -35,6 +436,9 @@ class LLMClient:
         comment_model: str | None = None,
         analysis_prompt_file: Path | None = None,
         comment_prompt_file: Path | None = None,
+        combined_prompt_file: Path | None = None,
+        cache_enabled: bool = True,
+        cache_path: Path | None = None,
     ) -> None:
         """Initialize LLM client.
 
@@ -43,50 +447,174 @@ class LLMClient:
             comment_model: Model name for comment generation. Defaults to DEFAULT_COMMENT_MODEL.
             analysis_prompt_file: Path to analysis prompt file. Defaults to ANALYSIS_PROMPT_FILE.
             comment_prompt_file: Path to comment prompt file. Defaults to COMMENT_PROMPT_FILE.
+            combined_prompt_file: Path to combined analysis and comment prompt file.
+                Defaults to COMBINED_PROMPT_FILE.
+            cache_enabled: Serve identical calls (same model, prompt and config) from
+                the response cache instead of the API.
+            cache_path: Response cache database. Defaults to RESPONSE_CACHE_FILE.
         """
+        _load_env()
         api_key = os.getenv("GOOGLE_API_KEY")
         if not api_key:
             raise ValueError("GOOGLE_API_KEY not found in environment variables")
 
-        genai.configure(api_key=api_key)
+        _configure_genai(api_key)
+        self._http = _shared_http_client()
+        self._auth_headers = {"x-goog-api-key": api_key}
+        self.rpm = float(os.getenv("GEMINI_RPM", DEFAULT_RPM))
+        self._limiter = RateLimiter(
+            rpm=self.rpm,
+            tpm=float(os.getenv("GEMINI_TPM", DEFAULT_TPM)),
+        )
 
         self.analysis_model_name = analysis_model or DEFAULT_ANALYSIS_MODEL
         self.comment_model_name = comment_model or DEFAULT_COMMENT_MODEL
-        self.analysis_model = genai.GenerativeModel(self.analysis_model_name)
-        self.comment_model = genai.GenerativeModel(self.comment_model_name)
+        # Both tasks default to the same model, which then shares one instance
+        self.analysis_model = _generative_model(self.analysis_model_name)
+        self.comment_model = _generative_model(self.comment_model_name)
 
         self.analysis_prompt_file = analysis_prompt_file or ANALYSIS_PROMPT_FILE
         self.comment_prompt_file = comment_prompt_file or COMMENT_PROMPT_FILE
+        # Loaded once so building a prompt does no file I/O
+        self._analysis_template = self._load_prompt_template(
+            self.analysis_prompt_file, DEFAULT_ANALYSIS_PROMPT
+        )
+        self._comment_template = self._load_prompt_template(
+            self.comment_prompt_file, DEFAULT_COMMENT_PROMPT
+        )
+        self.combined_prompt_file = combined_prompt_file or COMBINED_PROMPT_FILE
+        self._combined_template = self._load_prompt_template(
+            self.combined_prompt_file, DEFAULT_COMBINED_PROMPT
+        )
+        self._analysis_template_tokens = _estimate_tokens(self._analysis_template)
+        self._comment_template_tokens = _estimate_tokens(self._comment_template)
+        self._combined_template_tokens = _estimate_tokens(self._combined_template)
+
+        self._response_cache = (
+            ResponseCache(cache_path or RESPONSE_CACHE_FILE) if cache_enabled else None
+        )
 
         logger.info(
-            f"Initialized LLM client - Analysis: {self.analysis_model_name}, "
-            f"Comments: {self.comment_model_name}"
+            "Initialized LLM client - Analysis: %s, Comments: %s",
+            self.analysis_model_name,
+            self.comment_model_name,
         )
 
-    def _load_prompt_template(self, prompt_file: Path) -> str:
-        """Load prompt template from file.
+    def clear_cache(self) -> None:
+        """Remove all cached LLM responses."""
+        if self._response_cache is not None:
+            self._response_cache.clear()
+
+    def _cached_response(
+        self, prompt: str, model: "genai.GenerativeModel", generation_config: dict | None
+    ) -> tuple[str | None, str | None]:
+        """Look up a previous response to an identical call.
+
+        Args:
+            prompt: Prompt text.
+            model: Generative model to use.
+            generation_config: Optional generation config overrides for this call.
+
+        Returns:
+            Tuple of (cached response or None, cache key or None if caching is off).
+        """
+        if self._response_cache is None:
+            return None, None
+        key = ResponseCache.key(model.model_name, prompt, generation_config)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            logger.debug("Serving LLM response from cache")
+        return cached, key
+
+    def _load_prompt_template(self, prompt_file: Path, default: str) -> str:
+        """Load prompt template from file, falling back to a built-in template.
 
         Args:
             prompt_file: Path to prompt template file.
+            default: Template to use if the file doesn't exist.
 
         Returns:
             Prompt template string.
+        """
+        try:
+            return _read_prompt_template(prompt_file)
+        except FileNotFoundError:
+            logger.warning("Prompt file not found: %s, using default", prompt_file)
+            return default
+
+    def _call_with_retry(
+        self,
+        prompt: str,
+        model: "genai.GenerativeModel",
+        generation_config: dict | None = None,
+        validate: Callable[[str], bool] | None = None,
+    ) -> str:
+        """Call LLM with retry logic and jittered exponential backoff.
+
+        Only _retriable_errors() are retried. Quota errors wait for the server-suggested
+        delay instead of the backoff (see _retry_delay).
+
+        Args:
+            prompt: Prompt text.
+            model: Generative model to use.
+            generation_config: Optional generation config overrides for this call.
+            validate: Check that the response is usable. Responses that fail it are
+                still returned but not cached, so a truncated or malformed response
+                is requested again on the next run instead of replayed.
+
+        Returns:
+            Response text.
 
         Raises:
-            FileNotFoundError: If prompt file doesn't exist.
+            Exception: If all retries fail.
         """
-        if not prompt_file.exists():
-            raise FileNotFoundError(f"Prompt file not found: {prompt_file}")
+        cached, cache_key = self._cached_response(prompt, model, generation_config)
+        if cached is not None:
+            return cached
+
+        last_exception = None
+        backoff = INITIAL_BACKOFF
+
+        for attempt in range(MAX_RETRIES):
+            try:
+                response = model.generate_content(prompt, generation_config=generation_config)
+                if not response.text:
+                    raise ValueError("Empty response from LLM")
+                if cache_key is not None and (validate is None or validate(response.text)):
+                    self._response_cache.set(cache_key, response.text)
+                return response.text
+            except Exception as e:
+                last_exception = e
+                if not isinstance(e, _retriable_errors()):
+                    logger.error("LLM call failed with non-retriable error: %s", e)
+                    raise
+                logger.warning("LLM call failed (attempt %d/%d): %s", attempt + 1, MAX_RETRIES, e)
+                if attempt < MAX_RETRIES - 1:
+                    time.sleep(_retry_delay(e, backoff))
+                    backoff *= 2
+                else:
+                    logger.error("All retries failed for LLM call")
+                    raise
 
-        with prompt_file.open(encoding="utf-8") as f:
-            return f.read().strip()
+        raise last_exception or Exception("Unknown error in LLM call")
 
-    def _call_with_retry(self, prompt: str, model: genai.GenerativeModel) -> str:
-        """Call LLM with retry logic and exponential backoff.
+    async def _acall_with_retry(
+        self,
+        prompt: str,
+        model: "genai.GenerativeModel",
+        generation_config: dict | None = None,
+        validate: Callable[[str], bool] | None = None,
+        on_latency: Callable[[float], None] | None = None,
+    ) -> str:
+        """Async variant of _call_with_retry.
 
         Args:
             prompt: Prompt text.
             model: Generative model to use.
+            generation_config: Optional generation config overrides for this call.
+            validate: Check that the response is usable; failures are not cached.
+            on_latency: Called with the seconds each API round-trip took, excluding
+                rate-limit waits. Not called for cache hits.
 
         Returns:
             Response text.
@@ -94,20 +622,41 @@ class LLMClient:
         Raises:
             Exception: If all retries fail.
         """
+        cached, cache_key = self._cached_response(prompt, model, generation_config)
+        if cached is not None:
+            return cached
+
         last_exception = None
         backoff = INITIAL_BACKOFF
 
+        estimated_tokens = _estimate_tokens(prompt)
+
         for attempt in range(MAX_RETRIES):
             try:
-                response = model.generate_content(prompt)
+                await self._limiter.acquire(estimated_tokens)
+                start = time.monotonic()
+                response = await model.generate_content_async(
+                    prompt, generation_config=generation_config
+                )
+                if on_latency is not None:
+                    on_latency(time.monotonic() - start)
                 if not response.text:
                     raise ValueError("Empty response from LLM")
+                if cache_key is not None and (validate is None or validate(response.text)):
+                    self._response_cache.set(cache_key, response.text)
                 return response.text
             except Exception as e:
                 last_exception = e
-                logger.warning(f"LLM call failed (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
+                if not isinstance(e, _retriable_errors()):
+                    logger.error("LLM call failed with non-retriable error: %s", e)
+                    raise
+                logger.warning("LLM call failed (attempt %d/%d): %s", attempt + 1, MAX_RETRIES, e)
+                delay = _retry_delay(e, backoff)
+                if isinstance(e, _quota_errors()):
+                    # Over quota despite client-side limiting; hold off every caller
+                    self._limiter.pause(delay)
                 if attempt < MAX_RETRIES - 1:
-                    time.sleep(backoff)
+                    await asyncio.sleep(delay)
                     backoff *= 2
                 else:
                     logger.error("All retries failed for LLM call")
@@ -115,6 +664,43 @@ class LLMClient:
 
         raise last_exception or Exception("Unknown error in LLM call")
 
+    def build_analysis_prompt(self, post_content: str) -> str:
+        """Build the post analysis prompt.
+
+        Args:
+            post_content: Post content text.
+
+        Returns:
+            Prompt text.
+        """
+        post_content = _fit_post_content(post_content, self._analysis_template_tokens)
+        return self._analysis_template.format(post_content=post_content)
+
+    def parse_analysis(self, response_text: str) -> dict[str, str | list[str]]:
+        """Parse an analysis response.
+
+        The response schema guarantees the structure; only truncated or blocked
+        responses fail to parse.
+
+        Args:
+            response_text: Raw LLM response text.
+
+        Returns:
+            Dictionary with 'summary' and 'categories' keys.
+
+        Raises:
+            orjson.JSONDecodeError: If the response is not valid JSON (a subclass of
+                json.JSONDecodeError).
+        """
+        try:
+            analysis = orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            logger.debug("Response text: %s", response_text)
+            raise
+
+        logger.debug("Post analyzed: %.50s...", analysis["summary"])
+        return analysis
+
     def analyze_post(self, post_content: str) -> dict[str, str | list[str]]:
         """Analyze a LinkedIn post and extract summary and categories.
 
@@ -124,64 +710,133 @@ class LLMClient:
         Returns:
             Dictionary with 'summary' and 'categories' keys.
         """
+        prompt = self.build_analysis_prompt(post_content)
+
         try:
-            prompt_template = self._load_prompt_template(self.analysis_prompt_file)
-            prompt = prompt_template.format(post_content=post_content)
-        except FileNotFoundError:
-            # Fallback to default prompt if file not found
-            logger.warning(f"Prompt file not found: {self.analysis_prompt_file}, using default")
-            prompt = f"""Analyze this LinkedIn post. Provide a one-sentence summary and 2-4 relevant categories (e.g., AI, Career Advice, Product Launch, Technology, Business).
+            response_text = self._call_with_retry(
+                prompt, self.analysis_model, ANALYSIS_GENERATION_CONFIG, _is_complete_analysis
+            )
+            return self.parse_analysis(response_text)
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse JSON response: %s", e)
+            return {"summary": "Error: Failed to parse analysis", "categories": []}
+        except Exception as e:
+            logger.error("Error analyzing post: %s", e)
+            return {"summary": f"Error: {str(e)}", "categories": []}
 
-Post content:
-{post_content}
+    async def analyze_post_async(
+        self, post_content: str, on_latency: Callable[[float], None] | None = None
+    ) -> dict[str, str | list[str]]:
+        """Analyze a post without blocking the event loop.
 
-Return JSON format:
-{{
-  "summary": "One-sentence summary of the post",
-  "categories": ["Category1", "Category2", "Category3"]
-}}
+        Args:
+            post_content: Post content text.
+            on_latency: Called with the duration of each API round-trip (see
+                _acall_with_retry), e.g. to tune concurrency.
 
-Only return the JSON, no additional text."""
+        Returns:
+            Dictionary with 'summary' and 'categories' keys.
+        """
+        prompt = self.build_analysis_prompt(post_content)
 
         try:
-            response_text = self._call_with_retry(prompt, self.analysis_model)
-            # Try to extract JSON from response
-            response_text = response_text.strip()
+            response_text = await self._acall_with_retry(
+                prompt,
+                self.analysis_model,
+                ANALYSIS_GENERATION_CONFIG,
+                _is_complete_analysis,
+                on_latency,
+            )
+            return self.parse_analysis(response_text)
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse JSON response: %s", e)
+            return {"summary": "Error: Failed to parse analysis", "categories": []}
+        except Exception as e:
+            logger.error("Error analyzing post: %s", e)
+            return {"summary": f"Error: {str(e)}", "categories": []}
+
+    def build_comment_prompt(
+        self,
+        post_content: str,
+        summary: str,
+        categories: str | list[str],
+        persona: str,
+    ) -> str:
+        """Build the comment generation prompt.
 
-            # Remove markdown code blocks if present
-            if response_text.startswith("```"):
-                lines = response_text.split("\n")
-                response_text = "\n".join(lines[1:-1]) if len(lines) > 2 else response_text
+        The persona and static instructions come first so every prompt shares a
+        byte-identical prefix, which Gemini's implicit context caching bills at a
+        discount. Post-specific fields go last.
 
-            # Parse JSON
-            analysis = json.loads(response_text)
+        Args:
+            post_content: Original post content.
+            summary: Post summary.
+            categories: Post categories, or an already comma-joined string.
+            persona: User persona text.
 
-            # Validate structure
-            if "summary" not in analysis or "categories" not in analysis:
-                raise ValueError("Invalid response structure")
+        Returns:
+            Prompt text.
+        """
+        categories_str = categories if isinstance(categories, str) else ", ".join(categories)
+        post_content = _fit_post_content(
+            post_content,
+            self._comment_template_tokens
+            + _estimate_tokens(persona)
+            + _estimate_tokens(summary)
+            + _estimate_tokens(categories_str),
+        )
+        return self._comment_template.format(
+            post_content=post_content,
+            summary=summary,
+            categories=categories_str,
+            persona=persona,
+        )
 
-            if not isinstance(analysis["summary"], str):
-                raise ValueError("Summary must be a string")
+    def parse_comments(self, response_text: str) -> list[str]:
+        """Parse an LLM response into exactly 3 comments.
 
-            if not isinstance(analysis["categories"], list):
-                raise ValueError("Categories must be a list")
+        Args:
+            response_text: Raw response text.
 
-            logger.debug(f"Post analyzed: {analysis['summary'][:50]}...")
-            return analysis
+        Returns:
+            List of comment suggestions (3 comments).
+        """
+        try:
+            comments = orjson.loads(response_text)
+        except orjson.JSONDecodeError as e:
+            logger.error("Failed to parse JSON response: %s", e)
+            logger.debug("Response text: %s", response_text)
+            return [
+                "Error: Failed to generate comments",
+                "Error: Failed to generate comments",
+                "Error: Failed to generate comments",
+            ]
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.debug(f"Response text: {response_text}")
-            return {"summary": "Error: Failed to parse analysis", "categories": []}
-        except Exception as e:
-            logger.error(f"Error analyzing post: {e}")
-            return {"summary": f"Error: {str(e)}", "categories": []}
+        return self._normalize_comments(comments)
+
+    def _normalize_comments(self, comments: list) -> list[str]:
+        """Trim or pad decoded comments to exactly NUM_COMMENTS strings.
+
+        Args:
+            comments: Comments decoded from a response.
+
+        Returns:
+            List of comment suggestions (3 comments).
+        """
+        if len(comments) != NUM_COMMENTS:
+            logger.warning("Expected %d comments, got %d", NUM_COMMENTS, len(comments))
+
+        # Ensure we have exactly 3 comments so callers can index comments[0..2]
+        comments = [str(c) for c in (comments + [_COMMENT_ERROR] * NUM_COMMENTS)[:NUM_COMMENTS]]
+
+        logger.debug("Generated %d comments", len(comments))
+        return comments
 
     def generate_comments(
         self,
         post_content: str,
         summary: str,
-        categories: list[str],
+        categories: str | list[str],
         persona: str,
     ) -> list[str]:
         """Generate comment suggestions for a post.
@@ -189,84 +844,539 @@ Only return the JSON, no additional text."""
         Args:
             post_content: Original post content.
             summary: Post summary.
-            categories: Post categories.
+            categories: Post categories, or an already comma-joined string.
             persona: User persona text.
 
         Returns:
             List of comment suggestions (3 comments).
         """
-        categories_str = ", ".join(categories)
+        prompt = self.build_comment_prompt(post_content, summary, categories, persona)
+
         try:
-            prompt_template = self._load_prompt_template(self.comment_prompt_file)
-            prompt = prompt_template.format(
-                post_content=post_content,
-                summary=summary,
-                categories=categories_str,
-                persona=persona,
+            response_text = self._call_with_retry(
+                prompt, self.comment_model, COMMENT_GENERATION_CONFIG, _is_complete_comment_response
             )
-        except FileNotFoundError:
-            # Fallback to default prompt if file not found
-            logger.warning(f"Prompt file not found: {self.comment_prompt_file}, using default")
-            prompt = f"""Given this LinkedIn post, summary, categories, and my persona, generate 3 distinct comment suggestions. Make them authentic, valuable, and aligned with my voice. Avoid generic praise and strive for meaningful engagement.
+            return self.parse_comments(response_text)
+        except Exception as e:
+            logger.error("Error generating comments: %s", e)
+            return [
+                f"Error: {str(e)}",
+                f"Error: {str(e)}",
+                f"Error: {str(e)}",
+            ]
 
-Post content:
-{post_content}
+    async def agenerate_comments(
+        self,
+        post_content: str,
+        summary: str,
+        categories: str | list[str],
+        persona: str,
+    ) -> list[str]:
+        """Generate comment suggestions for a post without blocking the event loop.
 
-Summary: {summary}
-Categories: {categories_str}
+        Args:
+            post_content: Original post content.
+            summary: Post summary.
+            categories: Post categories, or an already comma-joined string.
+            persona: User persona text.
 
-My persona:
-{persona}
+        Returns:
+            List of comment suggestions (3 comments).
+        """
+        prompt = self.build_comment_prompt(post_content, summary, categories, persona)
 
-Return JSON array of exactly 3 comment strings:
-["Comment 1", "Comment 2", "Comment 3"]
+        try:
+            response_text = await self._acall_with_retry(
+                prompt, self.comment_model, COMMENT_GENERATION_CONFIG, _is_complete_comment_response
+            )
+            return self.parse_comments(response_text)
+        except Exception as e:
+            logger.error("Error generating comments: %s", e)
+            return [
+                f"Error: {str(e)}",
+                f"Error: {str(e)}",
+                f"Error: {str(e)}",
+            ]
 
-Only return the JSON array, no additional text."""
+    def build_combined_prompt(self, post_content: str, persona: str) -> str:
+        """Build the prompt that asks for the analysis and comments together.
 
+        Args:
+            post_content: Original post content.
+            persona: User persona text.
+
+        Returns:
+            Prompt text.
+        """
+        post_content = _fit_post_content(
+            post_content, self._combined_template_tokens + _estimate_tokens(persona)
+        )
+        return self._combined_template.format(post_content=post_content, persona=persona)
+
+    def parse_combined(self, response_text: str) -> tuple[dict[str, str | list[str]], list[str]]:
+        """Parse a combined analysis and comments response.
+
+        Args:
+            response_text: Raw LLM response text.
+
+        Returns:
+            Tuple of (analysis with 'summary' and 'categories' keys, 3 comments).
+
+        Raises:
+            orjson.JSONDecodeError: If the response is not valid JSON (a subclass of
+                json.JSONDecodeError).
+        """
         try:
-            response_text = self._call_with_retry(prompt, self.comment_model)
-            # Try to extract JSON from response
-            response_text = response_text.strip()
+            result = orjson.loads(response_text)
+        except orjson.JSONDecodeError:
+            logger.debug("Response text: %s", response_text)
+            raise
 
-            # Remove markdown code blocks if present
-            if response_text.startswith("```"):
-                lines = response_text.split("\n")
-                response_text = "\n".join(lines[1:-1]) if len(lines) > 2 else response_text
+        analysis = {"summary": result["summary"], "categories": result["categories"]}
+        return analysis, self._normalize_comments(result["comments"])
 
-            # Parse JSON
-            comments = json.loads(response_text)
+    def analyze_and_comment(
+        self, post_content: str, persona: str
+    ) -> tuple[dict[str, str | list[str]], list[str]]:
+        """Analyze a post and generate comment suggestions in a single LLM call.
 
-            # Validate structure
-            if not isinstance(comments, list):
-                raise ValueError("Response must be a list")
+        Halves the round-trips of analyze_post followed by generate_comments, at the
+        cost of the comments not being conditioned on a separately produced analysis.
 
-            if len(comments) != 3:
-                logger.warning(f"Expected 3 comments, got {len(comments)}")
+        Args:
+            post_content: Original post content.
+            persona: User persona text.
 
-            # Ensure we have exactly 3 comments
-            while len(comments) < 3:
-                comments.append("Error: Comment generation failed")
+        Returns:
+            Tuple of (analysis with 'summary' and 'categories' keys, 3 comments).
+        """
+        prompt = self.build_combined_prompt(post_content, persona)
 
-            comments = comments[:3]  # Take first 3
+        try:
+            response_text = self._call_with_retry(
+                prompt, self.comment_model, COMBINED_GENERATION_CONFIG, _is_complete_combined
+            )
+            return self.parse_combined(response_text)
+        except Exception as e:
+            logger.error("Error analyzing and commenting on post: %s", e)
+            return (
+                {"summary": f"Error: {str(e)}", "categories": []},
+                [f"Error: {str(e)}", f"Error: {str(e)}", f"Error: {str(e)}"],
+            )
 
-            logger.debug(f"Generated {len(comments)} comments")
-            return comments
+    async def aanalyze_and_comment(
+        self, post_content: str, persona: str
+    ) -> tuple[dict[str, str | list[str]], list[str]]:
+        """Async variant of analyze_and_comment.
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.debug(f"Response text: {response_text}")
-            return [
-                "Error: Failed to generate comments",
-                "Error: Failed to generate comments",
-                "Error: Failed to generate comments",
-            ]
+        Args:
+            post_content: Original post content.
+            persona: User persona text.
+
+        Returns:
+            Tuple of (analysis with 'summary' and 'categories' keys, 3 comments).
+        """
+        prompt = self.build_combined_prompt(post_content, persona)
+
+        try:
+            response_text = await self._acall_with_retry(
+                prompt, self.comment_model, COMBINED_GENERATION_CONFIG, _is_complete_combined
+            )
+            return self.parse_combined(response_text)
         except Exception as e:
-            logger.error(f"Error generating comments: {e}")
-            return [
-                f"Error: {str(e)}",
-                f"Error: {str(e)}",
-                f"Error: {str(e)}",
-            ]
+            logger.error("Error analyzing and commenting on post: %s", e)
+            return (
+                {"summary": f"Error: {str(e)}", "categories": []},
+                [f"Error: {str(e)}", f"Error: {str(e)}", f"Error: {str(e)}"],
+            )
+
+    def stream_comments(
+        self,
+        post_content: str,
+        summary: str,
+        categories: str | list[str],
+        persona: str,
+    ) -> Iterator[str]:
+        """Stream comment suggestions, yielding each one as soon as it is fully decoded.
+
+        Lets interactive callers show the first comment while the rest are still
+        being generated. Unlike generate_comments this does not retry, cache, pad or
+        swallow errors; callers decide how to recover from a partial stream.
+
+        Args:
+            post_content: Original post content.
+            summary: Post summary.
+            categories: Post categories, or an already comma-joined string.
+            persona: User persona text.
+
+        Yields:
+            Comment suggestions in response order.
+        """
+        prompt = self.build_comment_prompt(post_content, summary, categories, persona)
+        parser = _JSONStringArrayParser()
+
+        response = self.comment_model.generate_content(
+            prompt, generation_config=COMMENT_GENERATION_CONFIG, stream=True
+        )
+        for chunk in response:
+            try:
+                text = chunk.text
+            except ValueError:
+                # Chunks carrying only finish metadata have no text parts
+                continue
+            yield from parser.feed(text)
+
+    async def astream_comments(
+        self,
+        post_content: str,
+        summary: str,
+        categories: str | list[str],
+        persona: str,
+    ) -> AsyncIterator[str]:
+        """Stream comment suggestions, yielding each one as soon as it is fully decoded.
+
+        Unlike agenerate_comments this does not retry, pad or swallow errors; callers
+        decide how to recover from a partial stream.
+
+        Args:
+            post_content: Original post content.
+            summary: Post summary.
+            categories: Post categories, or an already comma-joined string.
+            persona: User persona text.
+
+        Yields:
+            Comment suggestions in response order.
+        """
+        prompt = self.build_comment_prompt(post_content, summary, categories, persona)
+        parser = _JSONStringArrayParser()
+
+        await self._limiter.acquire(_estimate_tokens(prompt))
+        response = await self.comment_model.generate_content_async(
+            prompt, generation_config=COMMENT_GENERATION_CONFIG, stream=True
+        )
+        async for chunk in response:
+            try:
+                text = chunk.text
+            except ValueError:
+                # Chunks carrying only finish metadata have no text parts
+                continue
+            for comment in parser.feed(text):
+                yield comment
+
+    def analyze_posts(
+        self, post_contents: list[str], max_workers: int = DEFAULT_THREAD_WORKERS
+    ) -> list[dict[str, str | list[str]]]:
+        """Analyze many posts in parallel threads, for callers without an event loop.
+
+        Args:
+            post_contents: Post content texts.
+            max_workers: Maximum number of concurrent LLM calls.
+
+        Returns:
+            Analysis dictionaries in input order.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.analyze_post, post_contents))
+
+    def generate_comments_many(
+        self,
+        requests: list[dict[str, Any]],
+        persona: str,
+        max_workers: int = DEFAULT_THREAD_WORKERS,
+    ) -> list[list[str]]:
+        """Generate comments for many posts in parallel threads.
+
+        Args:
+            requests: generate_comments keyword arguments (post_content, summary,
+                categories) for each post.
+            persona: User persona text.
+            max_workers: Maximum number of concurrent LLM calls.
+
+        Returns:
+            Comment suggestions (3 comments each) in input order.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda fields: self.generate_comments(persona=persona, **fields), requests
+                )
+            )
+
+    def _write_batch_file(
+        self,
+        prompts: dict[str, str],
+        name: str,
+        generation_config: dict | None = None,
+    ) -> Path:
+        """Write prompts to a Batch API JSONL input file.
+
+        Args:
+            prompts: Mapping of request key to prompt text.
+            name: Base name for the batch file.
+            generation_config: Optional generation config applied to every request.
+
+        Returns:
+            Path to the written JSONL file.
+        """
+        BATCH_DIR.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
+        batch_file = BATCH_DIR / f"{name}_{timestamp}.jsonl"
+
+        with batch_file.open("wb") as f:
+            for key, prompt in prompts.items():
+                request: dict[str, Any] = {
+                    "contents": [{"role": "user", "parts": [{"text": prompt}]}]
+                }
+                if generation_config:
+                    request["generation_config"] = generation_config
+                line = {"key": key, "request": request}
+                f.write(orjson.dumps(line, option=orjson.OPT_APPEND_NEWLINE))
+
+        logger.info("Wrote %d batch requests to %s", len(prompts), batch_file)
+        return batch_file
+
+    def submit_batch(
+        self,
+        prompts: dict[str, str],
+        model_name: str,
+        name: str = "batch",
+        generation_config: dict | None = None,
+    ) -> str:
+        """Submit prompts as a Gemini Batch API job.
+
+        Args:
+            prompts: Mapping of request key to prompt text.
+            model_name: Model to run the batch against.
+            name: Display name for the batch job and its input file.
+            generation_config: Optional generation config applied to every request.
+
+        Returns:
+            Batch job name (e.g. "batches/123").
+        """
+        import google.generativeai as genai
+
+        batch_file = self._write_batch_file(prompts, name, generation_config)
+        uploaded = genai.upload_file(batch_file, mime_type="application/jsonl")
+
+        response = self._http.post(
+            f"/models/{model_name}:batchGenerateContent",
+            json={
+                "batch": {
+                    "display_name": batch_file.stem,
+                    "input_config": {"file_name": uploaded.name},
+                }
+            },
+            headers=self._auth_headers,
+        )
+        response.raise_for_status()
+        batch_name = response.json()["name"]
+
+        logger.info("Submitted batch %s with %d requests", batch_name, len(prompts))
+        return batch_name
+
+    def wait_for_batch(self, batch_name: str) -> dict[str, str]:
+        """Poll a batch job until it finishes and download its results.
+
+        Args:
+            batch_name: Batch job name returned by submit_batch.
+
+        Returns:
+            Mapping of request key to response text. Failed requests are omitted.
+
+        Raises:
+            RuntimeError: If the batch fails, is cancelled, or times out.
+        """
+        start_time = time.monotonic()
+        delay = BATCH_POLL_INITIAL
+
+        while True:
+            response = self._http.get(f"/{batch_name}", headers=self._auth_headers)
+            response.raise_for_status()
+            batch = response.json()
+            state = batch.get("metadata", {}).get("state", "")
+
+            if batch.get("done") or state.endswith(("SUCCEEDED", "FAILED", "CANCELLED", "EXPIRED")):
+                break
+
+            if time.monotonic() - start_time > BATCH_TIMEOUT:
+                raise RuntimeError(f"Batch {batch_name} did not finish within {BATCH_TIMEOUT}s")
+
+            logger.info(
+                "Batch %s is %s, checking again in %ss", batch_name, state or "pending", delay
+            )
+            time.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_MAX)
+
+        if not state.endswith("SUCCEEDED"):
+            raise RuntimeError(f"Batch {batch_name} finished with state {state}")
+
+        responses_file = batch.get("response", {}).get("responsesFile")
+        if not responses_file:
+            raise RuntimeError(f"Batch {batch_name} has no responses file")
+
+        download = self._http.get(
+            f"{GEMINI_DOWNLOAD_BASE}/{responses_file}:download",
+            params={"alt": "media"},
+            headers=self._auth_headers,
+        )
+        download.raise_for_status()
+
+        results: dict[str, str] = {}
+        for line in download.text.splitlines():
+            if not line.strip():
+                continue
+            item = orjson.loads(line)
+            key = item.get("key")
+            if "error" in item:
+                logger.warning("Batch request %s failed: %s", key, item["error"])
+                continue
+            try:
+                parts = item["response"]["candidates"][0]["content"]["parts"]
+                results[key] = "".join(part.get("text", "") for part in parts)
+            except (KeyError, IndexError) as e:
+                logger.warning("Batch request %s returned no text: %s", key, e)
+
+        logger.info("Batch %s returned %d responses", batch_name, len(results))
+        return results
+
+    def _bin_prompts(self, prompts: dict[str, str], num_bins: int) -> list[dict[str, str]]:
+        """Split prompts into bins of similar estimated token count.
+
+        Args:
+            prompts: Mapping of request key to prompt text.
+            num_bins: Maximum number of bins.
+
+        Returns:
+            Non-empty prompt mappings, shortest prompts first.
+        """
+        if not prompts:
+            return []
+
+        # ~4 characters per token is close enough for ordering
+        ordered = sorted(prompts.items(), key=lambda item: _estimate_tokens(item[1]))
+        num_bins = max(1, min(num_bins, len(ordered)))
+        size = -(-len(ordered) // num_bins)  # ceiling division
+        return [dict(ordered[i : i + size]) for i in range(0, len(ordered), size)]
+
+    def run_batch(
+        self,
+        prompts: dict[str, str],
+        model_name: str,
+        name: str = "batch",
+        generation_config: dict | None = None,
+        num_bins: int = BATCH_BINS,
+    ) -> dict[str, str]:
+        """Run prompts through the Batch API as size-binned jobs and merge the results.
+
+        Args:
+            prompts: Mapping of request key to prompt text.
+            model_name: Model to run the batch against.
+            name: Base name for the batch jobs.
+            generation_config: Optional generation config applied to every request.
+            num_bins: Number of jobs to split the prompts into.
+
+        Returns:
+            Mapping of request key to response text. Failed requests are omitted.
+        """
+        bins = self._bin_prompts(prompts, num_bins)
+        if not bins:
+            return {}
+
+        def run_bin(index: int, bin_prompts: dict[str, str]) -> dict[str, str]:
+            batch_name = self.submit_batch(
+                bin_prompts, model_name, f"{name}-bin{index}", generation_config
+            )
+            return self.wait_for_batch(batch_name)
+
+        responses: dict[str, str] = {}
+        with ThreadPoolExecutor(max_workers=len(bins)) as executor:
+            futures = [executor.submit(run_bin, i, b) for i, b in enumerate(bins)]
+            for future in futures:
+                responses.update(future.result())
+
+        return responses
+
+    def analyze_posts_batch(self, post_contents: dict[str, str]) -> dict[str, dict]:
+        """Analyze many posts via the Batch API.
+
+        Args:
+            post_contents: Mapping of request key to post content.
+
+        Returns:
+            Mapping of request key to analysis ('summary' and 'categories').
+        """
+        prompts = {
+            key: self.build_analysis_prompt(content) for key, content in post_contents.items()
+        }
+        responses = self.run_batch(
+            prompts,
+            self.analysis_model_name,
+            name="analysis",
+            generation_config=ANALYSIS_GENERATION_CONFIG,
+        )
+
+        results: dict[str, dict] = {}
+        for key in post_contents:
+            response_text = responses.get(key)
+            if response_text is None:
+                results[key] = {"summary": "Error: No batch response", "categories": []}
+                continue
+
+            try:
+                results[key] = self.parse_analysis(response_text)
+            except orjson.JSONDecodeError as e:
+                logger.error("Failed to parse JSON response for %s: %s", key, e)
+                results[key] = {"summary": "Error: Failed to parse analysis", "categories": []}
+            except Exception as e:
+                logger.error("Error analyzing post %s: %s", key, e)
+                results[key] = {"summary": f"Error: {str(e)}", "categories": []}
+
+        return results
+
+    def generate_comments_batch(
+        self,
+        requests: dict[str, dict[str, Any]],
+        persona: str,
+    ) -> dict[str, list[str]]:
+        """Generate comment suggestions for many posts via the Batch API.
+
+        Args:
+            requests: Mapping of request key to generate_comments keyword arguments
+                (post_content, summary, categories).
+            persona: User persona text.
+
+        Returns:
+            Mapping of request key to comment suggestions (3 comments each).
+        """
+        prompts = {
+            key: self.build_comment_prompt(persona=persona, **fields)
+            for key, fields in requests.items()
+        }
+        responses = self.run_batch(
+            prompts,
+            self.comment_model_name,
+            name="comments",
+            generation_config=COMMENT_GENERATION_CONFIG,
+        )
+
+        results: dict[str, list[str]] = {}
+        for key in requests:
+            response_text = responses.get(key)
+            if response_text is None:
+                results[key] = [
+                    "Error: No batch response",
+                    "Error: No batch response",
+                    "Error: No batch response",
+                ]
+                continue
+
+            try:
+                results[key] = self.parse_comments(response_text)
+            except Exception as e:
+                logger.error("Error generating comments for %s: %s", key, e)
+                results[key] = [f"Error: {str(e)}", f"Error: {str(e)}", f"Error: {str(e)}"]
+
+        return results
 
 
 if __name__ == "__main__":
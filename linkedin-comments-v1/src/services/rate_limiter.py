@@ -0,0 +1,173 @@
+"""Client-side token-bucket rate limiting for LLM calls."""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Async token bucket that refills continuously at a per-minute rate.
+
+    Callers reserve capacity up front, so waiters are served in arrival order and
+    no lock is needed on a single event loop. The bucket holds no loop-bound state
+    and can be reused across asyncio.run calls.
+    """
+
+    def __init__(self, per_minute: float) -> None:
+        """Initialize token bucket.
+
+        Args:
+            per_minute: Capacity refilled per minute; also the burst size.
+        """
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the capacity accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until the requested capacity is available and consume it.
+
+        Args:
+            amount: Capacity to consume. Amounts above the bucket size are clamped
+                so oversized requests still go through once the bucket is full.
+        """
+        self._refill()
+        self._tokens -= min(amount, self.capacity)
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Drain the bucket so no new calls start for roughly the given time.
+
+        Used when the provider reports a rate-limit error despite client-side limiting.
+
+        Args:
+            seconds: Time to hold off new calls.
+        """
+        self._refill()
+        self._tokens = min(self._tokens, -seconds * self.rate)
+        logger.info(f"Rate limiter paused for {seconds:.1f}s")
+
+
+class RateLimiter:
+    """Combined requests-per-minute and tokens-per-minute limiter."""
+
+    def __init__(self, rpm: float, tpm: float) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            rpm: Maximum requests per minute.
+            tpm: Maximum (estimated) input tokens per minute.
+        """
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Wait for one request slot and the estimated token budget.
+
+        Args:
+            estimated_tokens: Estimated token count of the request.
+        """
+        await self.requests.acquire(1)
+        await self.tokens.acquire(estimated_tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Hold off new requests after a provider rate-limit error.
+
+        Args:
+            seconds: Time to hold off new calls.
+        """
+        self.requests.pause(seconds)
+
+
+class AdaptiveConcurrency:
+    """Async concurrency limit that retunes itself from observed call latency.
+
+    Starts at an initial limit; once enough calls have completed, resizes to the
+    concurrency needed to sustain the request rate (rate x latency, Little's law),
+    clamped to [min_limit, max_limit]. Callers hold a slot with ``async with
+    limiter.slot():`` and report the latency of each network round-trip with
+    ``record``; time spent on cache hits or rate-limit waits is not latency.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        rpm: float | None = None,
+        sample_size: int = 3,
+        min_limit: int = 4,
+        max_limit: int = 64,
+    ) -> None:
+        """Initialize concurrency limit.
+
+        Args:
+            initial: Limit used until the first sample_size calls are recorded.
+            rpm: Target requests per minute. If None, the limit stays at initial.
+            sample_size: Recorded calls to average before retuning.
+            min_limit: Lower bound for the tuned limit.
+            max_limit: Upper bound for the tuned limit.
+        """
+        self.limit = initial
+        self.rpm = rpm
+        self.sample_size = sample_size
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._sem = asyncio.Semaphore(initial)
+        self._latencies: list[float] = []
+        # Slots to retire instead of releasing after a downward retune
+        self._excess = 0
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one concurrency slot for the duration of a call.
+
+        Yields:
+            None once a slot is free.
+        """
+        await self._sem.acquire()
+        try:
+            yield
+        finally:
+            if self._excess > 0:
+                self._excess -= 1
+            else:
+                self._sem.release()
+
+    def record(self, latency: float) -> None:
+        """Collect a latency sample and retune once enough have been seen.
+
+        Args:
+            latency: Seconds one network round-trip took.
+        """
+        if self.rpm is None or len(self._latencies) >= self.sample_size:
+            return
+
+        self._latencies.append(latency)
+        if len(self._latencies) < self.sample_size:
+            return
+
+        avg_latency = sum(self._latencies) / len(self._latencies)
+        target = int(self.rpm / 60 * avg_latency)
+        target = max(self.min_limit, min(self.max_limit, target))
+
+        if target > self.limit:
+            for _ in range(target - self.limit):
+                self._sem.release()
+        else:
+            self._excess += self.limit - target
+
+        logger.info(
+            f"Concurrency tuned from {self.limit} to {target} "
+            f"(avg latency {avg_latency:.2f}s at {self.rpm:.0f} RPM)"
+        )
+        self.limit = target
@@ -0,0 +1,165 @@
+"""Embedding-similarity cache for LLM responses to near-duplicate texts.
+
+Requires the optional ``semantic`` extra (sentence-transformers, faiss-cpu);
+callers should check SemanticCache.is_available() first.
+"""
+
+import functools
+import importlib.util
+import logging
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+if TYPE_CHECKING:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDINGS_INDEX_FILE = Path("data/cache/embeddings.faiss")
+EMBEDDINGS_ENTRIES_FILE = Path("data/cache/embeddings.json")
+SIMILARITY_THRESHOLD = 0.92
+
+
+@functools.lru_cache(maxsize=1)
+def _embedding_model() -> "SentenceTransformer":
+    """Return the process-wide sentence embedding model, loading it on first use.
+
+    Returns:
+        Shared SentenceTransformer instance.
+    """
+    from sentence_transformers import SentenceTransformer
+
+    logger.info(f"Loading embedding model {EMBEDDING_MODEL}")
+    return SentenceTransformer(EMBEDDING_MODEL)
+
+
+class SemanticCache:
+    """Nearest-neighbour cache over L2-normalized text embeddings.
+
+    Vectors live in a FAISS inner-product index (cosine similarity on normalized
+    vectors) with a parallel list of (content hash, value) entries. The model and
+    index are loaded on first lookup, and changes are persisted only on flush().
+    """
+
+    def __init__(
+        self,
+        index_file: Path = EMBEDDINGS_INDEX_FILE,
+        entries_file: Path = EMBEDDINGS_ENTRIES_FILE,
+        threshold: float = SIMILARITY_THRESHOLD,
+    ) -> None:
+        """Initialize semantic cache.
+
+        Args:
+            index_file: FAISS index file.
+            entries_file: JSON file with the (hash, value) entry for each vector.
+            threshold: Minimum cosine similarity for a hit.
+        """
+        self.index_file = index_file
+        self.entries_file = entries_file
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._index: Any = None
+        self._entries: list[tuple[str, Any]] = []
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check whether the optional embedding dependencies are installed.
+
+        Returns:
+            True if sentence-transformers and faiss can be imported.
+        """
+        return all(
+            importlib.util.find_spec(name) is not None
+            for name in ("sentence_transformers", "faiss")
+        )
+
+    def _ensure_loaded(self) -> None:
+        """Load the index and entries from disk, or create an empty index."""
+        if self._index is not None:
+            return
+
+        import faiss
+
+        dimension = _embedding_model().get_sentence_embedding_dimension()
+        if self.index_file.exists() and self.entries_file.exists():
+            self._index = faiss.read_index(str(self.index_file))
+            self._entries = [tuple(entry) for entry in orjson.loads(self.entries_file.read_bytes())]
+            if self._index.d != dimension or self._index.ntotal != len(self._entries):
+                logger.warning("Semantic cache files are inconsistent, starting empty")
+                self._index = None
+
+        if self._index is None:
+            self._index = faiss.IndexFlatIP(dimension)
+            self._entries = []
+
+        logger.info(f"Loaded {len(self._entries)} semantic cache entries")
+
+    def embed(self, text: str) -> "np.ndarray":
+        """Embed text as a normalized row vector.
+
+        Args:
+            text: Text to embed.
+
+        Returns:
+            Float32 array of shape (1, dimension).
+        """
+        return _embedding_model().encode(
+            [text], normalize_embeddings=True, convert_to_numpy=True
+        ).astype("float32")
+
+    def lookup(self, vector: "np.ndarray") -> Any | None:
+        """Find the value cached for the most similar text.
+
+        Args:
+            vector: Embedding from embed().
+
+        Returns:
+            Cached value if its similarity reaches the threshold, else None.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            if self._index.ntotal == 0:
+                return None
+            scores, ids = self._index.search(vector, 1)
+
+        score, idx = float(scores[0][0]), int(ids[0][0])
+        if idx < 0 or score < self.threshold:
+            return None
+
+        logger.debug("Semantic cache hit (similarity %.3f)", score)
+        return self._entries[idx][1]
+
+    def add(self, vector: "np.ndarray", key: str, value: Any) -> None:
+        """Add an entry; call flush() to persist it.
+
+        Args:
+            vector: Embedding from embed().
+            key: Content hash of the embedded text.
+            value: JSON-serializable value.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            self._index.add(vector)
+            self._entries.append((key, value))
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write the index and entries to disk if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+
+            import faiss
+
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            faiss.write_index(self._index, str(self.index_file))
+            self.entries_file.write_bytes(orjson.dumps(self._entries))
+            self._dirty = False
+
+        logger.info(f"Saved {len(self._entries)} semantic cache entries")
@@ -0,0 +1,102 @@
+"""Tests for comment file writing and rerun skipping."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.features.comment_generator import CommentGenerator
+from src.services.llm_cache import ResponseCache
+from src.services.llm_client import DEFAULT_COMMENT_PROMPT, LLMClient, _estimate_tokens
+
+GENERATED_AT = "2025-01-01T00:00:00"
+
+
+def _make_generator() -> CommentGenerator:
+    """Build a generator for file handling only, without the LLM client or persona."""
+    generator = CommentGenerator.__new__(CommentGenerator)
+    generator.num_comments = 3
+    return generator
+
+
+def _post(post_id: str, comments: list[str]) -> dict:
+    """Build a processed post."""
+    return {
+        "post_id": post_id,
+        "content": "Post content",
+        "analysis": {"summary": "Summary", "categories": ["AI"]},
+        "generated_comments": comments,
+    }
+
+
+def test_write_comment_file_finalizes_successful_posts(tmp_path: Path) -> None:
+    """Test that a post whose comments all succeeded is written as .md."""
+    generator = _make_generator()
+
+    path = generator._write_comment_file(_post("1", ["a", "b", "c"]), tmp_path, GENERATED_AT)
+
+    assert path == tmp_path / "post_comments_1.md"
+    assert "### Option 3\n\nc" in path.read_text(encoding="utf-8")
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_write_comment_file_leaves_failures_as_part(tmp_path: Path) -> None:
+    """Test that failed comments are not finalized, so a rerun retries them."""
+    generator = _make_generator()
+    post = _post("1", ["a", "Error: Comment generation failed", "c"])
+
+    path = generator._write_comment_file(post, tmp_path, GENERATED_AT)
+
+    assert path is None
+    assert not (tmp_path / "post_comments_1.md").exists()
+    assert (tmp_path / "post_comments_1.md.part").exists()
+
+
+def test_pending_posts_skips_only_finalized_posts(tmp_path: Path) -> None:
+    """Test that reruns skip posts with a .md file but retry failed ones."""
+    generator = _make_generator()
+    generator._write_comment_file(_post("done", ["a", "b", "c"]), tmp_path, GENERATED_AT)
+    generator._write_comment_file(_post("failed", ["Error: x"] * 3), tmp_path, GENERATED_AT)
+    posts = [_post("done", []), _post("failed", []), _post("new", [])]
+
+    pending = generator._pending_posts(posts, tmp_path)
+
+    assert [post["post_id"] for post in pending] == ["failed", "new"]
+
+
+class ScriptedModel:
+    """Stub generative model that returns queued response texts in order."""
+
+    model_name = "scripted"
+
+    def __init__(self, *responses: str) -> None:
+        """Queue the response texts."""
+        self.responses = list(responses)
+        self.calls = 0
+
+    def generate_content(self, prompt: str, generation_config: dict | None = None):
+        """Return the next queued response."""
+        self.calls += 1
+        return SimpleNamespace(text=self.responses.pop(0))
+
+
+def test_rerun_finalizes_post_left_as_part(tmp_path: Path) -> None:
+    """Test that a failed post is retried against the LLM, not the cache, on rerun."""
+    model = ScriptedModel('["only one"]', '["a", "b", "c"]')
+    client = LLMClient.__new__(LLMClient)
+    client._response_cache = ResponseCache(tmp_path / "responses.sqlite")
+    client.comment_model = model
+    client._comment_template = DEFAULT_COMMENT_PROMPT
+    client._comment_template_tokens = _estimate_tokens(DEFAULT_COMMENT_PROMPT)
+    generator = _make_generator()
+    generator.llm_client = client
+    generator.persona = "Persona"
+    data = {"posts": [_post("1", [])]}
+    output_dir = tmp_path / "out"
+
+    generator.process_posts(data, concurrent=False, output_dir=output_dir)
+    assert (output_dir / "post_comments_1.md.part").exists()
+
+    generator.process_posts(data, concurrent=False, output_dir=output_dir)
+
+    assert "### Option 3\n\nc" in (output_dir / "post_comments_1.md").read_text(encoding="utf-8")
+    assert not (output_dir / "post_comments_1.md.part").exists()
+    assert model.calls == 2
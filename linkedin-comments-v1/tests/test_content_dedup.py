@@ -0,0 +1,53 @@
+"""Tests for content-defined chunking and cross-post dedup."""
+
+from pathlib import Path
+
+from src.services.content_dedup import ContentDedupStore, chunk_lines
+
+SHARED = "".join(
+    f"Shared boilerplate line {i} with enough text to be eligible.\n" for i in range(16)
+)
+
+
+def _post(intro: str) -> str:
+    """Build a post with a distinct opening line followed by shared boilerplate."""
+    return f"{intro} - an opening line long enough to count as an eligible block.\n" + SHARED
+
+
+def test_chunk_lines_preserves_text() -> None:
+    """Test that blocks concatenate back to the original text."""
+    text = _post("Intro") + "short tail\n"
+
+    assert "".join(chunk_lines(text)) == text
+
+
+def test_reduce_elides_blocks_seen_in_other_posts(tmp_path: Path) -> None:
+    """Test that repeated blocks are replaced with markers carrying a snippet."""
+    store = ContentDedupStore(tmp_path / "blocks.sqlite")
+    store.reduce(_post("First"), "a")
+
+    reduced = store.reduce(_post("Second"), "b")
+
+    assert "[repeated from post a: Shared boilerplate line" in reduced
+    assert len(reduced) < len(_post("Second"))
+    assert reduced.startswith("Second - an opening line")
+
+
+def test_reduce_ignores_blocks_from_the_same_post(tmp_path: Path) -> None:
+    """Test that re-analyzing a post does not elide its own blocks."""
+    store = ContentDedupStore(tmp_path / "blocks.sqlite")
+    text = _post("First")
+    store.reduce(text, "a")
+
+    assert store.reduce(text, "a") == text
+
+
+def test_reduce_keeps_text_when_every_eligible_block_was_seen(tmp_path: Path) -> None:
+    """Test that a full repost is left intact despite a short novel tail."""
+    store = ContentDedupStore(tmp_path / "blocks.sqlite")
+    block = chunk_lines(SHARED)[0]
+    store.reduce(block, "a")
+    # The tail starts a new block because the repost ends at a block boundary
+    repost = block + "#tag\n"
+
+    assert store.reduce(repost, "b") == repost
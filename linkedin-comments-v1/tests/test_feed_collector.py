@@ -0,0 +1,26 @@
+"""Tests for feed collector parsing helpers."""
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from src.features.feed_collector import FeedCollector  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("42 reactions", 42),
+        ("1,234", 1234),
+        ("1.2K", 1200),
+        ("3M comments", 3_000_000),
+        ("5k", 5000),
+        ("No reactions", 0),
+        ("", 0),
+    ],
+)
+def test_parse_count(text: str, expected: int) -> None:
+    """Test parsing of displayed engagement counts."""
+    collector = FeedCollector.__new__(FeedCollector)
+
+    assert collector._parse_count(text) == expected
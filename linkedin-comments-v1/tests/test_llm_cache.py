@@ -0,0 +1,50 @@
+"""Tests for the raw LLM response cache."""
+
+from pathlib import Path
+
+from src.services.llm_cache import ResponseCache
+
+
+def test_key_depends_on_model_prompt_and_config() -> None:
+    """Test that any difference in the call's inputs changes the key."""
+    key = ResponseCache.key("model", "prompt", {"a": 1})
+
+    assert key == ResponseCache.key("model", "prompt", {"a": 1})
+    assert key != ResponseCache.key("other", "prompt", {"a": 1})
+    assert key != ResponseCache.key("model", "other", {"a": 1})
+    assert key != ResponseCache.key("model", "prompt", {"a": 2})
+
+
+def test_get_returns_stored_response_across_instances(tmp_path: Path) -> None:
+    """Test that responses persist in SQLite beyond the in-memory LRU."""
+    db_file = tmp_path / "responses.sqlite"
+    ResponseCache(db_file).set("k", "response")
+
+    cache = ResponseCache(db_file)
+
+    assert cache.get("k") == "response"
+    assert cache.get("missing") is None
+
+
+def test_memory_lru_evicts_oldest_entry(tmp_path: Path) -> None:
+    """Test that the in-memory layer is bounded but evicted entries stay on disk."""
+    cache = ResponseCache(tmp_path / "responses.sqlite", memory_size=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert list(cache._memory) == ["a", "c"]
+    assert cache.get("b") == "2"
+
+
+def test_clear_removes_all_responses(tmp_path: Path) -> None:
+    """Test that clear() empties memory and disk."""
+    db_file = tmp_path / "responses.sqlite"
+    cache = ResponseCache(db_file)
+    cache.set("k", "response")
+
+    cache.clear()
+
+    assert cache.get("k") is None
+    assert ResponseCache(db_file).get("k") is None
@@ -0,0 +1,160 @@
+"""Tests for LLM response parsing helpers."""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.services.llm_cache import ResponseCache
+from src.services.llm_client import (
+    _COMMENT_ERROR,
+    DEFAULT_ANALYSIS_PROMPT,
+    DEFAULT_COMMENT_PROMPT,
+    MAX_INPUT_TOKENS,
+    NUM_COMMENTS,
+    LLMClient,
+    _estimate_tokens,
+    _fit_post_content,
+    _JSONStringArrayParser,
+)
+from src.services.rate_limiter import RateLimiter
+
+
+def _client() -> LLMClient:
+    """Build a client for parsing only, without API key or SDK setup."""
+    return LLMClient.__new__(LLMClient)
+
+
+class ScriptedModel:
+    """Stub generative model that returns queued response texts in order."""
+
+    model_name = "scripted"
+
+    def __init__(self, *responses: str) -> None:
+        """Queue the response texts."""
+        self.responses = list(responses)
+        self.calls = 0
+
+    def generate_content(self, prompt: str, generation_config: dict | None = None):
+        """Return the next queued response."""
+        self.calls += 1
+        return SimpleNamespace(text=self.responses.pop(0))
+
+    async def generate_content_async(self, prompt: str, generation_config: dict | None = None):
+        """Async variant of generate_content."""
+        return self.generate_content(prompt, generation_config)
+
+
+def _cached_client(tmp_path: Path, model: ScriptedModel) -> LLMClient:
+    """Build a client whose calls go to a scripted model through a real response cache."""
+    client = _client()
+    client._response_cache = ResponseCache(tmp_path / "responses.sqlite")
+    client._limiter = RateLimiter(rpm=6000, tpm=10_000_000)
+    client.analysis_model = client.comment_model = model
+    client._analysis_template = DEFAULT_ANALYSIS_PROMPT
+    client._analysis_template_tokens = _estimate_tokens(DEFAULT_ANALYSIS_PROMPT)
+    client._comment_template = DEFAULT_COMMENT_PROMPT
+    client._comment_template_tokens = _estimate_tokens(DEFAULT_COMMENT_PROMPT)
+    return client
+
+
+def test_string_array_parser_yields_items_as_they_complete() -> None:
+    """Test that items are emitted once their closing quote arrives, across chunks."""
+    parser = _JSONStringArrayParser()
+
+    assert parser.feed('["fir') == []
+    assert parser.feed('st", "sec') == ["first"]
+    assert parser.feed('ond"]') == ["second"]
+
+
+def test_string_array_parser_decodes_escapes() -> None:
+    """Test that escaped quotes, backslashes and unicode escapes are decoded."""
+    parser = _JSONStringArrayParser()
+
+    items = parser.feed(r'["say \"hi\"", "a\\b", "café"]')
+
+    assert items == ['say "hi"', "a\\b", "café"]
+
+
+def test_string_array_parser_skips_nested_strings() -> None:
+    """Test that strings inside nested values are not emitted as items."""
+    parser = _JSONStringArrayParser()
+
+    assert parser.feed('[{"key": "value"}, ["inner"], "top"]') == ["top"]
+
+
+def test_parse_comments_pads_and_trims() -> None:
+    """Test that responses are normalized to exactly NUM_COMMENTS strings."""
+    client = _client()
+
+    padded = client.parse_comments('["only one"]')
+    trimmed = client.parse_comments('["a", "b", "c", "d", "e"]')
+
+    assert padded == ["only one"] + [_COMMENT_ERROR] * (NUM_COMMENTS - 1)
+    assert trimmed == ["a", "b", "c", "d", "e"][:NUM_COMMENTS]
+
+
+def test_parse_combined_splits_analysis_and_comments() -> None:
+    """Test that a combined response yields the analysis and padded comments."""
+    analysis, comments = _client().parse_combined(
+        '{"summary": "S", "categories": ["AI"], "comments": ["x"]}'
+    )
+
+    assert analysis == {"summary": "S", "categories": ["AI"]}
+    assert comments[0] == "x"
+    assert len(comments) == NUM_COMMENTS
+
+
+def test_fit_post_content_truncates_only_oversize_posts() -> None:
+    """Test that short posts pass through and oversize posts are cut to the budget."""
+    assert _fit_post_content("short post", fixed_tokens=100) == "short post"
+
+    huge = "x" * (MAX_INPUT_TOKENS * 4 + 1000)
+    fitted = _fit_post_content(huge, fixed_tokens=100)
+
+    assert len(fitted) < len(huge)
+    assert len(fitted) // 4 + 100 <= MAX_INPUT_TOKENS
+
+
+def test_run_batch_with_no_prompts_submits_nothing() -> None:
+    """Test that an empty batch returns no bins or responses without starting jobs."""
+    client = _client()
+
+    assert client._bin_prompts({}, 3) == []
+    assert client.run_batch({}, "model") == {}
+
+
+def test_incomplete_comment_responses_are_not_cached(tmp_path: Path) -> None:
+    """Test that short or malformed responses are requested again, and full ones are not."""
+    model = ScriptedModel('["only one"]', '["one", "two", "thr', '["one", "two", "three"]')
+    client = _cached_client(tmp_path, model)
+    args = ("post", "summary", ["AI"], "persona")
+
+    assert client.generate_comments(*args)[1] == _COMMENT_ERROR
+    assert client.generate_comments(*args)[0].startswith("Error")
+    assert client.generate_comments(*args) == ["one", "two", "three"]
+    assert client.generate_comments(*args) == ["one", "two", "three"]
+    assert model.calls == 3
+
+
+def test_unparseable_analysis_is_not_cached(tmp_path: Path) -> None:
+    """Test that an analysis that fails to parse is not replayed from the cache."""
+    model = ScriptedModel('{"summary": "cut o', '{"summary": "Fine", "categories": ["AI"]}')
+    client = _cached_client(tmp_path, model)
+
+    assert client.analyze_post("post")["summary"].startswith("Error")
+    assert client.analyze_post("post")["summary"] == "Fine"
+    assert client.analyze_post("post")["summary"] == "Fine"
+    assert model.calls == 2
+
+
+def test_latency_is_reported_only_for_api_calls(tmp_path: Path) -> None:
+    """Test that cache hits do not feed latency samples to concurrency tuning."""
+    model = ScriptedModel('{"summary": "Fine", "categories": ["AI"]}')
+    client = _cached_client(tmp_path, model)
+    latencies: list[float] = []
+
+    asyncio.run(client.analyze_post_async("post", on_latency=latencies.append))
+    asyncio.run(client.analyze_post_async("post", on_latency=latencies.append))
+
+    assert len(latencies) == 1
+    assert model.calls == 1
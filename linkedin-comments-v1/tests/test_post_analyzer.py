@@ -0,0 +1,159 @@
+"""Tests for post analyzer concurrency."""
+
+import asyncio
+from collections.abc import Callable
+from pathlib import Path
+
+from src.features.post_analyzer import DEFAULT_MAX_CONCURRENCY, PostAnalyzer
+from src.services.content_dedup import ContentDedupStore
+from src.services.llm_cache import LLMCache
+
+SHARED = "".join(
+    f"Shared boilerplate line {i} with enough text to be eligible.\n" for i in range(16)
+)
+
+LLM_DELAY = 0.5
+
+
+class SlowLLMClient:
+    """Stub LLM client whose calls take LLM_DELAY seconds and track concurrency."""
+
+    rpm = 600
+
+    def __init__(self) -> None:
+        """Initialize call counters."""
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    def analyze_post(self, post_content: str) -> dict:
+        """Return a canned analysis immediately."""
+        self.calls += 1
+        return {"summary": f"Summary of {post_content}", "categories": ["Test"]}
+
+    async def analyze_post_async(
+        self, post_content: str, on_latency: Callable[[float], None] | None = None
+    ) -> dict:
+        """Return a canned analysis after a delay, reporting it as the call latency."""
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(LLM_DELAY)
+        if on_latency is not None:
+            on_latency(LLM_DELAY)
+        self.in_flight -= 1
+        return {"summary": f"Summary of {post_content}", "categories": ["Test"]}
+
+
+def _make_analyzer(
+    tmp_path: Path, max_workers: int | None = None, dedup: bool = False
+) -> PostAnalyzer:
+    """Build an analyzer around the stub client without touching the real LLM."""
+    analyzer = PostAnalyzer.__new__(PostAnalyzer)
+    analyzer.llm_client = SlowLLMClient()
+    analyzer.max_workers = max_workers
+    analyzer.cache_enabled = True
+    analyzer.cache = LLMCache(tmp_path / "analysis.json")
+    analyzer.semantic_cache = None
+    analyzer.dedup = ContentDedupStore(tmp_path / "content_blocks.sqlite") if dedup else None
+    return analyzer
+
+
+def _posts(count: int) -> dict:
+    """Build posts data with distinct content."""
+    return {"posts": [{"post_id": str(i), "content": f"post {i}"} for i in range(count)]}
+
+
+def test_analyze_posts_runs_llm_calls_in_parallel(tmp_path: Path) -> None:
+    """Test that slow LLM calls for all posts are in flight at the same time."""
+    analyzer = _make_analyzer(tmp_path)
+    num_posts = 5
+
+    analyzed = analyzer.analyze_posts(_posts(num_posts))
+
+    assert analyzer.llm_client.peak == num_posts
+    assert [post["post_id"] for post in analyzed] == [str(i) for i in range(num_posts)]
+    assert analyzed[3]["analysis"]["summary"] == "Summary of post 3"
+
+
+def test_analyze_posts_respects_max_workers(tmp_path: Path) -> None:
+    """Test that concurrent LLM calls are capped at max_workers."""
+    analyzer = _make_analyzer(tmp_path, max_workers=2)
+
+    analyzer.analyze_posts(_posts(4))
+
+    assert analyzer.llm_client.peak == 2
+
+
+def test_analyze_posts_tunes_concurrency_from_latency(tmp_path: Path) -> None:
+    """Test that concurrency is raised to rpm x latency once calls complete."""
+    analyzer = _make_analyzer(tmp_path)
+    # The stub reports LLM_DELAY per call, so sustaining this rate needs 20 in flight
+    analyzer.llm_client.rpm = 60 * 20 / LLM_DELAY
+
+    analyzer.analyze_posts(_posts(40))
+
+    # The first posts start at the initial limit; later ones run at the tuned limit
+    assert DEFAULT_MAX_CONCURRENCY < analyzer.llm_client.peak <= 20
+
+
+def test_analyze_posts_uses_cache_on_rerun(tmp_path: Path) -> None:
+    """Test that a second run reuses cached analyses instead of calling the LLM."""
+    _make_analyzer(tmp_path).analyze_posts(_posts(3))
+    analyzer = _make_analyzer(tmp_path)
+
+    analyzed = analyzer.analyze_posts(_posts(3))
+
+    assert analyzer.llm_client.calls == 0
+    assert analyzed[0]["analysis"]["summary"] == "Summary of post 0"
+
+
+def test_analyze_posts_skips_cache_when_disabled(tmp_path: Path) -> None:
+    """Test that a run with caching disabled calls the LLM for every post."""
+    _make_analyzer(tmp_path).analyze_posts(_posts(3))
+    analyzer = _make_analyzer(tmp_path)
+    analyzer.cache_enabled = False
+
+    analyzer.analyze_posts(_posts(3))
+
+    assert analyzer.llm_client.calls == 3
+
+
+def test_analyze_posts_batch_handles_posts_without_ids(tmp_path: Path) -> None:
+    """Test that posts sharing a missing ID each get their own analysis."""
+    analyzer = _make_analyzer(tmp_path)
+    posts = {"posts": [{"content": "first"}, {"content": "second"}]}
+
+    analyzed = analyzer.analyze_posts_batch(posts)
+
+    assert [post["analysis"]["summary"] for post in analyzed] == [
+        "Summary of first",
+        "Summary of second",
+    ]
+    assert analyzer.llm_client.calls == 2
+
+
+def test_analyze_posts_sends_full_content_without_dedup(tmp_path: Path) -> None:
+    """Test that repeated blocks reach the LLM unless dedup is enabled."""
+    analyzer = _make_analyzer(tmp_path)
+    posts = {"posts": [{"post_id": "a", "content": SHARED}, {"post_id": "b", "content": SHARED}]}
+
+    analyzed = analyzer.analyze_posts(posts, concurrent=False)
+
+    assert analyzed[1]["analysis"]["summary"] == f"Summary of {SHARED}"
+
+
+def test_dedup_caches_analysis_under_the_reduced_prompt(tmp_path: Path) -> None:
+    """Test that an analysis of an elided prompt is never served for the full post."""
+    analyzer = _make_analyzer(tmp_path, dedup=True)
+    posts = {
+        "posts": [
+            {"post_id": "a", "content": "Opening of post a.\n" + SHARED},
+            {"post_id": "b", "content": "Opening of post b.\n" + SHARED},
+        ]
+    }
+
+    analyzed = analyzer.analyze_posts(posts, concurrent=False)
+
+    assert "[repeated from post a:" in analyzed[1]["analysis"]["summary"]
+    assert analyzer.cache.get(LLMCache.key(posts["posts"][1]["content"])) is None
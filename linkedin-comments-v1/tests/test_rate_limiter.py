@@ -0,0 +1,122 @@
+"""Tests for client-side rate limiting and adaptive concurrency."""
+
+import asyncio
+
+import pytest
+
+from src.services import rate_limiter
+from src.services.rate_limiter import AdaptiveConcurrency, TokenBucket
+
+
+class FakeClock:
+    """Monotonic clock that only moves when a test (or a fake sleep) advances it."""
+
+    def __init__(self) -> None:
+        """Start the clock at zero with no recorded sleeps."""
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        """Record a sleep and advance the clock instead of waiting."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace the rate limiter's clock and sleep with a fake clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", fake)
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", fake.sleep)
+    return fake
+
+
+def test_token_bucket_allows_burst_then_waits(clock: FakeClock) -> None:
+    """Test that a full bucket serves a burst and then paces at the refill rate."""
+    bucket = TokenBucket(per_minute=60)
+
+    async def acquire(times: int) -> None:
+        for _ in range(times):
+            await bucket.acquire()
+
+    asyncio.run(acquire(60))
+    assert clock.sleeps == []
+
+    asyncio.run(acquire(1))
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+def test_token_bucket_clamps_oversized_requests(clock: FakeClock) -> None:
+    """Test that a request larger than the bucket waits for a full bucket only."""
+    bucket = TokenBucket(per_minute=60)
+
+    asyncio.run(bucket.acquire(1000))
+
+    assert clock.sleeps == []
+    assert bucket._tokens == pytest.approx(0.0)
+
+
+def test_token_bucket_pause_holds_off_callers(clock: FakeClock) -> None:
+    """Test that pause() makes the next caller wait out the pause."""
+    bucket = TokenBucket(per_minute=60)
+
+    bucket.pause(5)
+    asyncio.run(bucket.acquire())
+
+    assert clock.sleeps == [pytest.approx(6.0)]
+
+
+def _run_slots(limiter: AdaptiveConcurrency, latency: float | None) -> None:
+    """Complete sample_size calls that each hold a slot and report the given latency."""
+
+    async def run() -> None:
+        for _ in range(limiter.sample_size):
+            async with limiter.slot():
+                if latency is not None:
+                    limiter.record(latency)
+
+    asyncio.run(run())
+
+
+def test_adaptive_concurrency_raises_limit_to_sustain_rate() -> None:
+    """Test that the limit becomes rate x latency (Little's law)."""
+    limiter = AdaptiveConcurrency(initial=4, rpm=600)
+
+    _run_slots(limiter, latency=2.0)
+
+    assert limiter.limit == 20
+    assert limiter._sem._value == 20
+
+
+def test_adaptive_concurrency_respects_min_limit() -> None:
+    """Test that a low target is clamped to min_limit and excess slots retire."""
+    limiter = AdaptiveConcurrency(initial=10, rpm=60, min_limit=4)
+
+    _run_slots(limiter, latency=1.0)
+
+    assert limiter.limit == 4
+    # Free slots not yet retired, minus those still to retire, equals the new limit
+    assert limiter._sem._value - limiter._excess == 4
+
+
+def test_adaptive_concurrency_without_rpm_keeps_initial_limit() -> None:
+    """Test that the limit is fixed when no target rate is given."""
+    limiter = AdaptiveConcurrency(initial=7)
+
+    _run_slots(limiter, latency=5.0)
+
+    assert limiter.limit == 7
+
+
+def test_adaptive_concurrency_ignores_unrecorded_slots() -> None:
+    """Test that calls served without a network round-trip (cache hits) do not retune."""
+    limiter = AdaptiveConcurrency(initial=10, rpm=60, min_limit=4)
+
+    _run_slots(limiter, latency=None)
+
+    assert limiter.limit == 10
+    assert limiter._sem._value == 10